@@ -3,4 +3,7 @@
 __version__ = "3.4.0"
 
 from .validator import Validator, Data, Rules, ValidationFunction
-from .rules import Rule
+from .rules import Rule, rule
+from .schema import Schema
+from .result import FieldError, ValidationResult
+from .conditions import when
@@ -0,0 +1,209 @@
+import sys
+from collections import abc
+from numbers import Number
+from typing import Any, Dict, Iterable
+
+# Sequences that are read as a single value instead of by index
+TEXT_TYPES = (str, bytes, bytearray, memoryview)
+
+# Values without fields, of which attributes (like `real`) aren't read
+SCALAR_TYPES = TEXT_TYPES + (Number, type(None))
+
+
+class Adapter:
+    """
+    Reads the fields of values of a specific type. The adapter for a type is
+    chosen once and cached, so looking up a field segment is a dict lookup
+    followed by a direct call.
+
+    Lookups of missing fields raise a `LookupError`, `AttributeError`,
+    `TypeError` or `ValueError`.
+    """
+
+    __slots__ = ()
+
+    def get(self, value: Any, key: str) -> Any:
+        """Returns the value of the key (a single field segment)"""
+        raise NotImplementedError
+
+    def keys(self, value: Any) -> Iterable[str]:
+        """Returns the keys of the value"""
+        raise NotImplementedError
+
+
+class MappingAdapter(Adapter):
+    """Reads dicts and other mappings (like `MappingProxyType`) by key"""
+
+    __slots__ = ()
+
+    def get(self, value: Any, key: str) -> Any:
+        try:
+            return value[key]
+        except KeyError:
+            # Dicts with int keys are read with numeric segments like "m.1"
+            if key.isnumeric():
+                return value[int(key)]
+            raise
+
+    def keys(self, value: Any) -> Iterable[str]:
+        return value.keys()
+
+
+class SequenceAdapter(Adapter):
+    """Reads lists and other sequences (like tuples and arrays) by index"""
+
+    __slots__ = ()
+
+    def get(self, value: Any, key: str) -> Any:
+        if not key.isnumeric():
+            raise KeyError(key)
+
+        return value[int(key)]
+
+    def keys(self, value: Any) -> Iterable[str]:
+        return [str(index) for index in range(len(value))]
+
+
+class AttributeAdapter(Adapter):
+    """
+    Reads objects by attribute: instance attributes, `__slots__` and
+    properties. Methods, class attributes and other callables aren't fields.
+    """
+
+    __slots__ = ()
+
+    def get(self, value: Any, key: str) -> Any:
+        attributes = getattr(value, "__dict__", None)
+        if attributes is not None and key in attributes:
+            attribute = attributes[key]
+        else:
+            # Slots and properties are data descriptors of the class
+            descriptor = getattr(type(value), key, None)
+            if not hasattr(type(descriptor), "__set__"):
+                raise AttributeError(key)
+            attribute = getattr(value, key)
+
+        if callable(attribute):
+            raise AttributeError(key)
+
+        return attribute
+
+    def keys(self, value: Any) -> Iterable[str]:
+        keys = list(getattr(value, "__dict__", ()))
+        for cls in type(value).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in [slots] if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(value, slot):
+                    keys.append(slot)
+
+        return keys
+
+
+class DataclassAdapter(AttributeAdapter):
+    """Reads dataclasses by attribute, with the dataclass fields as keys"""
+
+    __slots__ = ()
+
+    def keys(self, value: Any) -> Iterable[str]:
+        # The dataclasses module has been imported if the value is a dataclass
+        import dataclasses
+
+        return [field.name for field in dataclasses.fields(value)]
+
+
+class NamedTupleAdapter(Adapter):
+    """Reads named tuples by field name or by numeric index"""
+
+    __slots__ = ()
+
+    def get(self, value: Any, key: str) -> Any:
+        if key.isnumeric():
+            return value[int(key)]
+        if key not in value._fields:
+            raise AttributeError(key)
+
+        return getattr(value, key)
+
+    def keys(self, value: Any) -> Iterable[str]:
+        return value._fields
+
+
+class ScalarAdapter(Adapter):
+    """Reads scalars (like strings and numbers), which have no fields"""
+
+    __slots__ = ()
+
+    def get(self, value: Any, key: str) -> Any:
+        raise KeyError(key)
+
+    def keys(self, value: Any) -> Iterable[str]:
+        return []
+
+
+MAPPING = MappingAdapter()
+SEQUENCE = SequenceAdapter()
+ATTRIBUTE = AttributeAdapter()
+DATACLASS = DataclassAdapter()
+NAMED_TUPLE = NamedTupleAdapter()
+SCALAR = ScalarAdapter()
+
+_registered_adapters: Dict[type, Adapter] = {}
+_type_adapters: Dict[type, Adapter] = {dict: MAPPING, list: SEQUENCE}
+
+
+def register_adapter(type_: type, adapter: Adapter):
+    """
+    Registers the adapter for a type and its subclasses. Adapters that are
+    registered take precedence over the built-in adapters.
+    """
+    _registered_adapters[type_] = adapter
+    # Types may have been cached with another adapter
+    _type_adapters.clear()
+    _type_adapters.update({dict: MAPPING, list: SEQUENCE})
+    _type_adapters.update(_registered_adapters)
+
+
+def adapter_for(type_: type) -> Adapter:
+    """Returns the (cached) adapter for values of the type"""
+    adapter = _type_adapters.get(type_)
+
+    if adapter is None:
+        adapter = _choose_adapter(type_)
+        _type_adapters[type_] = adapter
+
+    return adapter
+
+
+def _choose_adapter(type_: type) -> Adapter:
+    for cls in type_.__mro__:
+        if cls in _registered_adapters:
+            return _registered_adapters[cls]
+
+    if issubclass(type_, dict):
+        return MAPPING
+    if issubclass(type_, tuple) and hasattr(type_, "_fields"):
+        return NAMED_TUPLE
+    if issubclass(type_, list):
+        return SEQUENCE
+    if issubclass(type_, abc.Mapping):
+        return MAPPING
+    if _is_scalar(type_):
+        return SCALAR
+    if issubclass(type_, abc.Sequence):
+        return SEQUENCE
+    if hasattr(type_, "__dataclass_fields__"):
+        return DATACLASS
+
+    return ATTRIBUTE
+
+
+def _is_scalar(type_: type) -> bool:
+    if issubclass(type_, SCALAR_TYPES):
+        return True
+
+    # The datetime module has been imported if the value is a date or time
+    datetime = sys.modules.get("datetime")
+
+    return datetime is not None and issubclass(
+        type_, (datetime.date, datetime.time, datetime.timedelta)
+    )
@@ -0,0 +1,63 @@
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+
+class CacheInfo(namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])):
+    """Statistics of a result cache"""
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Bounded cache of rule results that discards the least recently used
+    results first, and keeps statistics of its hits and misses.
+
+    Parameters
+    ----------
+    maxsize : int
+        Max number of results in the cache.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_results")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached result for the key, or None if there is none.
+        Raises a TypeError if the key isn't hashable.
+        """
+        result = self._results.get(key)
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._results.move_to_end(key)
+
+        return result
+
+    def put(self, key: Hashable, result: Any):
+        self._results[key] = result
+
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def clear(self):
+        self.hits = 0
+        self.misses = 0
+        self._results.clear()
@@ -0,0 +1,313 @@
+"""
+Command line interface, which validates the records of data files and writes
+the errors as JSON Lines:
+
+    python -m spotlight rules.json users.jsonl --workers 4 --output errors.jsonl
+"""
+
+import argparse
+import csv
+import json
+import os
+import pickle
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from . import config
+from .exceptions import InvalidDataError
+from .loader import load_schema, load_schemas
+from .schema import Schema
+from .validator import Validator
+
+DATA_FORMATS = (".json", ".jsonl", ".ndjson", ".csv")
+
+Error = Tuple[str, str, str]
+
+
+class DataFileError(Exception):
+    def __init__(self, path: str, position: int, message: str):
+        super().__init__(f"{path}:{position}: {message}")
+
+
+class InvalidRecordError(Exception):
+    """A record that can't be validated, as reported by a worker"""
+
+
+class Report:
+    """Counts the records and errors of a run"""
+
+    def __init__(self):
+        self.records = 0
+        self.errors = 0
+        self.rules = Counter()
+        self.fields = Counter()
+        self.start = time.perf_counter()
+
+    def add(self, errors: List[Error]):
+        self.records += 1
+        self.errors += len(errors)
+        for field, rule, _ in errors:
+            self.rules[rule] += 1
+            self.fields[self.pattern(field)] += 1
+
+    @staticmethod
+    def pattern(field: str) -> str:
+        """Replaces list indexes with a wildcard, like "items.1.id" to "items.*.id" """
+        return config.FIELD_DELIMITER.join(
+            "*" if part.isdigit() else part
+            for part in field.split(config.FIELD_DELIMITER)
+        )
+
+    def write(self, file: TextIO, limit: int = 20):
+        elapsed = time.perf_counter() - self.start
+        throughput = self.records / elapsed if elapsed else 0.0
+
+        file.write(
+            f"Validated {self.records} records in {elapsed:.2f}s "
+            f"({throughput:.0f} records/s)\n"
+        )
+        file.write(f"Errors: {self.errors}\n")
+        for title, counts in (("rule", self.rules), ("field", self.fields)):
+            if counts:
+                file.write(f"Errors per {title}:\n")
+                for name, count in counts.most_common(limit):
+                    file.write(f"  {name}: {count}\n")
+                if len(counts) > limit:
+                    file.write(f"  ... and {len(counts) - limit} more\n")
+
+        memory = peak_memory()
+        if memory is not None:
+            file.write(f"Peak memory: {memory / 2 ** 20:.1f} MiB\n")
+
+
+def peak_memory() -> Optional[int]:
+    """Returns the peak memory of this process and its workers in bytes"""
+    try:
+        import resource
+    except ImportError:
+        # The resource module isn't available on Windows
+        return None
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+
+    # The peak is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def read_records(path: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Yields the position and the record of a data file. The position is the
+    number of the record in the file, starting at 1, for all formats. Errors
+    that concern the whole file have position 0.
+    """
+    return enumerate(_read_records(path), 1)
+
+
+def _read_records(path: str) -> Iterator[Any]:
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as file:
+            position = 0
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                position += 1
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise DataFileError(
+                        path, position, f"invalid JSON on line {line_number}: {e}"
+                    )
+    elif extension == ".csv":
+        with open(path, encoding="utf-8", newline="") as file:
+            yield from csv.DictReader(file)
+    elif extension == ".json":
+        with open(path, encoding="utf-8") as file:
+            try:
+                content = json.load(file)
+            except ValueError as e:
+                raise DataFileError(path, 0, f"invalid JSON: {e}")
+
+        yield from content if isinstance(content, list) else [content]
+    else:
+        raise DataFileError(path, 0, f"expected one of {DATA_FORMATS}")
+
+
+def validate_records(
+    validator: Validator, schema: Schema, records: Iterable[Any]
+) -> Iterator[List[Error]]:
+    for record in records:
+        yield [tuple(error) for error in validator.iter_errors(record, schema)]
+
+
+# The validator and schema of a worker, with the pickle they were loaded from
+_worker = (None, None)
+
+
+def _validate_chunk(
+    state: bytes, records: List[Any]
+) -> Tuple[List[List[Error]], Optional[str]]:
+    global _worker
+
+    # The pickle is sent with each chunk (pools have no initializer on Python
+    # 3.6), but it is only loaded once per worker
+    if _worker[0] != state:
+        _worker = (state, pickle.loads(state))
+
+    validator, schema = _worker[1]
+
+    # The errors of the records before an invalid record are returned with its
+    # message, so the error is reported for the right record
+    results = []
+    try:
+        for errors in validate_records(validator, schema, records):
+            results.append(errors)
+    except InvalidDataError as e:
+        return results, str(e)
+
+    return results, None
+
+
+def validate_parallel(
+    pool: ProcessPoolExecutor,
+    validator: Validator,
+    schema: Schema,
+    records: Iterable[Any],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[List[Error]]:
+    """
+    Validates chunks of records in a process pool and yields the errors in the
+    order of the records. Only a few chunks per worker are read ahead, so the
+    records are never all in memory.
+    """
+    state = pickle.dumps((validator, schema), protocol=pickle.HIGHEST_PROTOCOL)
+    records = iter(records)
+    pending = deque()
+
+    while True:
+        while len(pending) < workers * 2:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            pending.append(pool.submit(_validate_chunk, state, chunk))
+
+        if not pending:
+            return
+
+        results, message = pending.popleft().result()
+        yield from results
+        if message is not None:
+            raise InvalidRecordError(message)
+
+
+def write_errors(output: TextIO, path: str, position: int, errors: List[Error]):
+    for field, rule, message in errors:
+        error = dict(
+            file=path, record=position, field=field, rule=rule, message=message
+        )
+        output.write(json.dumps(error) + "\n")
+
+
+def parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m spotlight",
+        description=(
+            "Validate the records of JSON, JSON Lines and CSV files, and write "
+            "the errors as JSON Lines."
+        ),
+    )
+    parser.add_argument("rules", help="JSON or TOML file with the rules")
+    parser.add_argument("data", nargs="+", help="JSON, JSON Lines or CSV files")
+    parser.add_argument(
+        "--schema", help="name of the rules in a rules file with multiple schemas"
+    )
+    parser.add_argument(
+        "-o", "--output", help="file to write the errors to (default: stdout)"
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=0, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="number of records sent to a worker at once",
+    )
+    parser.add_argument("--cache-dir", help="directory to cache the parsed rules in")
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command line interface. Returns 0 when all records are valid, 1
+    when there are errors and 2 when a file can't be read.
+    """
+    args = parse_args(argv)
+
+    try:
+        if args.schema is None:
+            schema = load_schema(args.rules, cache_dir=args.cache_dir)
+        else:
+            schemas = load_schemas(args.rules, cache_dir=args.cache_dir)
+    except Exception as e:
+        sys.stderr.write(f"error: {args.rules}: {e}\n")
+        return 2
+
+    if args.schema is not None:
+        if args.schema not in schemas:
+            sys.stderr.write(f"error: the schema '{args.schema}' does not exist\n")
+            return 2
+        schema = schemas[args.schema]
+
+    validator = Validator()
+    report = Report()
+    output = sys.stdout if args.output is None else open(args.output, "w")
+    pool = None
+    if args.workers > 0:
+        pool = ProcessPoolExecutor(args.workers)
+
+    try:
+        for path in args.data:
+            positions = deque()
+
+            def records():
+                for position, record in read_records(path):
+                    positions.append(position)
+                    yield record
+
+            if pool is not None:
+                results = validate_parallel(
+                    pool, validator, schema, records(), args.workers, args.chunk_size
+                )
+            else:
+                results = validate_records(validator, schema, records())
+
+            try:
+                for errors in results:
+                    position = positions.popleft()
+                    report.add(errors)
+                    write_errors(output, path, position, errors)
+            except (InvalidDataError, InvalidRecordError) as e:
+                raise DataFileError(path, positions[0], str(e))
+    except (DataFileError, OSError) as e:
+        sys.stderr.write(f"error: {e}\n")
+        return 2
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if output is not sys.stdout:
+            output.close()
+
+    report.write(sys.stderr)
+
+    return 1 if report.errors else 0
@@ -0,0 +1,219 @@
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from . import rules as rls
+from .conditions import RuleGroup
+from .exceptions import RuleNotFoundError, InvalidRulesError
+from .parameters import PrefixParameters, SuffixParameters
+from .schema import parse_rules
+from .utils import get_field_value, empty
+
+INDENT = "    "
+
+
+class _Compiler:
+    """
+    Generates the source of a validation function for a rules dict.
+
+    Fields without wildcards get a block of code with a direct value lookup
+    and, for the default rules, inlined checks with preparsed constants.
+    Other rules are called through `passes()` and fields with wildcards fall
+    back to the validator. Errors are created by the validator in both cases,
+    so they are identical to `validate()`.
+    """
+
+    def __init__(self, validator, rules: dict):
+        self.validator = validator
+        self.rules = rules
+        self.lines = []
+        self.namespace = {
+            "_v": validator,
+            "_rules": rules,
+            "_get": get_field_value,
+            "_empty": empty,
+        }
+
+    def constant(self, value: Any) -> str:
+        name = f"_k{len(self.namespace)}"
+        self.namespace[name] = value
+
+        return name
+
+    def emit(self, line: str, level: int = 1):
+        self.lines.append(INDENT * level + line)
+
+    def compile(self) -> Callable[..., Union[dict, list]]:
+        if not isinstance(self.rules, dict):
+            raise InvalidRulesError(type(self.rules))
+
+        self.emit("def validate(data, flat=False):", 0)
+        self.emit("_v.data = data")
+        self.emit("_v.rules = _rules")
+        self.emit("_v.output = {}")
+        self.emit("_v.decoded = {}")
+        self.emit("_v._reset_lookups()")
+        self.emit("_v._validate_data_type()")
+        self.emit("data = _v.data")
+        self.emit("is_dict = data.__class__ is dict")
+
+        for field, field_rules in self.rules.items():
+            self.emit(f"# {field}")
+            if isinstance(field_rules, RuleGroup):
+                group = self.constant(field_rules.parsed())
+                self.emit(f"_v._validate_group({field!r}, {group})")
+                continue
+
+            parsed_rules = parse_rules(field_rules)
+            validator = self.validator
+            if validator._contains_wildcard(field) or validator._is_key_field(field):
+                self.emit(
+                    f"_v._validate_field({field!r}, {self.constant(parsed_rules)}, True)"
+                )
+            else:
+                self._compile_field(field, parsed_rules)
+
+        self.emit("return _v._result(flat)")
+
+        source = "\n".join(self.lines) + "\n"
+        exec(compile(source, "<spotlight>", "exec"), self.namespace)
+        function = self.namespace["validate"]
+        function.source = source
+
+        return function
+
+    def _compile_field(self, field: str, parsed_rules: List[Any]):
+        resolved = self.validator._order_rules(
+            [self._resolve(rule) for rule in parsed_rules]
+        )
+        stops = any(rule.stop for rule, _ in resolved)
+        level = 1
+
+        # A wildcard field validated before this one leaves its pattern set
+        self.emit("_v._pattern = None")
+        if self.validator.config.FIELD_DELIMITER in field or field.isnumeric():
+            self.emit(f"value = _get(data, {field!r})")
+        else:
+            self.emit(
+                f"value = data.get({field!r}) if is_dict else _get(data, {field!r})"
+            )
+
+        # A loop makes it possible to break out when a stop rule fails
+        if stops:
+            self.emit("while True:")
+            level = 2
+
+        for rule, parameters in resolved:
+            self._compile_rule(field, rule, parameters, level)
+
+        if stops:
+            self.emit("break", level)
+
+    def _resolve(self, rule: Any):
+        if isinstance(rule, Callable):
+            return rls._FunctionRule(rule), []
+
+        rule_name, parameters = rule
+        if not self.validator._rule_exists(rule_name):
+            raise RuleNotFoundError(rule_name)
+
+        rule = self.validator._available_rules[rule_name]
+
+        return rule, rule.parse_parameters(parameters)
+
+    def _compile_rule(self, field: str, rule: rls.Rule, parameters: Any, level: int):
+        check = self._inline_check(rule, parameters)
+        if check is None:
+            # Inlined checks are cheaper than a cache lookup
+            rule = self.validator._cached_rule(rule, parameters)
+
+        name = self.constant(rule)
+        params = self.constant(parameters)
+        validatable = "" if rule.implicit else "value is not None and "
+
+        if check is None:
+            self.emit(
+                f"if {validatable}not {name}.passes({field!r}, value, {params}, _v):",
+                level,
+            )
+        else:
+            self.emit(f"if {validatable}not ({check}):", level)
+
+        self.emit(f"_v._add_error({name}, {field!r}, value, {params})", level + 1)
+
+        if rule.stop:
+            self.emit("break", level + 1)
+
+    def _inline_check(self, rule: rls.Rule, parameters: Any) -> Optional[str]:
+        # Only inline the default rules, not rules that override them
+        inline = _INLINE_CHECKS.get(type(rule))
+
+        if inline is None or not isinstance(parameters, list):
+            return None
+
+        try:
+            return inline(self, parameters)
+        except (TypeError, ValueError, IndexError, re.error):
+            # Leave unusual parameters to the rule itself
+            return None
+
+
+def _pattern_check(compiler: _Compiler, pattern) -> str:
+    pattern = compiler.constant(pattern)
+
+    return f"isinstance(value, str) and {pattern}.fullmatch(value) is not None"
+
+
+_INLINE_CHECKS: Dict[type, Callable[[_Compiler, List[Any]], str]] = {
+    rls.RequiredRule: lambda c, p: "not _empty(value)",
+    rls.StringRule: lambda c, p: "isinstance(value, str)",
+    rls.IntegerRule: lambda c, p: "isinstance(value, int)",
+    rls.FloatRule: lambda c, p: "isinstance(value, float)",
+    rls.BooleanRule: lambda c, p: "isinstance(value, bool)",
+    rls.DecimalRule: lambda c, p: f"{c.constant(rls.DecimalRule.valid_decimal)}(value)",
+    rls.ListRule: lambda c, p: f"{c.constant(rls.ListRule.valid_list)}(value)",
+    rls.DictRule: lambda c, p: f"{c.constant(rls.DictRule.valid_dict)}(value)",
+    rls.InRule: lambda c, p: f"str(value) in {c.constant(frozenset(p))}",
+    rls.AcceptedRule: lambda c, p: f"value in {c.constant(['yes', 'on', 1, True])}",
+    rls.EmailRule: lambda c, p: _pattern_check(c, rls.EmailRule._regex.compiled),
+    rls.UrlRule: lambda c, p: _pattern_check(c, rls.UrlRule._regex.compiled),
+    rls.AlphaNumRule: lambda c, p: _pattern_check(c, rls.AlphaNumRule._regex.compiled),
+    rls.AlphaNumSpaceRule: lambda c, p: _pattern_check(
+        c, rls.AlphaNumSpaceRule._regex.compiled
+    ),
+    rls.RegexRule: lambda c, p: _pattern_check(c, re.compile(p[0])),
+    rls.StartsWithRule: lambda c, p: (
+        f"{c.constant(PrefixParameters.of(p))}.matches(str(value))"
+    ),
+    rls.EndsWithRule: lambda c, p: (
+        f"{c.constant(SuffixParameters.of(p))}.matches(str(value))"
+    ),
+}
+
+
+class CompiledRules:
+    """
+    Validation function compiled from rules, see `Validator.compile()`. It is
+    pickled as its validator and rules, and compiled again when it's loaded.
+    """
+
+    __slots__ = ("validator", "rules", "function", "source")
+
+    def __init__(self, validator, rules: dict):
+        self.validator = validator
+        self.rules = rules
+        self.function = _Compiler(validator, rules).compile()
+        self.source = self.function.source
+
+    def __call__(self, data: Any, flat: bool = False) -> Union[dict, list]:
+        return self.function(data, flat)
+
+    def __reduce__(self) -> tuple:
+        return compile_rules, (self.validator, self.rules)
+
+
+def compile_rules(validator, rules: dict) -> CompiledRules:
+    """
+    Compiles rules into a validation function for the given validator. See
+    `Validator.compile()`.
+    """
+    return CompiledRules(validator, rules)
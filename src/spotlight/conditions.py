@@ -0,0 +1,78 @@
+from typing import Any
+from weakref import WeakValueDictionary
+
+
+class Condition:
+    """
+    Condition that holds when the value of a field equals the given value,
+    when both are converted to strings.
+
+    Conditions are interned: rules with the same condition (like
+    `required_if:country,US` and `prohibited_unless:country,US`) share one
+    condition object, which the validator evaluates once per validation.
+    Use `Condition.of()` to get a condition.
+    """
+
+    __slots__ = ("field", "value", "__weakref__")
+
+    _interned = WeakValueDictionary()
+
+    def __init__(self, field: str, value: str):
+        self.field = field
+        self.value = value
+
+    @classmethod
+    def of(cls, field: str, value: Any) -> "Condition":
+        """Returns the interned condition for the field and value"""
+        key = (field, str(value))
+        condition = cls._interned.get(key)
+
+        if condition is None:
+            condition = cls._interned.setdefault(key, cls(*key))
+
+        return condition
+
+    def __reduce__(self) -> tuple:
+        # Loaded conditions are interned as well
+        return Condition.of, (self.field, self.value)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.field!r}, {self.value!r})"
+
+
+class RuleGroup:
+    """
+    Group of field rules that are only validated when a condition holds.
+    The fields in the group are nested under the field the group is added
+    to. Create a group with `when()`.
+    """
+
+    __slots__ = ("condition", "rules")
+
+    def __init__(self, condition: Condition, rules: dict):
+        self.condition = condition
+        self.rules = rules
+
+    def parsed(self) -> "RuleGroup":
+        """Returns the group with its rules parsed into a schema"""
+        from .schema import Schema
+
+        if isinstance(self.rules, Schema):
+            return self
+
+        return RuleGroup(self.condition, Schema(self.rules))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.condition!r}, {self.rules!r})"
+
+
+def when(field: str, value: Any, rules: dict) -> RuleGroup:
+    """
+    Returns a group of rules that is only validated when the value of the
+    field equals the given value (compared as strings). When it doesn't, all
+    rules of the group are skipped, including the expansion of wildcards.
+
+    For example, `{"shipping": when("type", "ship", {"address": "required"})}`
+    only validates `shipping.address` if the `type` field is "ship".
+    """
+    return RuleGroup(Condition.of(field, value), rules)
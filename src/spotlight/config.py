@@ -2,6 +2,10 @@ DEFAULT_DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 FIELD_DELIMITER = "."
 FIELD_KEY = "field"
 FIELD_WILD_CARD = "*"
+FIELD_KEY_WILD_CARD = "{key}"
 RULE_DELIMITER = "|"
 RULE_PARAM_DELIMITER = ":"
 RULE_PARAMS_DELIMITER = ","
+
+# Version of the pickled form of schemas and validators
+PICKLE_VERSION = 1
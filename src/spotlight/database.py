@@ -0,0 +1,328 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Any, Callable, Iterable, Iterator, List, Set, Tuple
+
+from . import errors, config
+from .rules import Rule
+from .validator import Validator
+
+# Types of values that are looked up in a database
+LOOKUP_TYPES = (str, int, float, bytes)
+
+
+class DatabaseBackend:
+    """
+    Looks up values in a database for the `exists` and `unique` rules.
+    Backends receive all values of a batch at once, so they can look them up
+    with a single query.
+    """
+
+    def existing(self, table: str, column: str, values: List[Any]) -> Set[Any]:
+        """Returns the given values that exist in the column of the table"""
+        raise NotImplementedError
+
+    def close(self):
+        """Closes the connections of the backend"""
+
+
+class ConnectionPool:
+    """
+    Pool of database connections that can be used by multiple threads. The
+    connections are created when they are first needed, up to `size`
+    connections; when all of them are in use, threads wait for one to be
+    released.
+
+    Parameters
+    ----------
+    connect : callable
+        Function that creates a new connection.
+    size : int, optional
+        Max number of connections.
+    """
+
+    def __init__(self, connect: Callable[[], Any], size: int = 4):
+        self.size = size
+        self._connect = connect
+        self._idle = LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Returns a connection from the pool, which is released afterwards"""
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def _acquire(self) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+
+        if not create:
+            return self._idle.get()
+
+        try:
+            return self._connect()
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def close(self):
+        """Closes the connections that aren't in use"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                return
+
+            with self._lock:
+                self._created -= 1
+            connection.close()
+
+
+class SQLiteBackend(DatabaseBackend):
+    """
+    Backend for SQLite databases, using the `sqlite3` module of the standard
+    library.
+
+    Parameters
+    ----------
+    database : str
+        Path of the database file.
+    pool_size : int, optional
+        Max number of connections.
+    **kwargs
+        Other arguments of `sqlite3.connect()`.
+    """
+
+    # SQLite limits the number of variables in a query
+    MAX_VARIABLES = 500
+
+    def __init__(self, database: str, pool_size: int = 4, **kwargs):
+        kwargs.setdefault("check_same_thread", False)
+        self.database = database
+        self.pool_size = pool_size
+        self.kwargs = kwargs
+        self.pool = ConnectionPool(
+            lambda: sqlite3.connect(database, **kwargs), pool_size
+        )
+
+    def __getstate__(self) -> dict:
+        # Connections can't be pickled, so a loaded backend has a new pool
+        return dict(database=self.database, pool_size=self.pool_size, **self.kwargs)
+
+    def __setstate__(self, state: dict):
+        SQLiteBackend.__init__(self, **state)
+
+    def existing(self, table: str, column: str, values: List[Any]) -> Set[Any]:
+        table, column = quote_identifier(table), quote_identifier(column)
+        query = f"SELECT DISTINCT {column} FROM {table} WHERE {column} IN "
+        found = set()
+
+        with self.pool.connection() as connection:
+            for start in range(0, len(values), self.MAX_VARIABLES):
+                chunk = values[start : start + self.MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(f"{query}({placeholders})", chunk)
+                found.update(str(row[0]) for row in rows)
+
+        # The column may store the values as another type, like "5" as 5
+        return {value for value in values if str(value) in found}
+
+    def close(self):
+        self.pool.close()
+
+
+def quote_identifier(name: str) -> str:
+    """Quotes a (schema qualified) table or column name"""
+    return ".".join('"' + part.replace('"', '""') + '"' for part in name.split("."))
+
+
+class ExistenceCache:
+    """
+    Cache of values that were found in the database, which expire after `ttl`
+    seconds. Values that weren't found are never cached, so new rows are
+    picked up immediately.
+
+    Parameters
+    ----------
+    ttl : float
+        Number of seconds a value is cached.
+    maxsize : int, optional
+        Max number of cached values. The oldest values are discarded first.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._expiry = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # A loaded cache starts empty
+        return dict(ttl=self.ttl, maxsize=self.maxsize)
+
+    def __setstate__(self, state: dict):
+        ExistenceCache.__init__(self, **state)
+
+    def contains(self, key: Tuple[str, str, Any]) -> bool:
+        with self._lock:
+            expiry = self._expiry.get(key)
+            if expiry is None:
+                return False
+            if expiry < time.monotonic():
+                del self._expiry[key]
+                return False
+
+        return True
+
+    def add(self, keys: Iterable[Tuple[str, str, Any]]):
+        expiry = time.monotonic() + self.ttl
+
+        with self._lock:
+            for key in keys:
+                # Keys are kept in the order in which they expire
+                self._expiry.pop(key, None)
+                self._expiry[key] = expiry
+
+            while len(self._expiry) > self.maxsize:
+                self._expiry.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._expiry.clear()
+
+
+class DatabasePlugin(Validator.Plugin):
+    """
+    Adds the `exists` and `unique` rules, which look up values in a database.
+
+    Both rules are bulk rules: the values of all fields that match a wildcard
+    field (and of all records in `Validator.validate_many()`) are looked up
+    with one call of the backend.
+
+    Parameters
+    ----------
+    backend : DatabaseBackend
+        Backend that looks up the values, for example a `SQLiteBackend`.
+    ttl : float, optional
+        Number of seconds values that were found are cached. Caching is
+        disabled by default.
+    cache_size : int, optional
+        Max number of cached values.
+    """
+
+    def __init__(
+        self, backend: DatabaseBackend, ttl: float = None, cache_size: int = 10000
+    ):
+        self.backend = backend
+        self.cache = ExistenceCache(ttl, cache_size) if ttl else None
+
+    def rules(self) -> List[Rule]:
+        return [ExistsRule(self), UniqueRule(self)]
+
+    def existing(self, table: str, column: str, values: Iterable[Any]) -> Set[Any]:
+        """Returns the values that exist, looking up only uncached values"""
+        values = list(dict.fromkeys(v for v in values if isinstance(v, LOOKUP_TYPES)))
+
+        if self.cache is None:
+            return self.backend.existing(table, column, values) if values else set()
+
+        found = {v for v in values if self.cache.contains((table, column, v))}
+        missing = [value for value in values if value not in found]
+        if missing:
+            new = self.backend.existing(table, column, missing)
+            self.cache.add((table, column, value) for value in new)
+            found.update(new)
+
+        return found
+
+
+class _DatabaseRule(Rule, register=False):
+    """
+    Base class of rules that look up values in a database table. The rules
+    are only available to validators with a `DatabasePlugin`.
+    """
+
+    __slots__ = ("plugin",)
+
+    bulk = True
+
+    def __init__(self, plugin: DatabasePlugin):
+        super().__init__()
+        self.plugin = plugin
+
+    def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        return not self.passes_bulk([(field, value)], parameters, validator)
+
+    def passes_bulk(
+        self, items: List[Tuple[str, Any]], parameters: List[str], validator
+    ) -> Iterable[int]:
+        # Without a column parameter, the name of the field is the column
+        columns = {}
+        for field, value in items:
+            column = self.column(field, parameters)
+            columns.setdefault(column, []).append(value)
+
+        found = {
+            column: self.plugin.existing(parameters[0], column, values)
+            for column, values in columns.items()
+        }
+
+        return [
+            index
+            for index, (field, value) in enumerate(items)
+            if not self.valid(value, found[self.column(field, parameters)])
+        ]
+
+    @staticmethod
+    def column(field: str, parameters: List[str]) -> str:
+        if len(parameters) > 1:
+            return parameters[1]
+
+        return field.split(config.FIELD_DELIMITER)[-1]
+
+    def valid(self, value: Any, found: Set[Any]) -> bool:
+        raise NotImplementedError
+
+
+class ExistsRule(_DatabaseRule, register=False):
+    """Exists: the value must exist in the column of the table"""
+
+    __slots__ = ()
+    name = "exists"
+
+    def valid(self, value: Any, found: Set[Any]) -> bool:
+        return isinstance(value, LOOKUP_TYPES) and value in found
+
+    @property
+    def message(self) -> str:
+        return errors.EXISTS_ERROR
+
+
+class UniqueRule(_DatabaseRule, register=False):
+    """Unique: the value must not exist yet in the column of the table"""
+
+    __slots__ = ()
+    name = "unique"
+
+    def valid(self, value: Any, found: Set[Any]) -> bool:
+        return not (isinstance(value, LOOKUP_TYPES) and value in found)
+
+    @property
+    def message(self) -> str:
+        return errors.UNIQUE_ERROR
@@ -0,0 +1,142 @@
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from . import config
+from .conditions import RuleGroup
+
+
+class DependencyGraph:
+    """
+    Creates a graph of the fields in a rules dict and the other fields their
+    rules reference through their parameters, for example the `other` field
+    of `required_if:other,value`.
+
+    The graph is used to find the fields that have to be validated again when
+    some of the fields in the data change.
+
+    Parameters
+    ----------
+    rules : dict
+        Dict with validation rules.
+    validator : Validator
+        Validator that is used to resolve the rules.
+    """
+
+    def __init__(self, rules: dict, validator):
+        self.fields: List[str] = list(rules)
+        self.references: Dict[str, Optional[Set[str]]] = {}
+
+        for field in self.fields:
+            if isinstance(rules[field], RuleGroup):
+                self.references[field] = self._group_references(validator, rules[field])
+            else:
+                self.references[field] = self._field_references(
+                    validator, validator.field_rules(field, rules)
+                )
+
+        self._affected = lru_cache(maxsize=256)(self._affected_fields)
+
+    @classmethod
+    def of(cls, rules: dict, validator) -> "DependencyGraph":
+        """
+        Returns the graph for the rules. Graphs of schemas are cached on the
+        schema, since schemas are not changed after they are created.
+        """
+        from .schema import Schema
+
+        if not isinstance(rules, Schema):
+            return cls(rules, validator)
+
+        registry, graph = getattr(rules, "_dependency_graph", (None, None))
+        if registry is not validator._available_rules:
+            graph = cls(rules, validator)
+            rules._dependency_graph = (validator._available_rules, graph)
+
+        return graph
+
+    @staticmethod
+    def _field_references(validator, field_rules: List) -> Optional[Set[str]]:
+        references = set()
+
+        for rule, parameters in validator.rule_iterator(field_rules):
+            rule_references = rule.references(parameters)
+            # The rule may depend on any field
+            if rule_references is None:
+                return None
+            references.update(str(reference) for reference in rule_references)
+
+        return references
+
+    @classmethod
+    def _group_references(cls, validator, group: RuleGroup) -> Optional[Set[str]]:
+        # A group depends on its condition and on the references of its rules
+        references = {group.condition.field}
+
+        for field, field_rules in group.rules.items():
+            if isinstance(field_rules, RuleGroup):
+                field_references = cls._group_references(validator, field_rules)
+            else:
+                field_references = cls._field_references(
+                    validator, validator.field_rules(field, group.rules)
+                )
+            if field_references is None:
+                return None
+            references.update(field_references)
+
+        return references
+
+    def affected(self, changed: Iterable[str]) -> List[str]:
+        """
+        Returns the fields (in rules order) of which the validation result may
+        change when the given fields change. These are the changed fields
+        themselves, their parents and children, and the fields with rules
+        that reference them.
+        """
+        return self._affected(frozenset(changed))
+
+    def _affected_fields(self, changed: FrozenSet[str]) -> List[str]:
+        return [
+            field
+            for field in self.fields
+            if self.references[field] is None
+            or any(
+                overlaps(path, other)
+                for path in changed
+                for other in self.references[field] | {field}
+            )
+        ]
+
+
+def split_field(field: str) -> List[str]:
+    return field.split(config.FIELD_DELIMITER)
+
+
+def segments_match(segments: List[str], other_segments: List[str]) -> bool:
+    """
+    Checks if the segments match, where a wildcard (or the key wildcard) matches
+    any segment
+    """
+    wild_cards = (config.FIELD_WILD_CARD, config.FIELD_KEY_WILD_CARD)
+
+    return all(
+        segment == other or segment in wild_cards or other in wild_cards
+        for segment, other in zip(segments, other_segments)
+    )
+
+
+def overlaps(field: str, other: str) -> bool:
+    """
+    Checks if two fields refer to (part of) the same value, meaning they are
+    equal or one of them is nested in the other.
+    """
+    return segments_match(split_field(field), split_field(other))
+
+
+def matches(pattern: str, field: str) -> bool:
+    """Checks if the field is matched by the (wildcard) pattern"""
+    pattern_segments = split_field(pattern)
+    field_segments = split_field(field)
+
+    return len(pattern_segments) == len(field_segments) and segments_match(
+        pattern_segments, field_segments
+    )
@@ -11,10 +11,12 @@ DECIMAL_ERROR = "The {field} field must be a decimal."
 DICT_ERROR = "The {field} field must be a dict."
 EMAIL_ERROR = "The {field} field has to be a valid email address."
 ENDS_WITH_ERROR = "The {field} field must end with one of the following values: {values}."
+EXISTS_ERROR = "The selected {field} is invalid."
 FILLED_ERROR = "The {field} field must not be empty when it is present."
 FLOAT_ERROR = "The {field} field must be a float."
 INTEGER_ERROR = "The {field} field must be an integer."
 IN_ERROR = "The {field} field must be one of the following values: {values}."
+IN_FILE_ERROR = "The {field} field must be one of the allowed values."
 IP_ERROR = "The {field} field has to be a valid IP address."
 JSON_ERROR = "The {field} field must be a valid JSON string."
 LIST_ERROR = "The {field} field must be a list."
@@ -39,5 +41,6 @@ REQUIRED_WITH_ERROR = "The {field} field is required if any of the following fie
 SIZE_ERROR = "The {field} field has to have a size of {size}."
 STARTS_WITH_ERROR = "The {field} field must start with one of the following values: {values}."
 STRING_ERROR = "The {field} field must be a string."
+UNIQUE_ERROR = "The {field} has already been taken."
 URL_ERROR = "The {field} field has to be a valid URL."
 UUID4_ERROR = "The {field} field must be a valid UUID."
@@ -1,3 +1,6 @@
+from typing import Any
+
+
 class RuleNotFoundError(Exception):
     def __init__(self, rule: str):
         super().__init__(f"the '{rule}' rule does not exist")
@@ -29,3 +32,12 @@ class AttributeNotImplementedError(Exception):
 
 class FieldValueNotFoundError(Exception):
     pass
+
+
+class IncompatiblePickleError(Exception):
+    def __init__(self, version: Any, expected: int):
+        super().__init__(f"expected pickle version '{expected}' got '{version}'")
+
+
+class SchemaFormatError(Exception):
+    pass
@@ -0,0 +1,133 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any, Dict, Optional
+
+from . import __version__, config
+from .exceptions import IncompatiblePickleError, SchemaFormatError
+from .schema import Schema
+
+FORMATS = (".json", ".toml")
+
+
+def load_schema(path: str, cache_dir: Optional[str] = None) -> Schema:
+    """
+    Loads a schema from a JSON or TOML file with a rules dict, for example
+    `{"email": "required|email", "tags": ["list", "max:5"]}`. TOML files
+    require Python 3.11 or newer.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+    cache_dir : str, optional
+        Directory in which the parsed schema is cached. The cache is keyed by
+        the content of the file and the version of the library, so a changed
+        file is parsed again. Caching is disabled by default.
+
+    Returns
+    -------
+    Schema
+        The schema with the rules of the file.
+    """
+    return _load(path, cache_dir, lambda content: Schema(content))
+
+
+def load_schemas(path: str, cache_dir: Optional[str] = None) -> Dict[str, Schema]:
+    """
+    Loads multiple schemas from a JSON or TOML file with a rules dict per
+    name, for example `{"user": {"email": "required|email"}}`. See
+    `load_schema()` for the parameters.
+
+    Returns
+    -------
+    dict
+        Dict with the schema of each name.
+    """
+    return _load(
+        path,
+        cache_dir,
+        lambda content: {name: Schema(rules) for name, rules in content.items()},
+    )
+
+
+def _load(path: str, cache_dir: Optional[str], create) -> Any:
+    with open(path, "rb") as file:
+        data = file.read()
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = os.path.join(cache_dir, _cache_key(path, data) + ".pickle")
+        cached = _read_cache(cache_path)
+        if cached is not None:
+            return cached
+
+    loaded = create(_decode(path, data))
+
+    if cache_path is not None:
+        _write_cache(cache_path, loaded)
+
+    return loaded
+
+
+def _cache_key(path: str, data: bytes) -> str:
+    digest = hashlib.sha256()
+    digest.update(f"{__version__}:{config.PICKLE_VERSION}:".encode())
+    digest.update(os.path.splitext(path)[1].lower().encode() + b":")
+    digest.update(data)
+
+    return digest.hexdigest()
+
+
+def _decode(path: str, data: bytes) -> dict:
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".json":
+        import json
+
+        content = json.loads(data.decode("utf-8"))
+    elif extension == ".toml":
+        try:
+            import tomllib
+        except ImportError:
+            raise SchemaFormatError("TOML files require Python 3.11 or newer")
+
+        content = tomllib.loads(data.decode("utf-8"))
+    else:
+        raise SchemaFormatError(f"expected one of {FORMATS} got '{extension}'")
+
+    if not isinstance(content, dict):
+        raise SchemaFormatError(f"expected 'dict' got '{type(content)}'")
+
+    return content
+
+
+def _read_cache(cache_path: str) -> Any:
+    try:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, IncompatiblePickleError):
+        # A missing, partial or outdated cache file is replaced
+        return None
+
+
+def _write_cache(cache_path: str, loaded: Any):
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Other processes never see a partially written cache file
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        # The rules are loaded without caching them, like with a read error
+        return
+
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(loaded, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        os.unlink(temporary_path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
@@ -0,0 +1,101 @@
+from typing import Any, List
+
+from .conditions import Condition
+from .utils import affix_matcher
+
+
+class PreparedParameters(list):
+    """
+    Rule parameters with a value that is prepared once, when the rules of a
+    field are resolved (see `Rule.parse_parameters()`). The parameters are
+    still a list, so messages and references read them as usual.
+
+    Rules get the prepared value with `of()`, which also prepares it for
+    parameters that weren't resolved, like parameters passed to a rule
+    directly.
+    """
+
+    __slots__ = ("prepared",)
+
+    def __init__(self, parameters: List[Any]):
+        super().__init__(parameters)
+        self.prepared = self.prepare(parameters)
+
+    @classmethod
+    def prepare(cls, parameters: List[Any]) -> Any:
+        """Returns the value that is prepared from the parameters"""
+        raise NotImplementedError
+
+    @classmethod
+    def expired(cls, prepared: Any) -> bool:
+        """Checks if the prepared value has to be prepared again"""
+        return False
+
+    @classmethod
+    def of(cls, parameters: List[Any]) -> Any:
+        """Returns the prepared value of the parameters"""
+        if not isinstance(parameters, cls):
+            return cls.prepare(parameters)
+
+        if cls.expired(parameters.prepared):
+            parameters.prepared = cls.prepare(parameters)
+
+        return parameters.prepared
+
+
+class ConditionParameters(PreparedParameters):
+    """
+    Parameters of a conditional rule (`other,value`), prepared into their
+    interned condition.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def prepare(cls, parameters: List[Any]) -> Condition:
+        other, value = parameters
+
+        return Condition.of(other, value)
+
+
+class _AffixParameters(PreparedParameters):
+    __slots__ = ()
+
+    suffix = False
+
+    @classmethod
+    def prepare(cls, parameters: List[Any]) -> Any:
+        return affix_matcher(tuple(parameters), cls.suffix)
+
+
+class PrefixParameters(_AffixParameters):
+    """Parameters of the `starts_with` rule, prepared into their matcher"""
+
+    __slots__ = ()
+
+
+class SuffixParameters(_AffixParameters):
+    """Parameters of the `ends_with` rule, prepared into their matcher"""
+
+    __slots__ = ()
+
+    suffix = True
+
+
+class ValueSetParameters(PreparedParameters):
+    """
+    Parameters of the `in_file` rule, prepared into their opened value set.
+    A value set that was closed since is opened again.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def prepare(cls, parameters: List[Any]) -> Any:
+        from .value_sets import SortedFileValueSet
+
+        return SortedFileValueSet.open(parameters[0])
+
+    @classmethod
+    def expired(cls, prepared: Any) -> bool:
+        return prepared.closed
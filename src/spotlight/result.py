@@ -0,0 +1,54 @@
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+class FieldError(NamedTuple):
+    """Error of a single field, as yielded by `Validator.iter_errors()`"""
+
+    field: str
+    rule: str
+    message: str
+
+
+class ValidationResult:
+    """
+    Result of a validation, which serves both the dict and the flat list of
+    errors. The result is truthy when the data is valid.
+
+    Parameters
+    ----------
+    errors : dict
+        Dict of errors, with a list of error messages per field.
+    decoded : dict, optional
+        Decoded values (for example of the json rule) per field.
+    """
+
+    __slots__ = ("errors", "decoded", "_flat")
+
+    def __init__(self, errors: Dict[str, List[str]], decoded: dict = None):
+        self.errors = errors
+        self.decoded = {} if decoded is None else decoded
+        self._flat: Optional[List[str]] = None
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def flat(self) -> List[str]:
+        """List of all error messages, created once when first used"""
+        if self._flat is None:
+            self._flat = [error for errors in self.errors.values() for error in errors]
+
+        return self._flat
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """Yields a (field, message) tuple for each error"""
+        for field, errors in self.errors.items():
+            for error in errors:
+                yield field, error
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(valid={self.valid}, errors={self.errors})"
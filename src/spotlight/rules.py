@@ -1,11 +1,5 @@
-import ipaddress
-import json
 import re
-from datetime import datetime, date
-from decimal import Decimal
-from json import JSONDecodeError
-from typing import Any, Tuple, List, Union
-from uuid import UUID
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Tuple, List, Union, Optional
 from abc import ABC, abstractmethod
 
 from . import errors, config
@@ -13,36 +7,54 @@ from .exceptions import (
     RuleNameAlreadyExistsError,
     AttributeNotImplementedError,
 )
+from .parameters import (
+    ConditionParameters,
+    PrefixParameters,
+    SuffixParameters,
+    ValueSetParameters,
+)
 from .utils import (
-    missing,
-    equal,
     empty,
     regex_match,
-    missing_or_empty,
-    get_field_value,
     get_comparable_dates,
+    is_decimal,
+    is_date,
+    is_mapping,
+    is_sequence,
+    LazyPattern,
 )
 
+if TYPE_CHECKING:
+    from datetime import datetime, date
+
 
 class Rule(ABC):
+    __slots__ = ("message_fields",)
+
     name = NotImplemented
     implicit = False
     stop = False
+    pure = False
+    cost = 0
+    bulk = False
 
-    subclasses = []
+    subclasses = {}
 
     def __init__(self):
         self.message_fields = {}
 
-    def __init_subclass__(cls, **kwargs):
+    def __init_subclass__(cls, register: bool = True, **kwargs):
         super().__init_subclass__(**kwargs)
 
+        # Rules of plugins are registered per validator, see `Validator.Plugin`
+        if not register:
+            return
         if cls.name is NotImplemented:
             raise AttributeNotImplementedError("name", cls.__name__)
-        if cls.name in [subclass.name for subclass in cls.subclasses]:
+        if cls.name in cls.subclasses:
             raise RuleNameAlreadyExistsError(cls.name)
 
-        cls.subclasses.append(cls)
+        cls.subclasses[cls.name] = cls
 
     @abstractmethod
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
@@ -74,18 +86,78 @@ class Rule(ABC):
     def message(self) -> str:
         raise NotImplementedError
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        """
+        Returns the error message and the message fields for a field that
+        didn't pass the rule.
+
+        By default the `message_fields` that were set in the `passes()` method
+        are used, or only the field if none were set. Rules that don't store
+        any state in `passes()` can safely be shared between validators.
+        """
+        return self.message, self.message_fields or dict(field=field)
+
+    def passes_bulk(
+        self, items: List[Tuple[str, Any]], parameters: List[str], validator
+    ) -> Iterable[int]:
+        """
+        Tests all fields that match a wildcard field at once, for rules with
+        `bulk` set to True. Bulk rules are evaluated after the other rules of a
+        field, and are called once with the (field, value) pairs of all fields
+        that passed those rules.
+
+        By default each pair is tested with `passes()`.
+
+        Returns
+        -------
+        iterable
+            The indexes of the pairs that didn't pass the rule.
+        """
+        return [
+            index
+            for index, (field, value) in enumerate(items)
+            if not self.passes(field, value, parameters, validator)
+        ]
+
+    def bulk_error(
+        self, index: int, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        """
+        Returns the error message and the message fields for the pair at the
+        index of the last `passes_bulk()` call. By default `error()` is used.
+        """
+        return self.error(field, value, parameters, validator)
+
+    def references(self, parameters: List[str]) -> Optional[List[str]]:
+        """
+        Returns the other fields the rule depends on, for the given rule
+        parameters. Rules that depend on other fields should override this
+        method, so they are re-evaluated when one of those fields changes.
+        Returning None means the rule may depend on any field.
+        """
+        return []
+
+    def parse_parameters(self, parameters: Any) -> Any:
+        """
+        Returns the parameters the rule is called with. This is called when
+        the rules of a field are resolved, so rules can prepare their
+        parameters once instead of on every call.
+        """
+        return parameters
+
 
 class RequiredRule(Rule):
     """Required field"""
 
+    __slots__ = ()
     name = "required"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
-        return not missing(validator.data, field) and not empty(value)
+        return not validator.field_missing(field) and not empty(value)
 
     @property
     def message(self) -> str:
@@ -95,17 +167,16 @@ class RequiredRule(Rule):
 class RequiredWithoutRule(Rule):
     """Required if other field is not present"""
 
+    __slots__ = ()
     name = "required_without"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         other_fields = parameters
-        data = validator.data
-        self.message_fields = dict(field=field, other=", ".join(other_fields))
 
-        if missing_or_empty(data, field) and any(
-            [missing_or_empty(data, o) for o in other_fields]
+        if validator.field_empty(field) and any(
+            [validator.field_empty(o) for o in other_fields]
         ):
             return False
 
@@ -115,21 +186,28 @@ class RequiredWithoutRule(Rule):
     def message(self) -> str:
         return errors.REQUIRED_WITHOUT_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, other=", ".join(parameters))
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return list(parameters)
+
 
 class RequiredWithRule(Rule):
     """Required with other field"""
 
+    __slots__ = ()
     name = "required_with"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         other_fields = parameters
-        data = validator.data
-        self.message_fields = dict(field=field, other=", ".join(other_fields))
 
-        if missing_or_empty(data, field) and any(
-            [not missing_or_empty(data, o) for o in other_fields]
+        if validator.field_empty(field) and any(
+            [not validator.field_empty(o) for o in other_fields]
         ):
             return False
 
@@ -139,21 +217,27 @@ class RequiredWithRule(Rule):
     def message(self) -> str:
         return errors.REQUIRED_WITH_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, other=", ".join(parameters))
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return list(parameters)
+
 
 class RequiredIfRule(Rule):
     """Required if other field equals certain value"""
 
+    __slots__ = ()
     name = "required_if"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        other, val = parameters
-        data = validator.data
-        other_val = get_field_value(data=data, field=other)
-        self.message_fields = dict(field=field, other=other, value=val)
+        condition = ConditionParameters.of(parameters)
 
-        if missing_or_empty(data, field) and equal(val, other_val):
+        if validator.field_empty(field) and validator.condition_holds(condition):
             return False
 
         return True
@@ -162,21 +246,32 @@ class RequiredIfRule(Rule):
     def message(self) -> str:
         return errors.REQUIRED_IF_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        other, val = parameters
+
+        return self.message, dict(field=field, other=other, value=val)
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return parameters[:1]
+
+    def parse_parameters(self, parameters: List[str]) -> ConditionParameters:
+        return ConditionParameters(parameters)
+
 
 class RequiredUnlessRule(Rule):
     """Required unless other field equals certain value"""
 
+    __slots__ = ()
     name = "required_unless"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        other, val = parameters
-        data = validator.data
-        other_val = get_field_value(data=data, field=other)
-        self.message_fields = dict(field=field, other=other, value=val)
+        condition = ConditionParameters.of(parameters)
 
-        if missing_or_empty(data, field) and not equal(val, other_val):
+        if validator.field_empty(field) and not validator.condition_holds(condition):
             return False
 
         return True
@@ -185,19 +280,31 @@ class RequiredUnlessRule(Rule):
     def message(self) -> str:
         return errors.REQUIRED_UNLESS_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        other, val = parameters
+
+        return self.message, dict(field=field, other=other, value=val)
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return parameters[:1]
+
+    def parse_parameters(self, parameters: List[str]) -> ConditionParameters:
+        return ConditionParameters(parameters)
+
 
 class NotWithRule(Rule):
     """Not with other field"""
 
+    __slots__ = ()
     name = "not_with"
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         other = parameters[0]
-        data = validator.data
-        self.message_fields = dict(field=field, other=other)
 
-        if not missing(data, field) and not missing(data, other):
+        if not validator.field_missing(field) and not validator.field_missing(other):
             return False
 
         return True
@@ -206,18 +313,25 @@ class NotWithRule(Rule):
     def message(self) -> str:
         return errors.NOT_WITH_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, other=parameters[0])
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return parameters[:1]
+
 
 class FilledRule(Rule):
     """Not empty when present"""
 
+    __slots__ = ()
     name = "filled"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
-        if not missing(validator.data, field) and empty(value):
+        if not validator.field_missing(field) and empty(value):
             return False
 
         return True
@@ -230,14 +344,14 @@ class FilledRule(Rule):
 class EmailRule(Rule):
     """Valid email"""
 
+    __slots__ = ()
     name = "email"
-    _regex = re.compile(
+    pure = True
+    _regex = LazyPattern(
         r"^[a-zA-Z0-9.!#$%&’*+/=?^_`{|}~-]+@[a-zA-Z0-9-]+(?:\.[a-zA-Z0-9-]+)*$"
     )
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_email(value)
 
     @property
@@ -252,8 +366,10 @@ class EmailRule(Rule):
 class UrlRule(Rule):
     """Valid URL"""
 
+    __slots__ = ()
     name = "url"
-    _regex = re.compile(
+    pure = True
+    _regex = LazyPattern(
         r"^(?:http|ftp)s?://"  # http:// or https://
         r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}\.?|[A-Z0-9-]{2,}\.?)|"  # domain...
         r"localhost|"  # localhost...
@@ -264,8 +380,6 @@ class UrlRule(Rule):
     )
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_url(value)
 
     @property
@@ -280,11 +394,11 @@ class UrlRule(Rule):
 class IpRule(Rule):
     """Valid IP"""
 
+    __slots__ = ()
     name = "ip"
+    pure = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_ip(value)
 
     @property
@@ -296,6 +410,8 @@ class IpRule(Rule):
         if not StringRule.valid_string(ip) and not IntegerRule.valid_integer(ip):
             return False
 
+        import ipaddress
+
         try:
             ipaddress.ip_address(ip)
             return True
@@ -306,73 +422,83 @@ class IpRule(Rule):
 class MinRule(Rule):
     """Min length"""
 
+    __slots__ = ()
     name = "min"
 
-    def __init__(self):
-        super().__init__()
-        self.error = None
-
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         min_ = parameters[0]
-        self.message_fields = dict(field=field, min=min_)
-        self.error = errors.MIN_ERROR
         expected = float(min_)
 
         if isinstance(value, str):
-            self.error = errors.MIN_STRING_ERROR
             return len(value) >= expected
-        elif isinstance(value, list) or isinstance(value, dict):
-            self.error = errors.MIN_ITEMS_ERROR
+        elif is_sequence(value) or is_mapping(value):
             return len(value) >= expected
         elif isinstance(value, int):
             return value >= expected
         elif isinstance(value, float):
             return value >= expected
-        elif isinstance(value, Decimal):
-            expected = Decimal(min_)
+        elif is_decimal(value):
+            expected = type(value)(min_)
             return value >= expected
 
         return False
 
     @property
     def message(self) -> str:
-        return self.error
+        return errors.MIN_ERROR
+
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        if isinstance(value, str):
+            message = errors.MIN_STRING_ERROR
+        elif is_sequence(value) or is_mapping(value):
+            message = errors.MIN_ITEMS_ERROR
+        else:
+            message = self.message
+
+        return message, dict(field=field, min=parameters[0])
 
 
 class MaxRule(Rule):
     """Max length"""
 
+    __slots__ = ()
     name = "max"
 
-    def __init__(self):
-        super().__init__()
-        self.error = None
-
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         max_ = parameters[0]
-        self.message_fields = dict(field=field, max=max_)
-        self.error = errors.MAX_ERROR
         expected = float(max_)
 
         if isinstance(value, str):
-            self.error = errors.MAX_STRING_ERROR
             return len(value) <= expected
-        elif isinstance(value, list) or isinstance(value, dict):
-            self.error = errors.MAX_ITEMS_ERROR
+        elif is_sequence(value) or is_mapping(value):
             return len(value) <= expected
         elif isinstance(value, int):
             return value <= expected
         elif isinstance(value, float):
             return value <= expected
-        elif isinstance(value, Decimal):
-            expected = Decimal(max_)
+        elif is_decimal(value):
+            expected = type(value)(max_)
             return value <= expected
 
         return False
 
     @property
     def message(self) -> str:
-        return self.error
+        return errors.MAX_ERROR
+
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        if isinstance(value, str):
+            message = errors.MAX_STRING_ERROR
+        elif is_sequence(value) or is_mapping(value):
+            message = errors.MAX_ITEMS_ERROR
+        else:
+            message = self.message
+
+        return message, dict(field=field, max=parameters[0])
 
 
 class InRule(Rule):
@@ -380,27 +506,50 @@ class InRule(Rule):
     In: The field under validation must be included in the given list of values
     """
 
+    __slots__ = ()
     name = "in"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field, values=parameters)
-
         return str(value) in parameters
 
     @property
     def message(self) -> str:
         return errors.IN_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, values=parameters)
+
+
+class InFileRule(Rule):
+    """
+    In file: The field under validation must be included in the values of the
+    given sorted value file
+    """
+
+    __slots__ = ()
+    name = "in_file"
+
+    def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        return value in ValueSetParameters.of(parameters)
+
+    @property
+    def message(self) -> str:
+        return errors.IN_FILE_ERROR
+
+    def parse_parameters(self, parameters: List[str]) -> ValueSetParameters:
+        return ValueSetParameters(parameters)
+
 
 class AlphaNumRule(Rule):
     """Only letters and numbers"""
 
+    __slots__ = ()
     name = "alpha_num"
-    _regex = re.compile(r"^[a-zA-Z0-9]+$")
+    _regex = LazyPattern(r"^[a-zA-Z0-9]+$")
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_alpha_num(value)
 
     @property
@@ -415,12 +564,11 @@ class AlphaNumRule(Rule):
 class AlphaNumSpaceRule(Rule):
     """Only letters, numbers and spaces"""
 
+    __slots__ = ()
     name = "alpha_num_space"
-    _regex = re.compile(r"^[a-zA-Z0-9 ]+$")
+    _regex = LazyPattern(r"^[a-zA-Z0-9 ]+$")
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_alpha_num_space(value)
 
     @property
@@ -435,11 +583,10 @@ class AlphaNumSpaceRule(Rule):
 class StringRule(Rule):
     """Valid string"""
 
+    __slots__ = ()
     name = "string"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_string(value)
 
     @property
@@ -454,11 +601,10 @@ class StringRule(Rule):
 class IntegerRule(Rule):
     """Valid integer"""
 
+    __slots__ = ()
     name = "integer"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_integer(value)
 
     @property
@@ -473,11 +619,10 @@ class IntegerRule(Rule):
 class FloatRule(Rule):
     """Valid float"""
 
+    __slots__ = ()
     name = "float"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_float(value)
 
     @property
@@ -492,11 +637,10 @@ class FloatRule(Rule):
 class DecimalRule(Rule):
     """Valid decimal"""
 
+    __slots__ = ()
     name = "decimal"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_decimal(value)
 
     @property
@@ -505,17 +649,16 @@ class DecimalRule(Rule):
 
     @staticmethod
     def valid_decimal(value) -> bool:
-        return isinstance(value, Decimal)
+        return is_decimal(value)
 
 
 class BooleanRule(Rule):
     """Valid boolean"""
 
+    __slots__ = ()
     name = "boolean"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_boolean(value)
 
     @property
@@ -530,12 +673,11 @@ class BooleanRule(Rule):
 class ListRule(Rule):
     """Valid list"""
 
+    __slots__ = ()
     name = "list"
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_list(value)
 
     @property
@@ -544,17 +686,17 @@ class ListRule(Rule):
 
     @staticmethod
     def valid_list(value) -> bool:
-        return isinstance(value, list)
+        return is_sequence(value)
 
 
 class Uuid4Rule(Rule):
     """Valid uuid4"""
 
+    __slots__ = ()
     name = "uuid4"
+    pure = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_uuid4(value)
 
     @property
@@ -563,6 +705,8 @@ class Uuid4Rule(Rule):
 
     @staticmethod
     def valid_uuid4(uuid) -> bool:
+        from uuid import UUID
+
         if isinstance(uuid, UUID):
             uuid = str(uuid)
         try:
@@ -576,12 +720,23 @@ class Uuid4Rule(Rule):
 class JsonRule(Rule):
     """Valid json"""
 
+    __slots__ = ()
     name = "json"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
+        valid, decoded = self.decode(value)
+
+        if not valid:
+            return False
 
-        return self.valid_json(value)
+        # Keep the decoded value, so it doesn't have to be parsed again
+        validator.decoded[validator.full_field(field)] = decoded
+
+        # Validate the decoded content against the supplied nested rules
+        if isinstance(parameters, dict):
+            validator.validate_nested(field, decoded, parameters)
+
+        return True
 
     @property
     def message(self) -> str:
@@ -589,22 +744,27 @@ class JsonRule(Rule):
 
     @staticmethod
     def valid_json(value) -> bool:
+        return JsonRule.decode(value)[0]
+
+    @staticmethod
+    def decode(value) -> Tuple[bool, Any]:
+        """Returns whether the value is valid JSON and the decoded value"""
+        import json
+
         try:
-            json.loads(value)
-            return True
-        except (TypeError, JSONDecodeError):
-            return False
+            return True, json.loads(value)
+        except (TypeError, json.JSONDecodeError):
+            return False, None
 
 
 class AcceptedRule(Rule):
     """The field must be yes, on, 1, or true"""
 
+    __slots__ = ()
     name = "accepted"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         accepted_values = ["yes", "on", 1, True]
-        self.message_fields = dict(field=field)
-
         return value in accepted_values
 
     @property
@@ -615,26 +775,37 @@ class AcceptedRule(Rule):
 class StartsWithRule(Rule):
     """The field under validation must start with one of the given values."""
 
+    __slots__ = ()
     name = "starts_with"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field, values=parameters)
-
-        return any([str(value).startswith(rule_val) for rule_val in parameters])
+        return PrefixParameters.of(parameters).matches(str(value))
 
     @property
     def message(self) -> str:
         return errors.STARTS_WITH_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, values=parameters)
+
+    @staticmethod
+    def matched_prefix(value: Any, prefixes: List[str]) -> Optional[str]:
+        """Returns the longest of the given prefixes the value starts with"""
+        return PrefixParameters.of(prefixes).match(str(value))
+
+    def parse_parameters(self, parameters: List[str]) -> PrefixParameters:
+        return PrefixParameters(parameters)
+
 
 class DictRule(Rule):
     """Valid dict"""
 
+    __slots__ = ()
     name = "dict"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
         return self.valid_dict(value)
 
     @property
@@ -643,7 +814,7 @@ class DictRule(Rule):
 
     @staticmethod
     def valid_dict(value) -> bool:
-        return isinstance(value, dict)
+        return is_mapping(value)
 
 
 class DateTimeRule(Rule):
@@ -652,28 +823,37 @@ class DateTimeRule(Rule):
     custom specified format.
     """
 
+    __slots__ = ()
     name = "date_time"
     stop = True
+    pure = True
     default_format = config.DEFAULT_DATE_TIME_FORMAT
 
-    _regex = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
+    _regex = LazyPattern(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$")
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         supplied_format = parameters[0] if parameters else None
-        _date_time_format = supplied_format or DateTimeRule.default_format
-        self.message_fields = dict(field=field, format=_date_time_format)
-
         return self.valid_date_time(value, supplied_format)
 
     @property
     def message(self) -> str:
         return errors.DATE_TIME_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        supplied_format = parameters[0] if parameters else None
+        date_time_format = supplied_format or DateTimeRule.default_format
+
+        return self.message, dict(field=field, format=date_time_format)
+
     @staticmethod
     def valid_date_time(value: Any, date_time_format: str = None) -> bool:
-        if isinstance(value, datetime) or isinstance(value, date):
+        if is_date(value):
             return True
 
+        from datetime import datetime
+
         if not date_time_format and not regex_match(DateTimeRule._regex, value):
             return False
 
@@ -688,6 +868,7 @@ class DateTimeRule(Rule):
 class BeforeRule(Rule):
     """Date/time that must occur before another date/time."""
 
+    __slots__ = ()
     name = "before"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
@@ -697,14 +878,15 @@ class BeforeRule(Rule):
             field, supplied_field_or_format, validator
         )
         before_date, after_date = get_comparable_dates(before_date, after_date)
-        self.message_fields = dict(field=field, other=supplied_field_or_format)
 
         return not after_date or before_date < after_date
 
     @staticmethod
     def date_and_format(
         field: str, field_or_date_time: Any, validator
-    ) -> Tuple[Union[datetime, date, None], str]:
+    ) -> Tuple[Union["datetime", "date", None], str]:
+        from datetime import datetime
+
         after_format = DateTimeRule.default_format
 
         # First try the value as a datetime string with the default format. If
@@ -716,9 +898,9 @@ class BeforeRule(Rule):
             after_format = BeforeRule.date_time_field_format(
                 field_or_date_time, validator
             )
-            value = get_field_value(data=validator.data, field=field_or_date_time or "")
+            value = validator.field_value(field_or_date_time or "")
 
-            if isinstance(value, datetime) or isinstance(value, date):
+            if is_date(value):
                 after_date = value
             else:
                 try:
@@ -737,11 +919,9 @@ class BeforeRule(Rule):
     @staticmethod
     def date_time_field_format(field, validator) -> str:
         date_time_format = None
-        if field in validator.rules:
-            rules = validator.field_rules(field)
-            for rule, parameters in validator.rule_iterator(rules):
-                if rule.name == DateTimeRule.name and parameters:
-                    date_time_format = parameters[0]
+        for rule, parameters in validator.resolved_field_rules(field):
+            if rule.name == DateTimeRule.name and parameters:
+                date_time_format = parameters[0]
 
         return date_time_format or DateTimeRule.default_format
 
@@ -749,10 +929,22 @@ class BeforeRule(Rule):
     def message(self) -> str:
         return errors.BEFORE_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        other = parameters[0] if parameters else None
+
+        return self.message, dict(field=field, other=other)
+
+    def references(self, parameters: List[str]) -> List[str]:
+        # The parameter is either another field or a date/time
+        return parameters[:1]
+
 
 class BeforeOrEqualRule(BeforeRule):
     """Date/time that must be before or equal to another date/time."""
 
+    __slots__ = ()
     name = "before_or_equal"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
@@ -766,7 +958,6 @@ class BeforeOrEqualRule(BeforeRule):
         before_or_equal_date, after_or_equal_date = get_comparable_dates(
             before_or_equal_date, after_or_equal_date
         )
-        self.message_fields = dict(field=field, other=supplied_field_or_format)
 
         return not after_or_equal_date or before_or_equal_date <= after_or_equal_date
 
@@ -778,6 +969,7 @@ class BeforeOrEqualRule(BeforeRule):
 class AfterRule(Rule):
     """Date/time that must occur after another date/time."""
 
+    __slots__ = ()
     name = "after"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
@@ -787,7 +979,6 @@ class AfterRule(Rule):
             field, supplied_field_or_format, validator
         )
         after_date, before_date = get_comparable_dates(after_date, before_date)
-        self.message_fields = dict(field=field, other=supplied_field_or_format)
 
         return not before_date or after_date > before_date
 
@@ -795,10 +986,22 @@ class AfterRule(Rule):
     def message(self) -> str:
         return errors.AFTER_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        other = parameters[0] if parameters else None
+
+        return self.message, dict(field=field, other=other)
+
+    def references(self, parameters: List[str]) -> List[str]:
+        # The parameter is either another field or a date/time
+        return parameters[:1]
+
 
 class AfterOrEqualRule(AfterRule):
     """Date/time that must be after or equal to another date/time."""
 
+    __slots__ = ()
     name = "after_or_equal"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
@@ -812,7 +1015,6 @@ class AfterOrEqualRule(AfterRule):
         after_or_equal_date, before_or_equal_date = get_comparable_dates(
             after_or_equal_date, before_or_equal_date
         )
-        self.message_fields = dict(field=field, other=supplied_field_or_format)
 
         return not before_or_equal_date or after_or_equal_date >= before_or_equal_date
 
@@ -824,23 +1026,23 @@ class AfterOrEqualRule(AfterRule):
 class SizeRule(Rule):
     """Size"""
 
+    __slots__ = ()
     name = "size"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         size = parameters[0]
-        self.message_fields = dict(field=field, size=size)
         expected = float(size)
 
         if isinstance(value, str):
             return len(value) == expected
-        elif isinstance(value, list) or isinstance(value, dict):
+        elif is_sequence(value) or is_mapping(value):
             return len(value) == expected
         elif isinstance(value, int):
             return value == expected
         elif isinstance(value, float):
             return value == expected
-        elif isinstance(value, Decimal):
-            expected = Decimal(size)
+        elif is_decimal(value):
+            expected = type(value)(size)
             return value == expected
 
         return False
@@ -849,31 +1051,48 @@ class SizeRule(Rule):
     def message(self) -> str:
         return errors.SIZE_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, size=parameters[0])
+
 
 class EndsWithRule(Rule):
     """The field under validation must end with one of the given values."""
 
+    __slots__ = ()
     name = "ends_with"
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field, values=parameters)
-
-        return any([str(value).endswith(rule_val) for rule_val in parameters])
+        return SuffixParameters.of(parameters).matches(str(value))
 
     @property
     def message(self) -> str:
         return errors.ENDS_WITH_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, values=parameters)
+
+    @staticmethod
+    def matched_suffix(value: Any, suffixes: List[str]) -> Optional[str]:
+        """Returns the longest of the given suffixes the value ends with"""
+        return SuffixParameters.of(suffixes).match(str(value))
+
+    def parse_parameters(self, parameters: List[str]) -> SuffixParameters:
+        return SuffixParameters(parameters)
+
 
 class RegexRule(Rule):
     """The field under validation must match the regex."""
 
+    __slots__ = ()
     name = "regex"
+    pure = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        regex = parameters[0]
-        self.message_fields = dict(field=field, regex=regex)
-        regex = re.compile(regex)
+        regex = re.compile(parameters[0])
 
         return regex_match(regex, value)
 
@@ -881,48 +1100,189 @@ class RegexRule(Rule):
     def message(self) -> str:
         return errors.REGEX_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, regex=parameters[0])
+
 
 class _FunctionRule(Rule):
     """The field under validation must pass the supplied function."""
 
+    __slots__ = (
+        "_result",
+        "validation_function",
+        "implicit",
+        "stop",
+        "pure",
+        "cost",
+        "bulk",
+        "_messages",
+    )
+
     def __init__(self, validation_function):
         super().__init__()
         self._result = None
         self.validation_function = validation_function
-
-        if hasattr(validation_function, "implicit"):
-            self.implicit = validation_function.implicit
-        if hasattr(validation_function, "stop"):
-            self.stop = validation_function.stop
+        self.implicit = getattr(validation_function, "implicit", Rule.implicit)
+        self.stop = getattr(validation_function, "stop", Rule.stop)
+        self.pure = getattr(validation_function, "pure", Rule.pure)
+        self.cost = getattr(validation_function, "cost", Rule.cost)
+        # Bulk functions are called differently, so only an explicit flag counts
+        self.bulk = getattr(validation_function, "bulk", Rule.bulk) is True
+        self._messages = {}
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        if self.bulk:
+            failed = self.passes_bulk([(field, value)], parameters, validator)
+            self._result = self._messages.get(0)
+
+            return not failed
+
         self._result = self.validation_function(
             field=field, value=value, validator=validator
         )
-        self.message_fields = dict(field=field)
 
         return self._result is None
 
+    def passes_bulk(
+        self, items: List[Tuple[str, Any]], parameters: List[str], validator
+    ) -> Iterable[int]:
+        # Bulk functions return the messages of the failed items by index
+        messages = self.validation_function(items=items, validator=validator) or {}
+        self._messages = dict(messages)
+
+        return list(messages)
+
     @property
     def message(self) -> str:
         return self._result
 
+    def bulk_error(
+        self, index: int, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        # Items of several records (see `Validator.validate_many()`) can have
+        # the same field and value, so the messages are kept by index
+        self._result = self._messages.get(index)
+
+        return self.error(field, value, parameters, validator)
+
+    def __eq__(self, other: Any) -> bool:
+        # Rules for the same function share their cached results
+        if isinstance(other, _FunctionRule):
+            return self.validation_function == other.validation_function
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.validation_function)
+
     @property
     def name(self):
         return self.__class__.__name__
 
+    def references(self, parameters: List[str]) -> Optional[List[str]]:
+        return getattr(self.validation_function, "references", None)
+
+
+class _CachedRule(Rule):
+    """
+    Pure rule of which the results are cached per value, see `Rule.pure`.
+    Values that aren't hashable are passed to the rule itself.
+    """
+
+    __slots__ = ("rule", "parameters", "cache", "implicit", "stop", "function")
+
+    def __init__(self, rule: Rule, parameters: Tuple[Any, ...], cache):
+        super().__init__()
+        self.rule = rule
+        self.parameters = parameters
+        self.cache = cache
+        self.implicit = rule.implicit
+        self.stop = rule.stop
+        self.function = isinstance(rule, _FunctionRule)
+
+    def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        # The type is part of the key, because values like 1 and True are equal
+        key = (self.rule, self.parameters, value.__class__, value)
+        try:
+            result = self.cache.get(key)
+        except TypeError:
+            return self.rule.passes(field, value, parameters, validator)
+
+        if result is None:
+            passed = self.rule.passes(field, value, parameters, validator)
+            # Functions are cached with their message, which is replayed for
+            # other fields without calling the function again
+            result = passed or ((self.rule.message,) if self.function else False)
+            self.cache.put(key, result)
+        elif result.__class__ is tuple:
+            self.rule._result = result[0]
+
+        return result is True
+
+    @property
+    def message(self) -> str:
+        return self.rule.message
+
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.rule.error(field, value, parameters, validator)
+
+    @property
+    def name(self):
+        return self.rule.name
+
+    def references(self, parameters: List[str]) -> Optional[List[str]]:
+        return self.rule.references(parameters)
+
+
+def rule(
+    pure: bool = False,
+    cost: float = 0,
+    implicit: bool = False,
+    stop: bool = False,
+    references: Optional[List[str]] = None,
+    bulk: bool = False,
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator that sets the attributes of a function that is used as a rule.
+
+    Results of pure functions only depend on the value, so they are cached per
+    value when the result cache of the validator is enabled. Rules with a
+    lower cost are evaluated first, so expensive functions can run after
+    cheap rules that stop the validation of a field.
+
+    Bulk functions are called once for all fields that match a wildcard field,
+    with an `items` list of (field, value) pairs, and return a dict with the
+    error messages of the failed items by index.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        function.pure = pure
+        function.cost = cost
+        function.implicit = implicit
+        function.stop = stop
+        function.bulk = bulk
+        if references is not None:
+            function.references = references
+
+        return function
+
+    return decorator
+
 
 class ProhibitedRule(Rule):
     """Prohibited field"""
 
+    __slots__ = ()
     name = "prohibited"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        self.message_fields = dict(field=field)
-
-        return missing(validator.data, field) or empty(value)
+        return validator.field_missing(field) or empty(value)
 
     @property
     def message(self) -> str:
@@ -932,80 +1292,116 @@ class ProhibitedRule(Rule):
 class ProhibitedIfRule(Rule):
     """Prohibited if other field equals certain value"""
 
+    __slots__ = ()
     name = "prohibited_if"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        other, val = parameters
-        data = validator.data
-        other_val = get_field_value(data=data, field=other)
-        self.message_fields = dict(field=field, other=other, value=val)
+        condition = ConditionParameters.of(parameters)
 
-        return missing_or_empty(data, field) or not equal(val, other_val)
+        return validator.field_empty(field) or not validator.condition_holds(condition)
 
     @property
     def message(self) -> str:
         return errors.PROHIBITED_IF_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        other, val = parameters
+
+        return self.message, dict(field=field, other=other, value=val)
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return parameters[:1]
+
+    def parse_parameters(self, parameters: List[str]) -> ConditionParameters:
+        return ConditionParameters(parameters)
+
 
 class ProhibitedUnlessRule(Rule):
     """Prohibited unless other field equals certain value"""
 
+    __slots__ = ()
     name = "prohibited_unless"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
-        other, val = parameters
-        data = validator.data
-        other_val = get_field_value(data=data, field=other)
-        self.message_fields = dict(field=field, other=other, value=val)
+        condition = ConditionParameters.of(parameters)
 
-        return missing_or_empty(data, field) or equal(val, other_val)
+        return validator.field_empty(field) or validator.condition_holds(condition)
 
     @property
     def message(self) -> str:
         return errors.PROHIBITED_UNLESS_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        other, val = parameters
+
+        return self.message, dict(field=field, other=other, value=val)
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return parameters[:1]
+
+    def parse_parameters(self, parameters: List[str]) -> ConditionParameters:
+        return ConditionParameters(parameters)
+
 
 class ProhibitedWithoutRule(Rule):
     """Prohibited if other field is not present"""
 
+    __slots__ = ()
     name = "prohibited_without"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         other_fields = parameters
-        data = validator.data
-        self.message_fields = dict(field=field, other=", ".join(other_fields))
 
-        return missing_or_empty(data, field) or not any(
-            [missing_or_empty(data, o) for o in other_fields]
+        return validator.field_empty(field) or not any(
+            [validator.field_empty(o) for o in other_fields]
         )
 
     @property
     def message(self) -> str:
         return errors.PROHIBITED_WITHOUT_ERROR
 
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, other=", ".join(parameters))
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return list(parameters)
+
 
 class ProhibitedWithRule(Rule):
     """Prohibited with other field"""
 
+    __slots__ = ()
     name = "prohibited_with"
     implicit = True
     stop = True
 
     def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
         other_fields = parameters
-        data = validator.data
-        self.message_fields = dict(field=field, other=", ".join(other_fields))
 
-        return missing_or_empty(data, field) or not any(
-            [not missing_or_empty(data, o) for o in other_fields]
+        return validator.field_empty(field) or not any(
+            [not validator.field_empty(o) for o in other_fields]
         )
 
     @property
     def message(self) -> str:
         return errors.PROHIBITED_WITH_ERROR
+
+    def error(
+        self, field: str, value: Any, parameters: List[str], validator
+    ) -> Tuple[str, dict]:
+        return self.message, dict(field=field, other=", ".join(parameters))
+
+    def references(self, parameters: List[str]) -> List[str]:
+        return list(parameters)
@@ -0,0 +1,251 @@
+from typing import (
+    Any,
+    List,
+    Union,
+    Tuple,
+    Callable,
+    ClassVar,
+    Iterator,
+    Optional,
+    get_type_hints,
+)
+from weakref import WeakKeyDictionary
+
+from . import config
+from .conditions import RuleGroup
+from .rules import RegexRule, InFileRule
+from .utils import check_pickle_version
+
+METADATA_KEY = "rules"
+
+# Rules that take a single parameter that may contain the params delimiter
+UNSPLIT_PARAMETER_RULES = [RegexRule.name, InFileRule.name]
+
+ParsedRule = Union[Tuple[str, List[Any]], Callable]
+
+
+class Schema(dict):
+    """
+    Creates a schema: a rules dict of which the rules are parsed only once, so
+    it can be reused for many validations. A schema can be passed to the
+    validator anywhere a rules dict is expected.
+
+    Parameters
+    ----------
+    rules : dict
+        Dict with validation rules in string or list notation.
+        For example: {"email": "required|email"}
+    """
+
+    _class_schemas = WeakKeyDictionary()
+
+    def __init__(self, rules: dict = None):
+        super().__init__()
+
+        for field, field_rules in (rules or {}).items():
+            if isinstance(field_rules, RuleGroup):
+                self[field] = field_rules.parsed()
+            else:
+                self[field] = parse_rules(field_rules)
+
+    def __reduce__(self) -> tuple:
+        # The parsed rules are pickled, so they aren't parsed again when loaded
+        return _load_schema, (config.PICKLE_VERSION, self.__class__, dict(self))
+
+    @classmethod
+    def from_class(cls, data_class: type) -> "Schema":
+        """
+        Returns the schema for a dataclass or a class with type annotations.
+        The schema is derived once per class and cached.
+
+        Type hints are mapped to rules (for example `str` to `string` and
+        `List[int]` to `list` with `integer` items), fields that are not
+        `Optional` (except lists and dicts) are required, and nested classes
+        are validated as nested fields. The fields of an `Optional` nested
+        class are only required when it is present. Additional rules can be added to a
+        dataclass field with `field(metadata={"rules": "email|max:255"})`.
+        """
+        schema = cls._class_schemas.get(data_class)
+
+        if schema is None:
+            schema = cls()
+            for field, field_rules in _class_rules(data_class, "", ()):
+                schema[field] = field_rules
+            cls._class_schemas[data_class] = schema
+
+        return schema
+
+
+def _load_schema(version: int, cls: type, rules: dict) -> Schema:
+    check_pickle_version(version)
+    schema = cls.__new__(cls)
+    dict.update(schema, rules)
+
+    return schema
+
+
+def parse_rules(rules: Union[str, List[Any]]) -> List[ParsedRule]:
+    """Parses rules in string or list notation into a list of parsed rules"""
+    if not isinstance(rules, list):
+        rules = rules.split(config.RULE_DELIMITER)
+
+    return [parse_rule(rule) for rule in rules]
+
+
+def parse_rule(rule: Any) -> ParsedRule:
+    """Parses a single rule into a (name, parameters) tuple"""
+    if isinstance(rule, Callable):
+        return rule
+
+    if isinstance(rule, tuple) or isinstance(rule, list):
+        rule_name, rule_parameters = rule
+        return rule_name, rule_parameters
+
+    return rule_name_and_parameters(rule)
+
+
+def rule_name_and_parameters(rule: str) -> Tuple[str, List[str]]:
+    """Splits a rule in string notation into its name and parameters"""
+    if config.RULE_PARAM_DELIMITER not in rule:
+        return rule, []
+
+    rule_name, parameters = rule.split(config.RULE_PARAM_DELIMITER, 1)
+
+    if rule_name in UNSPLIT_PARAMETER_RULES:
+        return rule_name, [parameters]
+
+    return rule_name, parameters.split(config.RULE_PARAMS_DELIMITER)
+
+
+def _class_rules(
+    data_class: type,
+    prefix: str,
+    parents: Tuple[type, ...],
+    optional_parent: Optional[str] = None,
+) -> Iterator[Tuple[str, List[ParsedRule]]]:
+    for name, hint, metadata_rules in _class_fields(data_class):
+        field = prefix + name
+        optional, hint = _unwrap_optional(hint)
+        type_rules = _type_rules(hint)
+        # Empty lists and dicts are valid values for non optional fields
+        if optional or type_rules in [[("list", [])], [("dict", [])]]:
+            field_rules = type_rules
+        elif optional_parent is None:
+            field_rules = [("required", [])] + type_rules
+        else:
+            # Fields of an optional class are only required when it's present
+            field_rules = [("required_with", [optional_parent])] + type_rules
+        if metadata_rules:
+            field_rules.extend(parse_rules(metadata_rules))
+
+        yield field, field_rules
+        yield from _nested_rules(
+            hint,
+            field,
+            parents + (data_class,),
+            field if optional else optional_parent,
+        )
+
+
+def _class_fields(data_class: type) -> Iterator[Tuple[str, Any, Any]]:
+    hints = get_type_hints(data_class)
+
+    # The dataclasses module has been imported if the class is a dataclass
+    if hasattr(data_class, "__dataclass_fields__"):
+        import dataclasses
+
+        for field in dataclasses.fields(data_class):
+            yield field.name, hints.get(field.name, Any), field.metadata.get(
+                METADATA_KEY
+            )
+    else:
+        # Class variables aren't fields, like with `dataclasses.fields()`
+        for name, hint in hints.items():
+            if not _is_class_var(hint):
+                yield name, hint, None
+
+
+def _is_class_var(hint: Any) -> bool:
+    # Python 3.6 has a `_ClassVar` type instead of an origin
+    return (
+        hint is ClassVar
+        or getattr(hint, "__origin__", None) is ClassVar
+        or type(hint).__name__ == "_ClassVar"
+    )
+
+
+def _nested_rules(
+    hint: Any,
+    field: str,
+    parents: Tuple[type, ...],
+    optional_parent: Optional[str] = None,
+) -> Iterator[Tuple[str, List[ParsedRule]]]:
+    if _is_annotated_class(hint):
+        # Skip recursive classes
+        if hint not in parents:
+            yield from _class_rules(
+                hint, field + config.FIELD_DELIMITER, parents, optional_parent
+            )
+        return
+
+    if _origin(hint) is list:
+        args = getattr(hint, "__args__", None) or (Any,)
+        item_field = field + config.FIELD_DELIMITER + config.FIELD_WILD_CARD
+        optional, item_hint = _unwrap_optional(args[0])
+        item_rules = _type_rules(item_hint)
+        if item_rules:
+            yield item_field, item_rules
+        # The items of a list are only expanded when the list is present
+        yield from _nested_rules(item_hint, item_field, parents)
+
+
+def _type_rules(hint: Any) -> List[ParsedRule]:
+    from datetime import date
+    from decimal import Decimal
+
+    origin = _origin(hint)
+    # bool is a subclass of int, so it has to be checked first
+    type_rules = [
+        (bool, "boolean"),
+        (int, "integer"),
+        (float, "float"),
+        (Decimal, "decimal"),
+        (str, "string"),
+        (date, "date_time"),
+        (list, "list"),
+        (dict, "dict"),
+    ]
+
+    if isinstance(origin, type):
+        for type_, rule_name in type_rules:
+            if issubclass(origin, type_):
+                return [(rule_name, [])]
+
+    return []
+
+
+def _origin(hint: Any) -> Any:
+    origin = getattr(hint, "__origin__", None)
+
+    if origin is None:
+        return hint
+
+    # Python 3.6 uses the typing generic as origin, e.g. List[int] -> List
+    return getattr(origin, "__extra__", origin)
+
+
+def _unwrap_optional(hint: Any) -> Tuple[bool, Any]:
+    if getattr(hint, "__origin__", None) is Union:
+        args = [arg for arg in hint.__args__ if arg is not type(None)]
+        if len(args) < len(hint.__args__):
+            return True, args[0] if len(args) == 1 else Any
+
+    return False, hint
+
+
+def _is_annotated_class(hint: Any) -> bool:
+    return (
+        isinstance(hint, type)
+        and hint.__module__ != "builtins"
+        and bool(getattr(hint, "__annotations__", None))
+    )
@@ -1,8 +1,23 @@
-from datetime import datetime, date
-from typing import Pattern, AnyStr, Any, Union, Tuple
+import re
+import sys
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Pattern,
+    AnyStr,
+    Any,
+    Union,
+    Tuple,
+    Optional,
+    Sequence,
+)
 
 from . import config
-from .exceptions import FieldValueNotFoundError
+from .adapters import adapter_for, MappingAdapter, SequenceAdapter
+from .exceptions import FieldValueNotFoundError, IncompatiblePickleError
+
+if TYPE_CHECKING:
+    from datetime import datetime, date
 
 
 def regex_match(compiled_regex: Pattern[AnyStr], value: Any) -> bool:
@@ -15,6 +30,77 @@ def regex_match(compiled_regex: Pattern[AnyStr], value: Any) -> bool:
         return match is not None
 
 
+class LazyPattern:
+    """
+    Regex that is compiled when it is first used instead of at import time.
+    Attributes of the compiled pattern (like `fullmatch`) are available on the
+    lazy pattern itself.
+    """
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled = None
+
+    @property
+    def compiled(self) -> Pattern:
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+
+        return self._compiled
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for missing attributes, so the attribute is stored on
+        # the instance to skip this method next time. Dunder lookups (like the
+        # `__isabstractmethod__` check of ABCMeta) must not compile the regex.
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        value = getattr(self.compiled, name)
+        setattr(self, name, value)
+
+        return value
+
+
+def is_decimal(value: Any) -> bool:
+    """
+    Checks if the value is a Decimal. The decimal module isn't imported for
+    this: if it hasn't been imported yet, the value can't be a Decimal.
+    """
+    decimal = sys.modules.get("decimal")
+
+    return decimal is not None and isinstance(value, decimal.Decimal)
+
+
+def is_date(value: Any) -> bool:
+    """
+    Checks if the value is a date or datetime, without importing the datetime
+    module.
+    """
+    datetime = sys.modules.get("datetime")
+
+    return datetime is not None and isinstance(value, datetime.date)
+
+
+def is_mapping(value: Any) -> bool:
+    """Checks if the value is a dict or another mapping"""
+    return type(value) is dict or isinstance(adapter_for(type(value)), MappingAdapter)
+
+
+def is_sequence(value: Any) -> bool:
+    """
+    Checks if the value is a list or another sequence, like a tuple. Strings
+    and bytes are not considered sequences.
+    """
+    return type(value) is list or isinstance(adapter_for(type(value)), SequenceAdapter)
+
+
+def check_pickle_version(version: Any):
+    """Checks if a pickled schema or validator can be loaded"""
+    if version != config.PICKLE_VERSION:
+        raise IncompatiblePickleError(version, config.PICKLE_VERSION)
+
+
 def equal(*values: Any) -> bool:
     """Checks if passed values are equal"""
     return len(set([str(v) for v in values])) == 1
@@ -42,13 +128,12 @@ def _get_field_value(value, field):
     segments = field.split(config.FIELD_DELIMITER)
     try:
         for key in segments:
-            if not isinstance(value, dict) and not isinstance(value, list):
-                value = value.__dict__
-            if key.isnumeric():
-                value = value[int(key)]
-            else:
+            if type(value) is dict and key in value:
                 value = value[key]
-    except (TypeError, AttributeError, KeyError, IndexError):
+            else:
+                # Other types are read by the adapter for their type
+                value = adapter_for(type(value)).get(value, key)
+    except (TypeError, AttributeError, LookupError, ValueError):
         raise FieldValueNotFoundError
 
     return value
@@ -66,8 +151,8 @@ def empty(value) -> bool:
         if value.strip() == "":
             return True
 
-    # Empty list or empty dict
-    if isinstance(value, list) or isinstance(value, dict):
+    # Empty list or empty dict (or another sequence or mapping)
+    if is_sequence(value) or is_mapping(value):
         if len(value) == 0:
             return True
 
@@ -81,9 +166,11 @@ def missing_or_empty(data, field) -> bool:
 
 
 def get_comparable_dates(
-    date1: Union[datetime, date],
-    date2: Union[datetime, date],
-) -> Union[Tuple[datetime, datetime], Tuple[date, date]]:
+    date1: Union["datetime", "date"],
+    date2: Union["datetime", "date"],
+) -> Union[Tuple["datetime", "datetime"], Tuple["date", "date"]]:
+    from datetime import datetime, date
+
     def is_date_time(value: Union[datetime, date]) -> bool:
         return isinstance(value, datetime)
 
@@ -96,3 +183,74 @@ def get_comparable_dates(
         return date1, date2.date()
 
     return date1, date2
+
+
+class AffixMatcher:
+    """
+    Matches strings against a fixed set of prefixes, or suffixes when
+    `suffix` is true.
+
+    Small sets are matched with a single `str.startswith`/`str.endswith` call
+    on a tuple. Large sets are stored in a trie, so a lookup only depends on
+    the length of the value instead of the number of candidates.
+    """
+
+    TRIE_THRESHOLD = 64
+    _END = None
+
+    def __init__(self, candidates: Sequence[Any], suffix: bool = False):
+        self.candidates = tuple(str(c) for c in candidates)
+        self.suffix = suffix
+        self._trie = None
+
+        if len(self.candidates) > self.TRIE_THRESHOLD:
+            self._trie = self._build_trie()
+
+    def _build_trie(self) -> dict:
+        trie = {}
+        for candidate in self.candidates:
+            node = trie
+            for char in reversed(candidate) if self.suffix else candidate:
+                node = node.setdefault(char, {})
+            node[self._END] = candidate
+
+        return trie
+
+    def matches(self, value: str) -> bool:
+        """Checks if the value starts (or ends) with any of the candidates"""
+        if self._trie is None:
+            if self.suffix:
+                return value.endswith(self.candidates)
+            return value.startswith(self.candidates)
+
+        return self.match(value) is not None
+
+    def match(self, value: str) -> Optional[str]:
+        """Returns the longest candidate the value starts (or ends) with"""
+        if self._trie is None:
+            matched = None
+            for candidate in self.candidates:
+                if self.suffix:
+                    found = value.endswith(candidate)
+                else:
+                    found = value.startswith(candidate)
+                if found and (matched is None or len(candidate) > len(matched)):
+                    matched = candidate
+
+            return matched
+
+        node = self._trie
+        matched = node.get(self._END)
+        for char in reversed(value) if self.suffix else value:
+            node = node.get(char)
+            if node is None:
+                break
+            matched = node.get(self._END, matched)
+
+        return matched
+
+
+@lru_cache(maxsize=256)
+def affix_matcher(candidates: Tuple[Any, ...], suffix: bool = False) -> AffixMatcher:
+    """Returns a cached matcher for the given candidates"""
+    return AffixMatcher(candidates, suffix)
@@ -1,14 +1,52 @@
-from typing import Union, List, overload, Tuple, Iterator, Dict, Any, Callable
+from types import MappingProxyType
+from typing import (
+    Union,
+    List,
+    overload,
+    Tuple,
+    Iterator,
+    Dict,
+    Any,
+    Callable,
+    Iterable,
+    Mapping,
+    Optional,
+)
 
 from . import rules as rls, config
-from .exceptions import RuleNotFoundError, InvalidDataError, InvalidRulesError
-from .utils import get_field_value
+from .adapters import adapter_for, AttributeAdapter, ScalarAdapter, SequenceAdapter
+from .cache import CacheInfo, ResultCache
+from .conditions import Condition, RuleGroup
+from .dependencies import DependencyGraph, matches, overlaps
+from .exceptions import (
+    RuleNotFoundError,
+    InvalidDataError,
+    InvalidRulesError,
+    FieldValueNotFoundError,
+)
+from .result import FieldError, ValidationResult
+from .schema import Schema, rule_name_and_parameters
+from .utils import (
+    check_pickle_version,
+    get_field_value,
+    _get_field_value,
+    empty,
+    is_sequence,
+    is_mapping,
+)
 
 
 Data = Union[dict, object]
 ValidationFunction = Callable[..., Union[str, None]]
 Rules = Dict[str, Union[str, List[Union[str, ValidationFunction]]]]
 
+# Markers for fields that are missing and fields that weren't looked up yet
+_MISSING = object()
+_NOT_LOOKED_UP = object()
+
+# Max number of resolved field rules that are cached per validator
+RESOLVED_RULES_CACHE_SIZE = 1024
+
 
 class Validator:
     """
@@ -18,6 +56,9 @@ class Validator:
     ----------
     plugins : list
         A list of plugins that add additional validation rules.
+    cache_size : int, optional
+        Max number of results of pure rules (like `email` and `date_time`)
+        that are cached per value. The cache is disabled by default.
     """
 
     class Plugin:
@@ -28,24 +69,80 @@ class Validator:
         def rules(self) -> List[rls.Rule]:
             return []
 
-    def __init__(self, plugins: List[Plugin] = None):
+    def __init__(self, plugins: List[Plugin] = None, cache_size: int = 0):
         self.data = None
         self.rules = None
         self.output = {}
         self.config = config
+        self.decoded = {}
         self._flat_list = []
+        self._field_prefix = ""
+        self._pattern = None
+        self._resolved_rules = {}
+        self._result_cache = ResultCache(cache_size) if cache_size else None
+        self._pending = None
+        self._stream = None
+        self._reset_lookups()
 
         self.overwrite_messages = {}
         self.overwrite_fields = {}
         self.overwrite_values = {}
 
-        self._available_rules: Dict[str, rls.Rule] = {}
+        # All validators share the default rules, until a rule is registered
+        self._available_rules: Mapping[str, rls.Rule] = self._default_registry()
 
-        self._setup_default_rules()
         self._setup_plugins(plugins or [])
 
-    def _setup_default_rules(self):
-        self.register_rules(self._default_rules())
+    @classmethod
+    def _default_registry(cls) -> Mapping[str, rls.Rule]:
+        registry = cls.__dict__.get("_shared_default_rules")
+
+        if registry is None:
+            registry = MappingProxyType(
+                {rule.name: rule for rule in cls._default_rules()}
+            )
+            cls._shared_default_rules = registry
+
+        return registry
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the compact form of the validator that is pickled: the
+        registered rules (including the rules of plugins), the overwrites and
+        the cache size. Caches and the state of the last validation are left
+        out.
+        """
+        default_rules = self._default_registry()
+        cache = self._result_cache
+
+        return {
+            "version": config.PICKLE_VERSION,
+            "rules": [
+                rule
+                for name, rule in self._available_rules.items()
+                if default_rules.get(name) is not rule
+            ],
+            "overwrite_messages": self.overwrite_messages,
+            "overwrite_fields": self.overwrite_fields,
+            "overwrite_values": self.overwrite_values,
+            "cache_size": 0 if cache is None else cache.maxsize,
+        }
+
+    def __setstate__(self, state: dict):
+        check_pickle_version(state.get("version"))
+
+        Validator.__init__(self, cache_size=state["cache_size"])
+        self.register_rules(state["rules"])
+        self.overwrite_messages = state["overwrite_messages"]
+        self.overwrite_fields = state["overwrite_fields"]
+        self.overwrite_values = state["overwrite_values"]
+
+    def __copy__(self) -> "Validator":
+        # Copies share all state, unlike pickled validators
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+
+        return copied
 
     def register_rules(self, rules: [rls.Rule]):
         for rule in rules:
@@ -55,7 +152,34 @@ class Validator:
         self._setup_rule(rule)
 
     def _setup_rule(self, rule):
+        # Copy the shared default rules on write
+        if isinstance(self._available_rules, MappingProxyType):
+            self._available_rules = dict(self._available_rules)
+
         self._available_rules[rule.name] = rule
+        self._resolved_rules = {}
+        self.clear_cache()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the result cache of pure rules.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple with the hits, misses, maxsize and current size of the
+            cache, and a `hit_rate` property. All values are 0 if the cache is
+            disabled.
+        """
+        if self._result_cache is None:
+            return CacheInfo(0, 0, 0, 0)
+
+        return self._result_cache.info()
+
+    def clear_cache(self):
+        """Clears the result cache of pure rules and its statistics"""
+        if self._result_cache is not None:
+            self._result_cache.clear()
 
     @staticmethod
     def _default_rules() -> List[rls.Rule]:
@@ -75,6 +199,7 @@ class Validator:
             rls.EndsWithRule(),
             rls.FilledRule(),
             rls.FloatRule(),
+            rls.InFileRule(),
             rls.InRule(),
             rls.IntegerRule(),
             rls.IpRule(),
@@ -114,18 +239,30 @@ class Validator:
 
     @overload
     def validate(
-        self, data: dict, rules: Rules, flat: bool = False
+        self,
+        data: dict,
+        rules: Rules,
+        flat: bool = False,
+        only: Iterable[str] = None,
     ) -> Union[dict, list]:
         ...
 
     @overload
     def validate(
-        self, data: object, rules: Rules, flat: bool = False
+        self,
+        data: object,
+        rules: Rules,
+        flat: bool = False,
+        only: Iterable[str] = None,
     ) -> Union[dict, list]:
         ...
 
     def validate(
-        self, data: Data, rules: Rules, flat: bool = False
+        self,
+        data: Data,
+        rules: Rules,
+        flat: bool = False,
+        only: Iterable[str] = None,
     ) -> Union[dict, list]:
         """
         Validate data with given rules.
@@ -142,6 +279,10 @@ class Validator:
             For example: {"email": "required|email|unique:user,email"}
         flat : bool, optional
             Returns a list of errors instead of a dict if true.
+        only : list, optional
+            Only validate these fields, and the fields with rules that
+            reference them. Other fields in the rules are skipped.
+            For example: ["email", "address.*.zip"]
 
         Returns
         -------
@@ -151,14 +292,221 @@ class Validator:
             errors for that key/field. When the optional parameter `flat` is
             set to true, a list of only the error messages is returned.
         """
+        self._prepare(data, rules)
+
+        if only is None:
+            self._validate_data()
+        else:
+            self._validate_data(DependencyGraph.of(rules, self).affected(only))
+
+        return self._result(flat)
+
+    def check(
+        self, data: Data, rules: Rules, only: Iterable[str] = None
+    ) -> ValidationResult:
+        """
+        Validate data with given rules and return a result object instead of
+        the errors.
+
+        Parameters
+        ----------
+        data : dict or object
+            Dict or object that can be converted to a dict with data that needs
+            to be validated.
+        rules : dict
+            Dict with validation rules for the given data.
+        only : list, optional
+            Only validate these fields, and the fields with rules that
+            reference them. See `validate()`.
+
+        Returns
+        -------
+        result : ValidationResult
+            Result that is truthy when the data is valid. The errors are
+            available as a dict (`errors`), as a flat list (`flat`), and by
+            iterating over the result as (field, message) tuples.
+        """
+        errors = self.validate(data, rules, only=only)
+
+        return ValidationResult(errors, self.decoded)
+
+    def iter_errors(
+        self, data: Data, rules: Rules, only: Iterable[str] = None
+    ) -> Iterator[FieldError]:
+        """
+        Validate data with given rules and yield the errors as soon as they
+        are found, without collecting them in a dict.
+
+        The data is validated while the errors are consumed, so stopping early
+        skips the validation of the remaining fields. The data is validated by
+        a copy of the validator, so the iterator can be abandoned or resumed
+        after the validator validated other data.
+
+        Parameters
+        ----------
+        data : dict or object
+            Dict or object with data that needs to be validated.
+        rules : dict
+            Dict with validation rules for the given data.
+        only : list, optional
+            Only validate these fields, and the fields with rules that
+            reference them. See `validate()`.
+
+        Yields
+        ------
+        FieldError
+            Named tuple with the full field name, the name of the rule and the
+            error message.
+        """
+        from copy import copy
+
+        # The validation is paused between errors, so it has its own state
+        validator = copy(self)
+        validator._pending = None
+        validator._prepare(data, rules)
+        fields = None
+        if only is not None:
+            fields = DependencyGraph.of(rules, validator).affected(only)
+
+        stream = validator._stream = []
+        for _ in validator._iter_data(fields):
+            yield from stream
+            stream.clear()
+
+    def validate_many(
+        self, records: Iterable[Data], rules: Rules, flat: bool = False
+    ) -> List[Union[dict, list]]:
+        """
+        Validate multiple records with the same rules.
+
+        The rules are parsed once for all records. Bulk rules are called once
+        for the fields of all records, instead of once per record, so a rule
+        that looks up values in a database only needs one query. Their errors
+        are added after the other errors of each record.
+
+        Parameters
+        ----------
+        records : iterable
+            Dicts or objects with data that needs to be validated.
+        rules : dict
+            Dict with validation rules for the given records.
+        flat : bool, optional
+            Returns a list of errors per record instead of a dict if true.
+
+        Returns
+        -------
+        errors : list
+            List with the dict or list of errors of each record, in the order
+            of the records.
+        """
+        if isinstance(rules, dict) and not isinstance(rules, Schema):
+            rules = Schema(rules)
+
+        validated = []
+        self._pending = []
+        try:
+            for data in records:
+                self._prepare(data, rules)
+                self._validate_data()
+                validated.append((self.data, self.output))
+
+            self._validate_bulk(self._pending)
+        finally:
+            self._pending = None
+
+        errors = []
+        for self.data, self.output in validated:
+            errors.append(self._result(flat))
+
+        return errors
+
+    def revalidate(
+        self, data: Data, rules: Rules, previous: dict, changed: Iterable[str]
+    ) -> dict:
+        """
+        Validate data again after some of its fields changed, re-evaluating
+        only the affected rules.
+
+        Parameters
+        ----------
+        data : dict or object
+            The changed data.
+        rules : dict
+            Dict with validation rules that were used to create `previous`.
+        previous : dict
+            Dict of errors returned by a previous validation of the data.
+        changed : list
+            Fields that changed since the previous validation.
+            For example: ["email", "address.zip"]
+
+        Returns
+        -------
+        errors : dict
+            Dict of errors, as if all data was validated again. Errors of the
+            fields that weren't affected are taken from `previous`.
+        """
+        self._prepare(data, rules)
+        graph = DependencyGraph.of(rules, self)
+        affected = graph.affected(changed)
+        self._validate_data(affected)
+
+        output = {
+            field: errors
+            for field, errors in previous.items()
+            if not self._is_affected_error(field, affected, graph)
+        }
+        output.update(self.output)
+        self.output = output
+
+        return output
+
+    @staticmethod
+    def _is_affected_error(
+        field: str, affected: List[str], graph: DependencyGraph
+    ) -> bool:
+        if any(matches(pattern, field) for pattern in affected):
+            return True
+
+        # Errors of nested content, like the content of a JSON string, belong
+        # to the closest parent field
+        return not any(matches(pattern, field) for pattern in graph.fields) and any(
+            overlaps(pattern, field) for pattern in affected
+        )
+
+    def _prepare(self, data: Data, rules: Rules):
         self.data = data
         self.rules = rules
         self.output = {}
+        self.decoded = {}
 
-        self._convert_data_to_dict()
+        self._reset_lookups()
+        self._validate_data_type()
         self._validate_rules_type()
-        self._validate_data()
 
+    def compile(self, rules: Rules) -> Callable[..., Union[dict, list]]:
+        """
+        Compile rules into a specialized validation function.
+
+        The returned function accepts the same `data` and `flat` arguments as
+        `validate()` and returns the same errors, but skips parsing the rules
+        and dispatching to generic rule objects on every call. Changes to the
+        registered rules after compiling are not picked up.
+
+        Parameters
+        ----------
+        rules : dict
+            Dict with validation rules.
+
+        Returns
+        -------
+        function
+            Function that validates data with the given rules.
+        """
+        from .compiler import compile_rules
+
+        return compile_rules(self, rules)
+
+    def _result(self, flat: bool) -> Union[dict, list]:
         if flat:
             self._flat_list = []
             self._flatten_output(self.output)
@@ -167,44 +515,341 @@ class Validator:
 
         return self.output
 
-    def _sub_fields(self, field) -> Iterator[str]:
+    def validate_nested(self, field: str, data: Data, rules: Rules):
+        """
+        Validate data that is nested under the given field, for example a
+        decoded JSON string, with rules relative to that field. Errors are
+        added to the output under their full field names.
+        """
+        from copy import copy
+
+        nested = copy(self)
+        nested._pending = None
+        nested._field_prefix = self.full_field(field) + self.config.FIELD_DELIMITER
+        errors = nested.validate(data if isinstance(data, dict) else {}, rules)
+
+        for nested_field, nested_errors in errors.items():
+            self.output.setdefault(nested_field, []).extend(nested_errors)
+        self.decoded.update(nested.decoded)
+
+    def full_field(self, field: str) -> str:
+        """Returns the field name relative to the root of the validated data"""
+        return self._field_prefix + field
+
+    def _sub_items(self, field: str) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the fields that match a (wildcard) field with their values, or
+        `_MISSING` for missing fields. The values are carried along while
+        expanding, so keys that aren't strings or that contain the delimiter
+        are validated as well.
+        """
         if not self._contains_wildcard(field):
-            yield field
+            yield field, self._lookup(field)
             return
 
-        root = field.split(self.config.FIELD_WILD_CARD)[0].strip(
-            self.config.FIELD_DELIMITER
-        )
-        root_value = self._get_field_value(root)
+        head, _, tail = field.partition(self.config.FIELD_WILD_CARD)
+        root_value = self._get_field_value(head.strip(self.config.FIELD_DELIMITER))
+
+        yield from self._expand_items(head, root_value, tail)
+
+    def _expand_items(
+        self, prefix: str, value: Any, tail: str
+    ) -> Iterator[Tuple[str, Any]]:
+        # Mappings are expanded over their keys, without copying the values
+        if is_sequence(value):
+            items = enumerate(value)
+        elif is_mapping(value):
+            items = value.items()
+        else:
+            return
+
+        wild_card = self.config.FIELD_WILD_CARD
+        delimiter = self.config.FIELD_DELIMITER
+        for key, item in items:
+            field = prefix + str(key)
+            if not tail:
+                yield field, item
+                continue
 
-        if isinstance(root_value, list):
-            for i, _ in enumerate(root_value):
-                new_field = field.replace(self.config.FIELD_WILD_CARD, str(i), 1)
-                yield from self._sub_fields(new_field)
+            head, wildcard, rest = tail.partition(wild_card)
+            path = head.strip(delimiter)
+            if path:
+                try:
+                    item = _get_field_value(item, path)
+                except FieldValueNotFoundError:
+                    item = _MISSING
+
+            if wildcard:
+                yield from self._expand_items(field + head, item, rest)
+            else:
+                yield field + head, item
+
+    def _validate_data(self, fields: List[str] = None):
+        # The rules of a schema don't change, so they can be resolved once
+        cacheable = isinstance(self.rules, Schema)
 
-    def _validate_data(self):
         # Iterate over fields
-        for raw_field, rules in self._field_iterator():
-            # Iterate over sub fields
-            for field in self._sub_fields(raw_field):
-                # Iterate over rules
-                for rule, rule_parameters in self.rule_iterator(rules):
-                    # Check if field is validatable
-                    if self._is_validatable(field, rule):
-                        value = self._get_field_value(field)
-                        # If rule didn't pass, add error
-                        if not rule.passes(field, value, rule_parameters, self):
-                            self._add_error(rule)
-                            # Stop
-                            if rule.stop:
-                                break
-
-    def _field_iterator(self) -> Iterator[Tuple[str, List[str]]]:
-        for field, rules in self.rules.items():
-            if isinstance(rules, list):
-                yield field, rules
+        for raw_field, rules in self._field_iterator(fields):
+            if isinstance(rules, RuleGroup):
+                self._validate_group(raw_field, rules)
             else:
-                yield field, self._split_rules(rules)
+                self._validate_field(raw_field, rules, cacheable)
+
+    def _iter_data(self, fields: List[str] = None) -> Iterator[None]:
+        """
+        Validates the data like `_validate_data()`, but pauses after each
+        validated value, so errors can be streamed.
+        """
+        cacheable = isinstance(self.rules, Schema)
+
+        for raw_field, rules in self._field_iterator(fields):
+            if isinstance(rules, RuleGroup):
+                self._validate_group(raw_field, rules)
+                yield
+                continue
+
+            resolved_rules = self._resolve_rules(rules, cacheable)
+            if self._is_key_field(raw_field) or self._has_bulk_rules(resolved_rules):
+                self._validate_field(raw_field, rules, cacheable)
+                yield
+                continue
+
+            self._pattern = raw_field
+            for field, value in self._sub_items(raw_field):
+                self._validate_value(field, value, resolved_rules)
+                yield
+
+    def _validate_group(self, prefix: str, group: RuleGroup):
+        # Skip all fields of the group, including their wildcard expansion
+        if not self.condition_holds(group.condition):
+            return
+
+        cacheable = isinstance(group.rules, Schema)
+
+        for field, rules in group.rules.items():
+            field = prefix + self.config.FIELD_DELIMITER + field
+            if isinstance(rules, RuleGroup):
+                self._validate_group(field, rules)
+            else:
+                self._validate_field(field, rules, cacheable)
+
+    def _validate_field(self, raw_field: str, rules: Any, cacheable: bool = False):
+        resolved_rules = self._resolve_rules(rules, cacheable)
+        self._pattern = raw_field
+
+        if self._is_key_field(raw_field):
+            self._validate_items(self._key_items(raw_field), resolved_rules)
+        elif self._has_bulk_rules(resolved_rules):
+            self._validate_items(self._sub_items(raw_field), resolved_rules)
+        else:
+            # Iterate over sub fields
+            for field, value in self._sub_items(raw_field):
+                self._validate_value(field, value, resolved_rules)
+
+    @staticmethod
+    def _has_bulk_rules(resolved_rules: List[Tuple[rls.Rule, Any]]) -> bool:
+        # Bulk rules are ordered last, see `_order_rules()`
+        return bool(resolved_rules) and resolved_rules[-1][0].bulk
+
+    def _key_items(self, raw_field: str) -> Iterator[Tuple[str, Any]]:
+        parent = raw_field[: -len(self.config.FIELD_KEY_WILD_CARD)]
+
+        # The keys are validated as the values of the fields they belong to
+        parent = parent.rstrip(self.config.FIELD_DELIMITER)
+        for field, mapping in self._sub_items(parent):
+            if is_mapping(mapping):
+                for key in mapping:
+                    yield field + self.config.FIELD_DELIMITER + str(key), key
+
+    def _validate_items(
+        self,
+        items: Iterable[Tuple[str, Any]],
+        resolved_rules: List[Tuple[rls.Rule, Any]],
+    ):
+        if not self._has_bulk_rules(resolved_rules):
+            for field, value in items:
+                self._validate_value(field, value, resolved_rules)
+            return
+
+        split = len(resolved_rules)
+        while split and resolved_rules[split - 1][0].bulk:
+            split -= 1
+        item_rules = resolved_rules[:split]
+
+        # Items of which a stop rule failed are left out of the bulk rules
+        items = [
+            (field, None if value is _MISSING else value)
+            for field, value in items
+            if self._validate_value(field, value, item_rules)
+        ]
+        pending = _PendingBulk(
+            self.data, self.output, self._pattern, resolved_rules[split:], items
+        )
+
+        if self._pending is None:
+            self._validate_bulk([pending])
+        else:
+            self._pending.append(pending)
+
+    def _validate_bulk(self, pending: List["_PendingBulk"]):
+        """
+        Validates the items of the pending fields with their bulk rules, with
+        one call for all fields that have the same next rule.
+        """
+        while pending:
+            groups = {}
+            for fields in pending:
+                rule, parameters = fields.rules[0]
+                groups.setdefault((rule, id(parameters)), []).append(fields)
+
+            for group in groups.values():
+                rule, parameters = group[0].rules[0]
+                self._validate_bulk_group(rule, parameters, group)
+
+            pending = [fields for fields in pending if fields.rules]
+
+    def _validate_bulk_group(
+        self, rule: rls.Rule, parameters: Any, group: List["_PendingBulk"]
+    ):
+        candidates = [
+            (fields, field, value)
+            for fields in group
+            for field, value in fields.items
+            if value is not None or rule.implicit
+        ]
+        failed = []
+        if candidates:
+            items = [(field, value) for _, field, value in candidates]
+            failed = sorted(set(rule.passes_bulk(items, parameters, self)))
+
+        stopped = set()
+        for index in failed:
+            fields, field, value = candidates[index]
+            self._restore_pending(fields)
+            self._add_error(rule, field, value, parameters, index)
+            if rule.stop:
+                stopped.add((id(fields), field))
+
+        for fields in group:
+            fields.rules = fields.rules[1:]
+            if stopped:
+                fields.items = [
+                    (field, value)
+                    for field, value in fields.items
+                    if (id(fields), field) not in stopped
+                ]
+
+    def _restore_pending(self, fields: "_PendingBulk"):
+        # Errors are added to the record the fields belong to
+        if fields.data is not self.data:
+            self.data = fields.data
+            self._reset_lookups()
+        self.output = fields.output
+        self._pattern = fields.pattern
+
+    def _validate_value(
+        self, field: str, value: Any, resolved_rules: List[Tuple[rls.Rule, Any]]
+    ) -> bool:
+        """
+        Validates the value against the rules, and returns False if a stop rule
+        failed.
+        """
+        # Rules look the field up through the carried value, as its path may
+        # not lead back to it (like keys that contain the delimiter)
+        self._current = (field, value)
+        if value is _MISSING:
+            value = None
+
+        present = value is not None
+        # Iterate over rules
+        for rule, rule_parameters in resolved_rules:
+            # Check if field is validatable
+            if present or rule.implicit:
+                # If rule didn't pass, add error
+                if not rule.passes(field, value, rule_parameters, self):
+                    self._add_error(rule, field, value, rule_parameters)
+                    # Stop
+                    if rule.stop:
+                        return False
+
+        return True
+
+    def _field_iterator(self, fields: List[str] = None) -> Iterator[Tuple[str, Any]]:
+        for field in self.rules if fields is None else fields:
+            yield field, self.rules.get(field)
+
+    def _resolve_rules(
+        self, rules: Any, cacheable: bool = False
+    ) -> List[Tuple[rls.Rule, Any]]:
+        """
+        Returns the rule objects and parameters of the rules of a field. Rules
+        in string notation, and rule lists that won't change (like the rules
+        of a schema), are resolved once per validator.
+        """
+        if isinstance(rules, str):
+            key = rules
+        elif cacheable:
+            key = id(rules)
+        else:
+            return self._prepare_rules(rules)
+
+        # The rule list is kept with its resolved rules, so its id can't be
+        # reused by another list while it is cached
+        cached = self._resolved_rules.get(key)
+        if cached is not None and cached[0] is rules:
+            return cached[1]
+
+        if isinstance(rules, str):
+            resolved_rules = self._prepare_rules(self._split_rules(rules))
+        else:
+            resolved_rules = self._prepare_rules(rules)
+
+        if len(self._resolved_rules) >= RESOLVED_RULES_CACHE_SIZE:
+            self._resolved_rules = {}
+        self._resolved_rules[key] = (rules, resolved_rules)
+
+        return resolved_rules
+
+    def _prepare_rules(self, rules: Any) -> List[Tuple[rls.Rule, Any]]:
+        resolved_rules = self._order_rules(list(self.rule_iterator(rules)))
+
+        if self._result_cache is None:
+            return resolved_rules
+
+        return [
+            (self._cached_rule(rule, parameters), parameters)
+            for rule, parameters in resolved_rules
+        ]
+
+    @staticmethod
+    def _order_rules(
+        resolved_rules: List[Tuple[rls.Rule, Any]]
+    ) -> List[Tuple[rls.Rule, Any]]:
+        """
+        Orders the rules of a field by cost, so cheap rules are evaluated first.
+        Bulk rules are evaluated last. Other rules keep their order.
+        """
+        if any(rule.cost or rule.bulk for rule, _ in resolved_rules):
+            resolved_rules.sort(
+                key=lambda resolved_rule: (resolved_rule[0].bulk, resolved_rule[0].cost)
+            )
+
+        return resolved_rules
+
+    def _cached_rule(self, rule: rls.Rule, parameters: Any) -> rls.Rule:
+        """Returns the rule with its results cached, if it's pure and cacheable"""
+        if self._result_cache is None or not rule.pure or rule.bulk:
+            return rule
+        if not isinstance(parameters, (list, tuple)):
+            return rule
+
+        try:
+            parameters = tuple(parameters)
+            hash(parameters)
+        except TypeError:
+            return rule
+
+        return rls._CachedRule(rule, parameters, self._result_cache)
 
     def rule_iterator(self, rules) -> Iterator[Tuple[rls.Rule, List[str]]]:
         for rule in rules:
@@ -215,41 +860,30 @@ class Validator:
             if isinstance(rule, tuple) or isinstance(rule, list):
                 rule_name, rule_parameters = rule
             else:
-                rule_name = self._rule_name(rule)
-                rule_parameters = self._rule_parameters(rule)
+                rule_name, rule_parameters = rule_name_and_parameters(rule)
 
             if not self._rule_exists(rule_name):
                 raise RuleNotFoundError(rule_name)
 
             rule = self._available_rules.get(rule_name)
-            yield rule, rule_parameters
+            yield rule, rule.parse_parameters(rule_parameters)
 
     def _split_rules(self, rules: str) -> List[str]:
         return rules.split(self.config.RULE_DELIMITER)
 
-    def _rule_name(self, rule: str) -> str:
-        return self._split_rule(rule)[0]
-
-    def _rule_parameters(self, rule: str) -> List[str]:
-        if self.config.RULE_PARAM_DELIMITER not in rule:
-            return []
-
-        rule_name, parameters = self._split_rule(rule)
-
-        if rule_name in [rls.RegexRule.name]:
-            return [parameters]
-
-        return parameters.split(self.config.RULE_PARAMS_DELIMITER)
-
-    def _split_rule(self, rule: str) -> List[str]:
-        return rule.split(self.config.RULE_PARAM_DELIMITER, 1)
+    def _validate_data_type(self):
+        if isinstance(self.data, dict):
+            return
 
-    def _convert_data_to_dict(self):
-        if not isinstance(self.data, dict):
-            try:
-                self.data = self.data.__dict__
-            except AttributeError:
-                raise InvalidDataError(type(self.data))
+        # Other data is read by the adapter for its type, without converting
+        # it to a dict. Objects need attributes to read fields from.
+        adapter = adapter_for(type(self.data))
+        if isinstance(adapter, (SequenceAdapter, ScalarAdapter)) or (
+            isinstance(adapter, AttributeAdapter)
+            and not hasattr(self.data, "__dict__")
+            and not hasattr(self.data, "__slots__")
+        ):
+            raise InvalidDataError(type(self.data))
 
     def _validate_rules_type(self):
         if not isinstance(self.rules, dict):
@@ -261,26 +895,43 @@ class Validator:
     def _contains_wildcard(self, value) -> bool:
         return self.config.FIELD_WILD_CARD in value
 
-    def _is_validatable(self, field: str, rule: rls.Rule) -> bool:
-        return self._field_is_present(field) or rule.implicit
+    def _is_key_field(self, field: str) -> bool:
+        key_wild_card = self.config.FIELD_KEY_WILD_CARD
 
-    def _field_is_present(self, field: str) -> bool:
-        return self._get_field_value(field) is not None
+        return field == key_wild_card or field.endswith(
+            self.config.FIELD_DELIMITER + key_wild_card
+        )
+
+    def _add_error(
+        self,
+        rule: rls.Rule,
+        field: str,
+        value: Any,
+        parameters: Any,
+        index: Optional[int] = None,
+    ):
+        if index is None:
+            error, fields = rule.error(field, value, parameters, self)
+        else:
+            # Errors of bulk rules are created for the failed item by index
+            error, fields = rule.bulk_error(index, field, value, parameters, self)
+        field = self.full_field(fields.get(self.config.FIELD_KEY))
+        error = self._create_error(rule, error, fields)
 
-    def _add_error(self, rule: rls.Rule):
-        field = rule.message_fields.get(self.config.FIELD_KEY)
-        error = self._create_error(rule)
+        if self._stream is not None:
+            self._stream.append(FieldError(field, rule.name, error))
+            return
 
         if field in self.output:
             self.output.get(field).append(error)
         else:
             self.output[field] = [error]
 
-    def _create_error(self, rule: rls.Rule):
-        error = rule.message
-        fields = rule.message_fields
-        field = fields.get(self.config.FIELD_KEY)
-        field = self._convert_field_to_wildcard_field(field)
+    def _create_error(self, rule: rls.Rule, error: str, fields: dict):
+        fields = dict(fields)
+        field = self.full_field(fields.get(self.config.FIELD_KEY))
+        fields[self.config.FIELD_KEY] = field
+        field = self._wildcard_field(field)
         combined_field = field + self.config.FIELD_DELIMITER + rule.name
 
         # Overwrite values
@@ -305,6 +956,8 @@ class Validator:
 
             # Values
             if isinstance(new_values, list):
+                # Copy, so the rule parameters aren't overwritten
+                fields[key] = new_values = list(new_values)
                 # Field
                 self._overwrite_values_in_list(
                     fields, new_values, field_overwrite_values, key
@@ -359,6 +1012,22 @@ class Validator:
 
         return fields
 
+    def _wildcard_field(self, field: str) -> str:
+        # Fields of the wildcard pattern that is being validated are converted
+        # back to the pattern, so keys of mappings are replaced as well
+        pattern = self._pattern
+        if pattern is not None and (
+            self._contains_wildcard(pattern) or self._is_key_field(pattern)
+        ):
+            pattern = self.full_field(pattern)
+            wildcard_pattern = pattern.replace(
+                self.config.FIELD_KEY_WILD_CARD, self.config.FIELD_WILD_CARD
+            )
+            if matches(wildcard_pattern, field):
+                return self._convert_field_to_wildcard_field(pattern)
+
+        return self._convert_field_to_wildcard_field(field)
+
     def _convert_field_to_wildcard_field(self, field) -> str:
         split_fields = str(field).split(self.config.FIELD_DELIMITER)
         for index, field in enumerate(split_fields):
@@ -375,14 +1044,99 @@ class Validator:
     def _get_field_value(self, field) -> Any:
         return get_field_value(self.data, field)
 
-    def field_rules(self, field: str) -> List[str]:
-        rules = self.rules.get(field)
+    def _reset_lookups(self):
+        self._values = {}
+        self._strings = {}
+        self._conditions = {}
+        self._current = (None, _MISSING)
+
+    def _lookup(self, field: str) -> Any:
+        current_field, value = self._current
+        if field == current_field:
+            return value
+
+        # Values are looked up once per validation, missing fields included
+        value = self._values.get(field, _NOT_LOOKED_UP)
+
+        if value is _NOT_LOOKED_UP:
+            try:
+                value = _get_field_value(self.data, field)
+            except FieldValueNotFoundError:
+                value = _MISSING
+            self._values[field] = value
+
+        return value
+
+    def field_value(self, field: str) -> Any:
+        """
+        Returns the value of a field in the data that is being validated, or
+        None if the field is missing. Each field is looked up once per
+        validation, which makes this the preferred way for rules to read
+        other fields.
+        """
+        value = self._lookup(field)
+
+        return None if value is _MISSING else value
+
+    def field_missing(self, field: str) -> bool:
+        """Checks if the field is missing from the data that is being validated"""
+        return self._lookup(field) is _MISSING
+
+    def field_empty(self, field: str) -> bool:
+        """Checks if the field is missing or empty"""
+        value = self._lookup(field)
+
+        return value is _MISSING or empty(value)
+
+    def field_equals(self, field: str, value: Any) -> bool:
+        """
+        Checks if the value of the field equals the given value when both are
+        converted to strings, like `utils.equal`. The string of the field is
+        created once per validation.
+        """
+        string = self._strings.get(field)
+
+        if string is None:
+            string = str(self.field_value(field))
+            self._strings[field] = string
+
+        return string == str(value)
+
+    def condition_holds(self, condition: Condition) -> bool:
+        """
+        Checks if the condition holds for the data that is being validated.
+        Each condition is evaluated once per validation, and is shared by
+        all rules with the same condition.
+        """
+        holds = self._conditions.get(condition)
+
+        if holds is None:
+            holds = self.field_equals(condition.field, condition.value)
+            self._conditions[condition] = holds
+
+        return holds
+
+    def field_rules(self, field: str, rules: Rules = None) -> List[str]:
+        rules = (self.rules if rules is None else rules).get(field)
 
         if isinstance(rules, list):
             return rules
 
         return self._split_rules(rules)
 
+    def resolved_field_rules(self, field: str) -> List[Tuple[rls.Rule, Any]]:
+        """
+        Returns the rule objects and parameters of a field in the rules that
+        are being validated, resolved once like the rules of validated fields.
+        Fields without rules and groups (see `when()`) have no rules.
+        """
+        rules = self.rules.get(field)
+
+        if rules is None or isinstance(rules, RuleGroup):
+            return []
+
+        return self._resolve_rules(rules, isinstance(self.rules, Schema))
+
     @staticmethod
     def valid_email(value: Any) -> bool:
         return rls.EmailRule.valid_email(value)
@@ -442,3 +1196,26 @@ class Validator:
     @staticmethod
     def valid_date_time(value: Any, date_time_format: str = None) -> bool:
         return rls.DateTimeRule.valid_date_time(value, date_time_format)
+
+
+class _PendingBulk:
+    """
+    Items of a field that still need to be validated with bulk rules, and the
+    record they belong to.
+    """
+
+    __slots__ = ("data", "output", "pattern", "rules", "items")
+
+    def __init__(
+        self,
+        data: Data,
+        output: dict,
+        pattern: str,
+        rules: List[Tuple[rls.Rule, Any]],
+        items: List[Tuple[str, Any]],
+    ):
+        self.data = data
+        self.output = output
+        self.pattern = pattern
+        self.rules = rules
+        self.items = items
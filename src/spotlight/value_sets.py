@@ -0,0 +1,106 @@
+import mmap
+import os
+from threading import Lock
+from typing import Any, Dict, Iterable
+
+ENCODING = "utf-8"
+LINE_DELIMITER = b"\n"
+
+
+class SortedFileValueSet:
+    """
+    Read-only set of values stored in a sorted, newline delimited file.
+
+    The file is memory-mapped instead of being loaded into memory, so the
+    pages are shared through the OS page cache by every process that maps the
+    same file (including forked workers). Membership tests use a binary search
+    over the mapped bytes and run in O(log n).
+
+    Parameters
+    ----------
+    path : str
+        Path to a file containing one value per line, sorted by their UTF-8
+        encoded bytes. Use `write_sorted_values` to create such a file.
+    """
+
+    _open_sets: Dict[str, "SortedFileValueSet"] = {}
+    _lock = Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._size = os.fstat(self._file.fileno()).st_size
+        self._map = None
+
+        # Empty files can't be memory-mapped
+        if self._size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @classmethod
+    def open(cls, path: str) -> "SortedFileValueSet":
+        """
+        Returns the value set for the given path, mapping the file only once
+        per process. Call this before forking workers to share the mapping.
+        """
+        path = os.path.abspath(path)
+        value_set = cls._open_sets.get(path)
+
+        if value_set is None:
+            with cls._lock:
+                value_set = cls._open_sets.get(path)
+                if value_set is None:
+                    value_set = cls(path)
+                    cls._open_sets[path] = value_set
+
+        return value_set
+
+    def __contains__(self, value: Any) -> bool:
+        key = str(value).encode(ENCODING)
+
+        if self._map is None or LINE_DELIMITER in key:
+            return False
+
+        data = self._map
+        # The search window [low, high) always starts and ends on a line
+        # boundary.
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            start = data.rfind(LINE_DELIMITER, low, middle) + 1 or low
+            end = data.find(LINE_DELIMITER, start, high)
+            if end == -1:
+                end = high
+
+            line = data[start:end]
+            if line == key:
+                return True
+            elif line < key:
+                low = end + 1
+            else:
+                high = start
+
+        return False
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        self._open_sets.pop(self.path, None)
+
+
+def write_sorted_values(values: Iterable[Any], path: str):
+    """
+    Writes values to a file that can be used by `SortedFileValueSet`. Values
+    are converted to strings, deduplicated and sorted by their encoded bytes.
+    """
+    lines = sorted({str(value).encode(ENCODING) for value in values})
+
+    with open(path, "wb") as f:
+        for line in lines:
+            if line and LINE_DELIMITER not in line:
+                f.write(line + LINE_DELIMITER)
@@ -0,0 +1,179 @@
+from collections import namedtuple
+
+import pytest
+
+from src.spotlight import adapters
+from src.spotlight.adapters import (
+    Adapter,
+    adapter_for,
+    register_adapter,
+    MAPPING,
+    SEQUENCE,
+    ATTRIBUTE,
+    DATACLASS,
+    NAMED_TUPLE,
+    SCALAR,
+)
+from src.spotlight.errors import REQUIRED_ERROR, EMAIL_ERROR
+from src.spotlight.exceptions import InvalidDataError
+from .validator_test import ValidatorTest
+
+try:
+    from dataclasses import dataclass
+except ImportError:  # Python 3.6
+    dataclass = None
+
+requires_dataclasses = pytest.mark.skipif(
+    dataclass is None, reason="dataclasses require Python 3.7"
+)
+
+Point = namedtuple("Point", ["x", "y"])
+
+if dataclass is not None:
+
+    @dataclass
+    class Address:
+        street: str
+        number: int
+
+        @property
+        def line(self) -> str:
+            return f"{self.street} {self.number}"
+
+
+class Person:
+    __slots__ = ("email", "address")
+
+    def __init__(self, email, address):
+        self.email = email
+        self.address = address
+
+
+class Account:
+    kind = "user"
+
+    def __init__(self, name):
+        self.name = name
+
+    @property
+    def title(self) -> str:
+        return self.name.title()
+
+    def close(self):
+        pass
+
+
+class Record:
+    """Object that stores its fields in a private dict"""
+
+    def __init__(self, **fields):
+        self._fields = fields
+
+
+class RecordAdapter(Adapter):
+    def get(self, value, key):
+        return value._fields[key]
+
+    def keys(self, value):
+        return value._fields.keys()
+
+
+class AdapterForTest(ValidatorTest):
+    def test_adapter_for_expect_adapter_per_type(self):
+        self.assertIs(adapter_for(dict), MAPPING)
+        self.assertIs(adapter_for(list), SEQUENCE)
+        self.assertIs(adapter_for(Point), NAMED_TUPLE)
+        self.assertIs(adapter_for(Person), ATTRIBUTE)
+        self.assertIs(adapter_for(str), SCALAR)
+        self.assertIs(adapter_for(int), SCALAR)
+
+    @requires_dataclasses
+    def test_adapter_for_dataclass_expect_dataclass_adapter(self):
+        self.assertIs(adapter_for(Address), DATACLASS)
+        self.assertEqual(list(DATACLASS.keys(Address("Main", 1))), ["street", "number"])
+
+    def test_adapter_for_expect_cached(self):
+        adapter_for(Person)
+
+        self.assertIs(adapters._type_adapters[Person], ATTRIBUTE)
+
+    def test_keys_expect_field_names(self):
+        self.assertEqual(list(NAMED_TUPLE.keys(Point(1, 2))), ["x", "y"])
+        self.assertEqual(ATTRIBUTE.keys(Person("a", None)), ["email", "address"])
+        self.assertEqual(SEQUENCE.keys([1, 2]), ["0", "1"])
+
+
+class AdapterValidationTest(ValidatorTest):
+    def test_named_tuple_expect_fields_by_name_and_index(self):
+        rules = {"point.x": "integer", "point.1": "integer"}
+        data = {"point": Point(1, 2)}
+
+        self.assertEqual(self.validator.validate(data, rules), {})
+
+    def test_dict_with_int_keys_expect_fields_by_number(self):
+        rules = {"m.1": "required", "m.2": "required"}
+        data = {"m": {1: "x", "2": "y"}}
+
+        self.assertEqual(self.validator.validate(data, rules), {})
+        self.assertEqual(self.validator.compile(rules)(data), {})
+        self.assertEqual(
+            self.validator.validate({"m": {}}, {"m.1": "required"}),
+            {"m.1": [REQUIRED_ERROR.format(field="m.1")]},
+        )
+
+    def test_named_tuple_data_expect_error(self):
+        rules = {"x": "required", "z": "required"}
+
+        errors = self.validator.validate(Point(1, 2), rules)
+
+        self.assertEqual(errors, {"z": [REQUIRED_ERROR.format(field="z")]})
+
+    @requires_dataclasses
+    def test_dataclass_property_expect_no_error(self):
+        rules = {"line": "required|string", "street": "required"}
+
+        self.assertEqual(self.validator.validate(Address("Main", 1), rules), {})
+
+    @requires_dataclasses
+    def test_nested_slots_object_expect_error(self):
+        rules = {"person.email": "email", "person.address.number": "integer"}
+        data = {"person": Person("john.doe@", Address("Main", 1))}
+        field = "person.email"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [EMAIL_ERROR.format(field=field)]})
+
+    def test_object_expect_only_instance_attributes_and_properties(self):
+        rules = {f: "required" for f in ["name", "title", "kind", "close"]}
+
+        errors = self.validator.validate(Account("john"), rules)
+
+        self.assertEqual(
+            errors,
+            {f: [REQUIRED_ERROR.format(field=f)] for f in ["kind", "close"]},
+        )
+
+    def test_scalar_attributes_expect_error(self):
+        rules = {"n.real": "required", "name.upper": "required"}
+
+        errors = self.validator.validate({"n": 1, "name": "a"}, rules)
+
+        self.assertEqual(
+            errors,
+            {f: [REQUIRED_ERROR.format(field=f)] for f in ["n.real", "name.upper"]},
+        )
+
+    def test_registered_adapter_expect_fields_read_by_adapter(self):
+        register_adapter(Record, RecordAdapter())
+        rules = {"email": "required|email", "name": "required"}
+        data = Record(email="john.doe@", name="John")
+        field = "email"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [EMAIL_ERROR.format(field=field)]})
+
+    def test_data_without_attributes_expect_error(self):
+        with pytest.raises(InvalidDataError):
+            self.validator.validate(data=1, rules={})
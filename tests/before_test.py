@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, date
+from unittest import mock
 
+from src.spotlight import Schema, Validator, when
 from src.spotlight.errors import BEFORE_ERROR, DATE_TIME_ERROR
 from .validator_test import ValidatorTest
 
@@ -104,6 +106,32 @@ class BeforeTest(ValidatorTest):
 
         self.assertEqual(errs[0], expected)
 
+    def test_before_rule_with_schema_expect_other_rules_resolved_once(self):
+        validator = Validator()
+        rules = Schema(
+            {"start_time": "date_time|before:end_time", "end_time": "date_time"}
+        )
+        data = {"start_time": "2019-08-24 16:28:00", "end_time": "invalid"}
+        validator.validate(data, rules)
+
+        with mock.patch.object(
+            validator, "rule_iterator", wraps=validator.rule_iterator
+        ) as rule_iterator:
+            validator.validate(data, rules)
+
+        self.assertEqual(rule_iterator.call_count, 0)
+
+    def test_before_rule_with_other_field_group_expect_no_error(self):
+        rules = {
+            "start_time": "date_time|before:end_time",
+            "end_time": when("type", "event", {"timezone": "string"}),
+        }
+        data = {"start_time": "2019-08-24 16:28:00", "end_time": "2019-08-24 16:48:00"}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {})
+
     def test_before_rule_with_format_value_expect_no_error(self):
         rules = {"start_time": "date_time:%H:%M:%S|before:12:00:00"}
         data = {"start_time": "11:59:59"}
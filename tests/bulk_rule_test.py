@@ -0,0 +1,170 @@
+from typing import Any, Iterable, List, Tuple
+
+from src.spotlight import Validator, rule
+from src.spotlight.rules import Rule
+from .validator_test import ValidatorTest
+
+
+class EvenRule(Rule):
+    """Bulk rule that checks if all values are even"""
+
+    name = "even"
+    bulk = True
+    batches = []
+
+    def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        return value % 2 == 0
+
+    def passes_bulk(
+        self, items: List[Tuple[str, Any]], parameters: List[str], validator
+    ) -> Iterable[int]:
+        EvenRule.batches.append([field for field, _ in items])
+
+        return [index for index, (_, value) in enumerate(items) if value % 2]
+
+    @property
+    def message(self) -> str:
+        return "The {field} field must be even."
+
+
+class BulkRuleTest(ValidatorTest):
+    def setUp(self):
+        EvenRule.batches = []
+        self.batches = []
+        self.catalogue = {1, 2, 3}
+
+        @rule(bulk=True)
+        def in_catalogue(items, **_):
+            self.batches.append(items)
+
+            return {
+                index: f"Product {value} of {field} doesn't exist."
+                for index, (field, value) in enumerate(items)
+                if value not in self.catalogue
+            }
+
+        self.in_catalogue = in_catalogue
+
+    def test_wildcard_field_expect_one_call_with_all_items(self):
+        data = {"items": [{"id": 1}, {"id": 4}, {"id": 3}, {"id": 5}]}
+        rules = {"items.*.id": ["required", self.in_catalogue]}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(
+            self.batches,
+            [
+                [
+                    ("items.0.id", 1),
+                    ("items.1.id", 4),
+                    ("items.2.id", 3),
+                    ("items.3.id", 5),
+                ]
+            ],
+        )
+        self.assertEqual(
+            errors,
+            {
+                "items.1.id": ["Product 4 of items.1.id doesn't exist."],
+                "items.3.id": ["Product 5 of items.3.id doesn't exist."],
+            },
+        )
+
+    def test_field_without_wildcard_expect_one_item(self):
+        errors = self.validator.validate({"id": 4}, {"id": [self.in_catalogue]})
+
+        self.assertEqual(self.batches, [[("id", 4)]])
+        self.assertEqual(errors, {"id": ["Product 4 of id doesn't exist."]})
+
+    def test_failed_stop_rule_expect_item_left_out(self):
+        @rule(stop=True)
+        def integer(value, **_):
+            if not isinstance(value, int):
+                return "Not an integer."
+
+        data = {"items": [1, "a", None, 4]}
+        rules = {"items.*": [self.in_catalogue, integer]}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(self.batches, [[("items.0", 1), ("items.3", 4)]])
+        self.assertEqual(
+            errors,
+            {
+                "items.1": ["Not an integer."],
+                "items.3": ["Product 4 of items.3 doesn't exist."],
+            },
+        )
+
+    def test_all_items_filtered_expect_no_call(self):
+        self.validator.validate({"items": [None]}, {"items.*": [self.in_catalogue]})
+
+        self.assertEqual(self.batches, [])
+
+    def test_bulk_rule_class_expect_passes_bulk_called(self):
+        validator = Validator()
+        validator.register_rule(EvenRule())
+        data = {"items": {"a": 2, "b": 3}}
+
+        errors = validator.validate(data, {"items.*": "even"})
+
+        self.assertEqual(EvenRule.batches, [["items.a", "items.b"]])
+        self.assertEqual(errors, {"items.b": ["The items.b field must be even."]})
+
+    def test_key_field_expect_keys_validated_at_once(self):
+        data = {"stock": {1: "a", 7: "b"}}
+
+        errors = self.validator.validate(data, {"stock.{key}": [self.in_catalogue]})
+
+        self.assertEqual(self.batches, [[("stock.1", 1), ("stock.7", 7)]])
+        self.assertEqual(errors, {"stock.7": ["Product 7 of stock.7 doesn't exist."]})
+
+    def test_compiled_rules_expect_same_errors(self):
+        data = {"id": 5, "items": [{"id": 1}, {"id": 4}]}
+        rules = {"id": [self.in_catalogue], "items.*.id": [self.in_catalogue]}
+        validate = self.validator.compile(rules)
+
+        self.assertEqual(validate(data), self.validator.validate(data, rules))
+
+    def test_validate_many_expect_one_call_for_all_records(self):
+        records = [{"items": [1, 4]}, {"items": [5]}, {"items": []}]
+        rules = {"items.*": [self.in_catalogue]}
+
+        errors = self.validator.validate_many(records, rules)
+
+        self.assertEqual(
+            self.batches, [[("items.0", 1), ("items.1", 4), ("items.0", 5)]]
+        )
+        self.assertEqual(
+            errors,
+            [
+                {"items.1": ["Product 4 of items.1 doesn't exist."]},
+                {"items.0": ["Product 5 of items.0 doesn't exist."]},
+                {},
+            ],
+        )
+
+    def test_validate_many_expect_same_errors_as_validate(self):
+        records = [{"id": "a", "items": [4, None]}, {"items": [1]}, {"id": 1}]
+        rules = {"id": "required|integer", "items.*": ["integer", self.in_catalogue]}
+
+        errors = self.validator.validate_many(records, rules, flat=True)
+
+        self.assertEqual(
+            errors,
+            [self.validator.validate(data, rules, flat=True) for data in records],
+        )
+
+    def test_validate_many_with_same_field_and_value_expect_message_per_record(self):
+        @rule(bulk=True)
+        def numbered(items, **_):
+            return {index: f"Item {index} is invalid." for index in range(len(items))}
+
+        records = [{"items": [7]}, {"items": [7]}]
+
+        errors = self.validator.validate_many(records, {"items.*": [numbered]})
+
+        self.assertEqual(
+            errors,
+            [{"items.0": ["Item 0 is invalid."]}, {"items.0": ["Item 1 is invalid."]}],
+        )
@@ -0,0 +1,182 @@
+import io
+import json
+import os
+import pickle
+import tempfile
+from unittest import mock
+
+from src.spotlight import Schema, Validator, cli
+from src.spotlight.errors import EMAIL_ERROR, INTEGER_ERROR, REQUIRED_ERROR
+from .validator_test import ValidatorTest
+
+
+class CliTest(ValidatorTest):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.rules = self.write(
+            "rules.json", json.dumps({"email": "required|email", "items.*": "integer"})
+        )
+        self.jsonl = self.write(
+            "data.jsonl",
+            '{"email": "a", "items": [1, "b"]}\n\n{"email": "john@example.com"}\n',
+        )
+        self.csv = self.write("data.csv", "email,name\n,John\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+
+        return path
+
+    def run_cli(self, *args: str):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with mock.patch("sys.stdout", stdout), mock.patch("sys.stderr", stderr):
+            code = cli.main([self.rules, *args])
+
+        errors = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        return code, errors, stderr.getvalue()
+
+    def test_errors_expect_json_lines_with_position(self):
+        code, errors, _ = self.run_cli(self.jsonl, self.csv)
+
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            errors,
+            [
+                {
+                    "file": self.jsonl,
+                    "record": 1,
+                    "field": "email",
+                    "rule": "email",
+                    "message": EMAIL_ERROR.format(field="email"),
+                },
+                {
+                    "file": self.jsonl,
+                    "record": 1,
+                    "field": "items.1",
+                    "rule": "integer",
+                    "message": INTEGER_ERROR.format(field="items.1"),
+                },
+                {
+                    "file": self.csv,
+                    "record": 1,
+                    "field": "email",
+                    "rule": "required",
+                    "message": REQUIRED_ERROR.format(field="email"),
+                },
+            ],
+        )
+
+    def test_valid_records_expect_exit_code_zero(self):
+        path = self.write("valid.json", json.dumps([{"email": "john@example.com"}]))
+
+        code, errors, report = self.run_cli(path)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(errors, [])
+        self.assertIn("Validated 1 records", report)
+
+    def test_report_expect_counts_per_rule_and_wildcard_field(self):
+        _, _, report = self.run_cli(self.jsonl, self.csv)
+
+        self.assertIn("Errors: 3\n", report)
+        self.assertIn("  integer: 1\n", report)
+        self.assertIn("  items.*: 1\n", report)
+        self.assertIn("records/s", report)
+
+    def test_workers_expect_same_errors(self):
+        expected = self.run_cli(self.jsonl, self.csv)[1]
+
+        code, errors, _ = self.run_cli(
+            self.jsonl, self.csv, "--workers", "2", "--chunk-size", "1"
+        )
+
+        self.assertEqual(code, 1)
+        self.assertEqual(errors, expected)
+
+    def test_validate_chunk_expect_pickle_loaded_once_per_worker(self):
+        state = pickle.dumps((Validator(), Schema({"id": "integer"})))
+
+        with mock.patch.object(cli.pickle, "loads", wraps=pickle.loads) as loads:
+            first = cli._validate_chunk(state, [{"id": 1}])
+            second = cli._validate_chunk(state, [{"id": "a"}])
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(first, ([[]], None))
+        self.assertEqual(
+            second, ([[("id", "integer", INTEGER_ERROR.format(field="id"))]], None)
+        )
+
+    def test_record_after_blank_line_expect_record_number(self):
+        path = self.write("blank.jsonl", '{"email": "a@b.nl"}\n\n{"email": "a"}\n')
+
+        _, errors, _ = self.run_cli(path)
+
+        self.assertEqual([error["record"] for error in errors], [2])
+
+    def test_record_of_json_file_expect_record_number(self):
+        path = self.write("data.json", json.dumps([{"email": "a"}]))
+
+        _, errors, _ = self.run_cli(path)
+
+        self.assertEqual([error["record"] for error in errors], [1])
+
+    def test_invalid_record_type_with_workers_expect_failing_record(self):
+        path = self.write(
+            "records.jsonl", '{"email": "a@b.nl"}\n{"email": "a"}\n[1]\n{}\n'
+        )
+
+        for options in [[], ["--workers", "2", "--chunk-size", "4"]]:
+            code, _, report = self.run_cli(path, *options)
+
+            self.assertEqual(code, 2)
+            self.assertIn(f"{path}:3: expected 'dict'", report)
+            self.assertIn("got '<class 'list'>'", report)
+
+    def test_output_expect_errors_written_to_file(self):
+        output = os.path.join(self.directory.name, "errors.jsonl")
+
+        _, errors, _ = self.run_cli(self.jsonl, "--output", output)
+
+        with open(output) as file:
+            self.assertEqual(len(file.readlines()), 2)
+        self.assertEqual(errors, [])
+
+    def test_schema_expect_named_rules_used(self):
+        self.rules = self.write(
+            "schemas.json", json.dumps({"user": {"id": "required"}})
+        )
+
+        _, errors, _ = self.run_cli(self.csv, "--schema", "user")
+
+        self.assertEqual([error["field"] for error in errors], ["id"])
+
+    def test_unknown_schema_expect_exit_code_two(self):
+        self.rules = self.write(
+            "schemas.json", json.dumps({"user": {"id": "required"}})
+        )
+
+        code, _, report = self.run_cli(self.csv, "--schema", "order")
+
+        self.assertEqual(code, 2)
+        self.assertIn("the schema 'order' does not exist", report)
+
+    def test_invalid_record_expect_exit_code_two(self):
+        path = self.write("invalid.jsonl", '{"email": "a"}\n{"email"\n')
+
+        code, _, report = self.run_cli(path)
+
+        self.assertEqual(code, 2)
+        self.assertIn(f"{path}:2: invalid JSON", report)
+
+    def test_unsupported_format_expect_exit_code_two(self):
+        path = self.write("data.xml", "<data/>")
+
+        code, _, _ = self.run_cli(path)
+
+        self.assertEqual(code, 2)
@@ -0,0 +1,102 @@
+from array import array
+from collections import OrderedDict
+from types import MappingProxyType
+
+from src.spotlight.errors import (
+    LIST_ERROR,
+    DICT_ERROR,
+    REQUIRED_ERROR,
+    MIN_ITEMS_ERROR,
+    MAX_ITEMS_ERROR,
+    SIZE_ERROR,
+    INTEGER_ERROR,
+)
+from .validator_test import ValidatorTest
+
+
+class MappingTest(ValidatorTest):
+    def test_mapping_proxy_data_expect_no_error(self):
+        rules = {"user.email": "required|email", "user": "dict|size:1"}
+        data = MappingProxyType({"user": MappingProxyType({"email": "a@b.co"})})
+
+        self.assertEqual(self.validator.validate(data, rules), {})
+
+    def test_empty_mapping_with_required_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "required"}
+        data = {"test": MappingProxyType({})}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [REQUIRED_ERROR.format(field=field)]})
+
+    def test_ordered_dict_with_max_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "dict|max:1"}
+        data = {"test": OrderedDict(a=1, b=2)}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [MAX_ITEMS_ERROR.format(field=field, max=1)]})
+
+    def test_sequence_with_dict_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "dict"}
+        data = {"test": (1, 2)}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [DICT_ERROR.format(field=field)]})
+
+
+class SequenceTest(ValidatorTest):
+    def test_tuple_with_list_rule_expect_no_error(self):
+        rules = {"test": "list|min:2"}
+        data = {"test": (1, 2)}
+
+        self.assertEqual(self.validator.validate(data, rules), {})
+
+    def test_string_with_list_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "list"}
+
+        for value in ["ab", b"ab"]:
+            errors = self.validator.validate({"test": value}, rules)
+
+            self.assertEqual(errors, {field: [LIST_ERROR.format(field=field)]})
+
+    def test_array_with_min_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "list|min:3"}
+        data = {"test": array("i", [1, 2])}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [MIN_ITEMS_ERROR.format(field=field, min=3)]})
+
+    def test_tuple_with_size_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "size:3"}
+        data = {"test": (1, 2)}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [SIZE_ERROR.format(field=field, size=3)]})
+
+    def test_empty_tuple_with_required_rule_expect_error(self):
+        field = "test"
+        rules = {"test": "required"}
+        data = {"test": ()}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [REQUIRED_ERROR.format(field=field)]})
+
+    def test_wildcard_over_tuple_expect_errors(self):
+        rules = {"items.*.id": "integer", "numbers.*": "integer"}
+        data = {"items": ({"id": 1}, {"id": "a"}), "numbers": array("i", [1, 2])}
+        field = "items.1.id"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [INTEGER_ERROR.format(field=field)]})
@@ -0,0 +1,141 @@
+from src.spotlight.errors import EMAIL_ERROR, REQUIRED_ERROR
+from src.spotlight.exceptions import RuleNotFoundError, InvalidRulesError
+from .object_input_test import CustomData
+from .validator_test import ValidatorTest
+
+
+class CompilerTest(ValidatorTest):
+    def setUp(self):
+        self.validator.overwrite_messages = {}
+        self.validator.overwrite_fields = {}
+        self.validator.overwrite_values = {}
+        self.rules = {
+            "id": "required|integer",
+            "email": "required|email",
+            "name": "required|string|min:2|max:5",
+            "type": "in:a,b",
+            "code": "regex:^[a-z,]+$",
+            "url": "url",
+            "prefix": "starts_with:ab,cd|ends_with:yz",
+            "accepted": "accepted",
+            "alpha": "alpha_num|alpha_num_space",
+            "flags": "list|size:2",
+            "meta": "dict|filled",
+            "amount": "float|decimal|boolean",
+            "company": "required_if:type,b",
+            "nested.field": "required|string",
+            "list.*.name": "required|string",
+            "1": "integer",
+            "callable": [lambda value, **_: "Too small." if value < 2 else None],
+        }
+        self.data = [
+            {},
+            {
+                "id": 1,
+                "email": "john.doe@example.com",
+                "name": "John",
+                "type": "a",
+                "code": "abc,def",
+                "url": "https://example.com",
+                "prefix": "abxyz",
+                "accepted": "yes",
+                "alpha": "abc123",
+                "flags": [1, 2],
+                "meta": {"a": 1},
+                "amount": 1.0,
+                "nested": {"field": "test"},
+                "list": [{"name": "test"}],
+                "1": 1,
+                "callable": 3,
+            },
+            {
+                "id": "1",
+                "email": "john.doe@",
+                "name": "J",
+                "type": "b",
+                "code": "ABC",
+                "url": "example",
+                "prefix": "xxx",
+                "accepted": "no",
+                "alpha": "abc 123",
+                "flags": [1],
+                "meta": {},
+                "amount": "1",
+                "nested": {"field": 1},
+                "list": [{"name": 1}, {}],
+                "1": "1",
+                "callable": 1,
+            },
+            {"name": "Johnny", "email": 1, "alpha": "a-b", "nested": "test"},
+        ]
+
+    def test_compiled_rules_expect_same_errors_as_validate(self):
+        validate = self.validator.compile(self.rules)
+
+        for data in self.data:
+            expected = self.validator.validate(data, self.rules)
+            errors = validate(data)
+
+            self.assertEqual(errors, expected)
+
+    def test_compiled_rules_with_flat_expect_same_errors_as_validate(self):
+        validate = self.validator.compile(self.rules)
+
+        for data in self.data:
+            expected = self.validator.validate(data, self.rules, flat=True)
+            errors = validate(data, flat=True)
+
+            self.assertEqual(errors, expected)
+
+    def test_compiled_rules_with_custom_messages_expect_same_errors_as_validate(self):
+        self.validator.overwrite_messages = {"email": "Invalid email!"}
+        self.validator.overwrite_fields = {"name": "full name"}
+        self.validator.overwrite_values = {"type": {"b": "business"}}
+        validate = self.validator.compile(self.rules)
+
+        for data in self.data:
+            expected = self.validator.validate(data, self.rules)
+            errors = validate(data)
+
+            self.assertEqual(errors, expected)
+
+    def test_compiled_rules_after_wildcard_field_expect_same_errors_as_validate(self):
+        rules = {"prices.*.amount": "integer", "prices.sku.amount": "required"}
+        data = {"prices": {"a": {"amount": 1}}}
+        self.validator.overwrite_messages = {"prices.*.amount.required": "Wildcard"}
+        validate = self.validator.compile(rules)
+
+        expected = self.validator.validate(data, rules)
+        errors = validate(data)
+
+        self.assertEqual(errors, expected)
+        self.assertNotEqual(errors["prices.sku.amount"], ["Wildcard"])
+
+    def test_compiled_rules_with_object_input_expect_error(self):
+        rules = {"email": "required|email"}
+        expected = {"email": [EMAIL_ERROR.format(field="email")]}
+
+        errors = self.validator.compile(rules)(CustomData(email="john.doe@"))
+
+        self.assertEqual(errors, expected)
+
+    def test_compiled_rules_with_stop_rule_expect_one_error(self):
+        rules = {"email": "required|email"}
+        expected = {"email": [REQUIRED_ERROR.format(field="email")]}
+
+        errors = self.validator.compile(rules)({"email": ""})
+
+        self.assertEqual(errors, expected)
+
+    def test_compiled_rules_expect_generated_source(self):
+        validate = self.validator.compile({"id": "integer"})
+
+        self.assertIn("isinstance(value, int)", validate.source)
+
+    def test_compile_non_existent_rule_expect_rule_not_found_error(self):
+        with self.assertRaises(RuleNotFoundError):
+            self.validator.compile({"test": "not_a_rule"})
+
+    def test_compile_invalid_rules_type_expect_error(self):
+        with self.assertRaises(InvalidRulesError):
+            self.validator.compile([])
@@ -0,0 +1,63 @@
+from unittest import mock
+
+from src.spotlight.conditions import Condition
+from src.spotlight.errors import REQUIRED_IF_ERROR, PROHIBITED_UNLESS_ERROR
+from src.spotlight.parameters import ConditionParameters
+from src.spotlight.validator import Validator
+from .validator_test import ValidatorTest
+
+
+class ConditionTest(ValidatorTest):
+    def test_condition_of_expect_interned_condition(self):
+        condition = Condition.of("country", "US")
+
+        self.assertIs(Condition.of("country", "US"), condition)
+        self.assertIsNot(Condition.of("country", "NL"), condition)
+
+    def test_condition_of_with_non_string_value_expect_string_value(self):
+        self.assertIs(Condition.of("count", 1), Condition.of("count", "1"))
+
+    def test_resolved_rules_expect_shared_condition(self):
+        validator = Validator()
+        resolved = validator._resolve_rules(
+            "required_if:country,US|prohibited_unless:country,US"
+        )
+
+        (_, parameters1), (_, parameters2) = resolved
+        self.assertIsInstance(parameters1, ConditionParameters)
+        self.assertEqual(parameters1, ["country", "US"])
+        self.assertIs(parameters1.prepared, parameters2.prepared)
+
+    def test_shared_condition_expect_evaluated_once(self):
+        validator = Validator()
+        rules = {}
+        for i in range(10):
+            rules[f"state{i}"] = "required_if:country,US"
+            rules[f"province{i}"] = "prohibited_unless:country,NL"
+        data = {"country": "US", "province0": "Utrecht"}
+
+        with mock.patch.object(
+            validator, "field_equals", wraps=validator.field_equals
+        ) as field_equals:
+            errors = validator.validate(data, rules)
+
+        self.assertEqual(field_equals.call_count, 2)
+        self.assertEqual(len(errors), 11)
+        self.assertEqual(
+            errors["state0"],
+            [REQUIRED_IF_ERROR.format(field="state0", other="country", value="US")],
+        )
+        self.assertEqual(
+            errors["province0"],
+            [
+                PROHIBITED_UNLESS_ERROR.format(
+                    field="province0", other="country", value="NL"
+                )
+            ],
+        )
+
+    def test_condition_expect_evaluated_per_validation(self):
+        rules = {"state": "required_if:country,US"}
+
+        self.assertEqual(len(self.validator.validate({"country": "US"}, rules)), 1)
+        self.assertEqual(self.validator.validate({"country": "NL"}, rules), {})
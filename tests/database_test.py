@@ -0,0 +1,202 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, List, Set
+
+from src.spotlight import Validator
+from src.spotlight.database import (
+    ConnectionPool,
+    DatabasePlugin,
+    ExistenceCache,
+    SQLiteBackend,
+    quote_identifier,
+)
+from src.spotlight.errors import EXISTS_ERROR, UNIQUE_ERROR, INTEGER_ERROR
+from src.spotlight.rules import Rule
+from .validator_test import ValidatorTest
+
+
+class CountingBackend(SQLiteBackend):
+    """SQLite backend that records its lookups"""
+
+    def __init__(self, database: str, **kwargs):
+        super().__init__(database, **kwargs)
+        self.lookups = []
+
+    def existing(self, table: str, column: str, values: List[Any]) -> Set[Any]:
+        self.lookups.append((table, column, list(values)))
+
+        return super().existing(table, column, values)
+
+
+class DatabaseTest(ValidatorTest):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "test.db")
+        connection = sqlite3.connect(cls.path)
+        connection.execute("CREATE TABLE products (id INTEGER, sku TEXT)")
+        connection.execute("CREATE TABLE users (email TEXT)")
+        connection.executemany(
+            "INSERT INTO products VALUES (?, ?)", [(1, "A1"), (2, "B2"), (3, "C3")]
+        )
+        connection.execute("INSERT INTO users VALUES ('john@example.com')")
+        connection.commit()
+        connection.close()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.backend = CountingBackend(self.path)
+        self.validator = Validator(plugins=[DatabasePlugin(self.backend)])
+
+    def tearDown(self):
+        self.backend.close()
+
+    def test_exists_with_existing_value_expect_no_error(self):
+        errors = self.validator.validate({"id": 2}, {"id": "exists:products"})
+
+        self.assertEqual(errors, {})
+
+    def test_exists_with_missing_value_expect_error(self):
+        errors = self.validator.validate({"id": 4}, {"id": "exists:products"})
+
+        self.assertEqual(errors, {"id": [EXISTS_ERROR.format(field="id")]})
+
+    def test_exists_with_column_expect_column_used(self):
+        rules = {"product": "exists:products,sku"}
+
+        self.assertEqual(self.validator.validate({"product": "B2"}, rules), {})
+        self.assertEqual(self.backend.lookups, [("products", "sku", ["B2"])])
+
+    def test_exists_with_value_of_other_type_expect_no_error(self):
+        errors = self.validator.validate({"id": "3"}, {"id": "exists:products"})
+
+        self.assertEqual(errors, {})
+
+    def test_exists_with_unsupported_value_expect_error_without_lookup(self):
+        errors = self.validator.validate({"id": [1]}, {"id": "exists:products"})
+
+        self.assertEqual(errors, {"id": [EXISTS_ERROR.format(field="id")]})
+        self.assertEqual(self.backend.lookups, [])
+
+    def test_unique_expect_error_for_existing_value(self):
+        rules = {"email": "unique:users"}
+
+        self.assertEqual(
+            self.validator.validate({"email": "john@example.com"}, rules),
+            {"email": [UNIQUE_ERROR.format(field="email")]},
+        )
+        self.assertEqual(
+            self.validator.validate({"email": "jane@example.com"}, rules), {}
+        )
+
+    def test_wildcard_field_expect_one_lookup(self):
+        data = {"items": [{"id": 1}, {"id": 5}, {"id": 3}, {"id": "a"}]}
+        rules = {"items.*.id": "required|integer|exists:products"}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(self.backend.lookups, [("products", "id", [1, 5, 3, "a"])])
+        self.assertEqual(
+            errors,
+            {
+                "items.1.id": [EXISTS_ERROR.format(field="items.1.id")],
+                "items.3.id": [
+                    INTEGER_ERROR.format(field="items.3.id"),
+                    EXISTS_ERROR.format(field="items.3.id"),
+                ],
+            },
+        )
+
+    def test_validate_many_expect_one_lookup_for_all_records(self):
+        records = [{"id": 1, "email": "jane@example.com"}, {"id": 7}, {"id": 1}]
+        rules = {"id": "exists:products", "email": "unique:users"}
+
+        errors = self.validator.validate_many(records, rules)
+
+        self.assertEqual(
+            self.backend.lookups,
+            [("products", "id", [1, 7]), ("users", "email", ["jane@example.com"])],
+        )
+        self.assertEqual(errors, [{}, {"id": [EXISTS_ERROR.format(field="id")]}, {}])
+
+    def test_ttl_cache_expect_found_values_not_looked_up_again(self):
+        validator = Validator(plugins=[DatabasePlugin(self.backend, ttl=60)])
+        rules = {"items.*": "exists:products,id"}
+
+        validator.validate({"items": [1, 9]}, rules)
+        validator.validate({"items": [1, 9, 2]}, rules)
+
+        self.assertEqual(
+            self.backend.lookups,
+            [("products", "id", [1, 9]), ("products", "id", [9, 2])],
+        )
+
+    def test_rules_expect_only_registered_with_plugin(self):
+        self.addCleanup(Rule.subclasses.pop, "unique")
+
+        class OtherUniqueRule(Rule):
+            name = "unique"
+
+            def passes(self, field, value, parameters, validator):
+                return True
+
+        for name in ["_database", "exists"]:
+            self.assertNotIn(name, Rule.subclasses)
+        self.assertNotIn("unique", Validator()._available_rules)
+        self.assertIn("unique", self.validator._available_rules)
+
+    def test_quote_identifier_expect_quotes_escaped(self):
+        self.assertEqual(quote_identifier('main.users"'), '"main"."users"""')
+
+
+class ExistenceCacheTest(ValidatorTest):
+    def test_expired_value_expect_not_contained(self):
+        cache = ExistenceCache(ttl=0.01)
+        cache.add([("t", "c", 1)])
+
+        self.assertTrue(cache.contains(("t", "c", 1)))
+        time.sleep(0.02)
+        self.assertFalse(cache.contains(("t", "c", 1)))
+
+    def test_full_cache_expect_oldest_value_discarded(self):
+        cache = ExistenceCache(ttl=60, maxsize=2)
+        cache.add([("t", "c", 1), ("t", "c", 2), ("t", "c", 3)])
+
+        self.assertFalse(cache.contains(("t", "c", 1)))
+        self.assertTrue(cache.contains(("t", "c", 3)))
+
+
+class ConnectionPoolTest(ValidatorTest):
+    def test_connections_expect_reused_up_to_size(self):
+        created = []
+        pool = ConnectionPool(lambda: created.append(object()) or created[-1], size=2)
+
+        with pool.connection() as first:
+            with pool.connection() as second:
+                self.assertIsNot(first, second)
+        with pool.connection() as third:
+            self.assertIn(third, (first, second))
+
+        self.assertEqual(len(created), 2)
+
+    def test_all_connections_in_use_expect_wait_for_release(self):
+        pool = ConnectionPool(object, size=1)
+        acquired = []
+
+        with pool.connection() as connection:
+            thread = threading.Thread(
+                target=lambda: acquired.append(pool._acquire()), daemon=True
+            )
+            thread.start()
+            thread.join(0.05)
+            self.assertEqual(acquired, [])
+
+        thread.join(1)
+        self.assertEqual(acquired, [connection])
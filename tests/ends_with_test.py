@@ -1,4 +1,6 @@
 from src.spotlight.errors import ENDS_WITH_ERROR
+from src.spotlight.parameters import SuffixParameters
+from src.spotlight.rules import EndsWithRule
 from .validator_test import ValidatorTest
 
 
@@ -38,3 +40,45 @@ class EndsWithTest(ValidatorTest):
         errs = errors.get(self.field)
 
         self.assertEqual(errs, expected)
+
+    def test_ends_with_rule_with_many_values_expect_no_error(self):
+        suffixes = [f".example{i}.com" for i in range(200)]
+        data = {"test": "mail.example150.com"}
+        rules = {"test": [("ends_with", suffixes)]}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {})
+
+    def test_ends_with_rule_with_many_values_expect_error(self):
+        suffixes = [f".example{i}.com" for i in range(200)]
+        data = {"test": "mail.example200.com"}
+        rules = {"test": [("ends_with", suffixes)]}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(len(errors.get(self.field)), 1)
+
+    def test_matched_suffix_expect_longest_matching_suffix(self):
+        few = [".com", ".example.com", ".org"]
+        many = few + [f".other{i}.net" for i in range(100)]
+
+        for suffixes in [few, many]:
+            self.assertEqual(
+                EndsWithRule.matched_suffix("mail.example.com", suffixes),
+                ".example.com",
+            )
+            self.assertEqual(
+                EndsWithRule.matched_suffix("mail.test.com", suffixes), ".com"
+            )
+            self.assertIsNone(EndsWithRule.matched_suffix("mail.test.nl", suffixes))
+
+    def test_ends_with_rule_expect_matcher_built_when_rules_resolved(self):
+        rules = {"test": [("ends_with", ["val0", "val1"])]}
+        resolved = list(self.validator.rule_iterator(rules["test"]))
+
+        rule, parameters = resolved[0]
+
+        self.assertIsInstance(parameters, SuffixParameters)
+        self.assertTrue(parameters.prepared.suffix)
+        self.assertTrue(rule.passes(self.field, "a val1", parameters, self.validator))
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that are only needed by some of the rules
+LAZY_MODULES = [
+    "copy",
+    "datetime",
+    "decimal",
+    "ipaddress",
+    "json",
+    "mmap",
+    "threading",
+    "uuid",
+    "src.spotlight.compiler",
+    "src.spotlight.value_sets",
+]
+
+# Generous upper bound, the import takes a few dozen milliseconds
+MAX_IMPORT_TIME = 0.5
+
+
+def run(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout.strip()
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_import_expect_lazy_modules_not_imported(self):
+        output = run(
+            "import sys\n"
+            "import src.spotlight\n"
+            f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+        )
+
+        self.assertEqual(output, "")
+
+    def test_import_expect_regexes_not_compiled(self):
+        output = run(
+            "from src.spotlight import rules\n"
+            "print(rules.EmailRule._regex._compiled is None)"
+        )
+
+        self.assertEqual(output, "True")
+
+    def test_import_expect_fast_import(self):
+        output = run(
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import src.spotlight\n"
+            "print(time.perf_counter() - start)"
+        )
+
+        self.assertLess(float(output), MAX_IMPORT_TIME)
+
+    def test_rules_after_import_of_lazy_modules_expect_no_errors(self):
+        output = run(
+            "from src.spotlight import Validator\n"
+            "from datetime import date\n"
+            "from decimal import Decimal\n"
+            "from uuid import uuid4\n"
+            "rules = {'a': 'decimal|min:1', 'b': 'date_time', 'c': 'uuid4|json'}\n"
+            "data = {'a': Decimal('1.5'), 'b': date.today(), 'c': str(uuid4())}\n"
+            "print(sorted(Validator().validate(data, rules)))"
+        )
+
+        self.assertEqual(output, "['c']")
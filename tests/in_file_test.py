@@ -0,0 +1,103 @@
+import os
+import tempfile
+from unittest import mock
+
+from src.spotlight import Validator
+from src.spotlight.errors import IN_FILE_ERROR
+from src.spotlight.value_sets import SortedFileValueSet, write_sorted_values
+from .validator_test import ValidatorTest
+
+
+class InFileTest(ValidatorTest):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.directory.name, "values.txt")
+        cls.empty_path = os.path.join(cls.directory.name, "empty.txt")
+        write_sorted_values(["1000AA", "9999ZZ", "5000BB", 1234, "a,b"], cls.path)
+        write_sorted_values([], cls.empty_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        SortedFileValueSet.open(cls.path).close()
+        SortedFileValueSet.open(cls.empty_path).close()
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.field = "test"
+        self.in_file_error = IN_FILE_ERROR.format(field=self.field)
+
+    def test_in_file_rule_with_invalid_value_expect_error(self):
+        data = {"test": "5000BA"}
+        rules = {"test": f"in_file:{self.path}"}
+        expected = self.in_file_error
+
+        errors = self.validator.validate(data, rules)
+        errs = errors.get(self.field)
+
+        self.assertEqual(errs[0], expected)
+
+    def test_in_file_rule_with_valid_values_expect_no_error(self):
+        for value in ["1000AA", "5000BB", "9999ZZ", 1234, "a,b"]:
+            data = {"test": value}
+            rules = {"test": f"in_file:{self.path}"}
+
+            errors = self.validator.validate(data, rules)
+
+            self.assertEqual(errors, {})
+
+    def test_in_file_rule_with_value_outside_range_expect_error(self):
+        for value in ["", "0", "ZZZZZZ", "1000AA\n5000BB"]:
+            data = {"test": value}
+            rules = {"test": f"in_file:{self.path}"}
+
+            errors = self.validator.validate(data, rules)
+
+            self.assertEqual(errors.get(self.field), [self.in_file_error])
+
+    def test_in_file_rule_with_empty_file_expect_error(self):
+        data = {"test": "1000AA"}
+        rules = {"test": f"in_file:{self.empty_path}"}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors.get(self.field), [self.in_file_error])
+
+    def test_in_file_rule_with_wildcard_field_expect_value_set_opened_once(self):
+        data = {"test": ["1000AA", "5000BB", "0"]}
+        rules = {"test.*": f"in_file:{self.path}"}
+
+        with mock.patch.object(
+            SortedFileValueSet, "open", wraps=SortedFileValueSet.open
+        ) as open_value_set:
+            errors = Validator().validate(data, rules)
+
+        self.assertEqual(open_value_set.call_count, 1)
+        self.assertEqual(list(errors), ["test.2"])
+
+    def test_in_file_rule_after_close_expect_value_set_opened_again(self):
+        rules = {"test": f"in_file:{self.path}"}
+        self.validator.validate({"test": "1000AA"}, rules)
+
+        SortedFileValueSet.open(self.path).close()
+        errors = self.validator.validate({"test": "1000AA"}, rules)
+
+        self.assertEqual(errors, {})
+
+    def test_sorted_file_value_set_open_expect_shared_instance(self):
+        value_set = SortedFileValueSet.open(self.path)
+
+        self.assertIs(SortedFileValueSet.open(self.path), value_set)
+
+    def test_sorted_file_value_set_with_many_values_expect_all_found(self):
+        path = os.path.join(self.directory.name, "many.txt")
+        values = [f"{i:06d}" for i in range(0, 20000, 2)]
+        write_sorted_values(values, path)
+        value_set = SortedFileValueSet(path)
+
+        try:
+            self.assertTrue(all(value in value_set for value in values))
+            self.assertFalse(any(f"{i:06d}" in value_set for i in range(1, 2001, 2)))
+        finally:
+            value_set.close()
@@ -0,0 +1,127 @@
+from itertools import islice
+from types import GeneratorType
+from unittest import mock
+
+from src.spotlight import FieldError, Schema, Validator, when
+from src.spotlight.errors import REQUIRED_ERROR, INTEGER_ERROR, EMAIL_ERROR
+from .validator_test import ValidatorTest
+
+
+class IterErrorsTest(ValidatorTest):
+    def setUp(self):
+        self.rules = {
+            "id": "required|integer",
+            "email": "required|email",
+            "items.*.id": "integer",
+        }
+        self.data = {"id": "a", "items": [{"id": 1}, {"id": "b"}, {"id": "c"}]}
+
+    def test_iter_errors_expect_generator(self):
+        errors = self.validator.iter_errors(self.data, self.rules)
+
+        self.assertIsInstance(errors, GeneratorType)
+
+    def test_iter_errors_expect_field_errors_in_order(self):
+        errors = list(self.validator.iter_errors(self.data, self.rules))
+
+        self.assertEqual(
+            errors,
+            [
+                FieldError("id", "integer", INTEGER_ERROR.format(field="id")),
+                FieldError("email", "required", REQUIRED_ERROR.format(field="email")),
+                FieldError(
+                    "items.1.id", "integer", INTEGER_ERROR.format(field="items.1.id")
+                ),
+                FieldError(
+                    "items.2.id", "integer", INTEGER_ERROR.format(field="items.2.id")
+                ),
+            ],
+        )
+
+    def test_iter_errors_expect_same_errors_as_validate(self):
+        expected = self.validator.validate(self.data, self.rules)
+        errors = {}
+
+        for field, _, message in self.validator.iter_errors(self.data, self.rules):
+            errors.setdefault(field, []).append(message)
+
+        self.assertEqual(errors, expected)
+
+    def test_stop_early_expect_remaining_fields_not_validated(self):
+        # The errors are found by a copy of the validator
+        with mock.patch.object(
+            Validator,
+            "_validate_value",
+            autospec=True,
+            side_effect=Validator._validate_value,
+        ) as validate_value:
+            first = next(self.validator.iter_errors(self.data, self.rules))
+
+        self.assertEqual(first.field, "id")
+        self.assertEqual(validate_value.call_count, 1)
+
+    def test_stop_in_wildcard_field_expect_remaining_items_not_validated(self):
+        data = {"items": [{"id": str(i)} for i in range(1000)]}
+
+        # The errors are found by a copy of the validator
+        with mock.patch.object(
+            Validator,
+            "_validate_value",
+            autospec=True,
+            side_effect=Validator._validate_value,
+        ) as validate_value:
+            errors = list(islice(self.validator.iter_errors(data, self.rules), 3))
+
+        self.assertEqual([e.field for e in errors], ["id", "email", "items.0.id"])
+        self.assertEqual(validate_value.call_count, 3)
+
+    def test_closed_iterator_expect_validator_usable(self):
+        errors = self.validator.iter_errors(self.data, self.rules)
+        next(errors)
+        errors.close()
+
+        self.assertEqual(
+            self.validator.validate({"id": "a"}, {"id": "integer"}),
+            {"id": [INTEGER_ERROR.format(field="id")]},
+        )
+
+    def test_schema_and_group_expect_errors(self):
+        rules = Schema(
+            {"type": "required", "contact": when("type", "mail", {"email": "email"})}
+        )
+        data = {"type": "mail", "contact": {"email": "invalid"}}
+
+        errors = list(self.validator.iter_errors(data, rules))
+
+        self.assertEqual(
+            errors,
+            [
+                FieldError(
+                    "contact.email", "email", EMAIL_ERROR.format(field="contact.email")
+                )
+            ],
+        )
+
+    def test_only_expect_subset_of_fields(self):
+        errors = list(self.validator.iter_errors(self.data, self.rules, only=["id"]))
+
+        self.assertEqual([error.field for error in errors], ["id"])
+
+    def test_abandoned_iterator_expect_validator_usable(self):
+        errors = self.validator.iter_errors(self.data, self.rules)
+        next(errors)
+
+        self.assertEqual(
+            self.validator.validate({"id": "a"}, {"id": "integer"}),
+            {"id": [INTEGER_ERROR.format(field="id")]},
+        )
+        errors.close()
+
+    def test_resumed_iterator_after_validate_expect_remaining_errors(self):
+        expected = list(self.validator.iter_errors(self.data, self.rules))
+        errors = self.validator.iter_errors(self.data, self.rules)
+        first = next(errors)
+
+        self.validator.validate({"id": "a"}, {"id": "integer"})
+
+        self.assertEqual([first, *errors], expected)
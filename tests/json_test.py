@@ -1,6 +1,7 @@
 import json
 
-from src.spotlight.errors import JSON_ERROR
+from src.spotlight.errors import JSON_ERROR, STRING_ERROR, IN_ERROR, INTEGER_ERROR
+from src.spotlight.validator import Validator
 from .validator_test import ValidatorTest
 
 
@@ -99,3 +100,62 @@ class JsonTest(ValidatorTest):
         for value in values:
             actual = self.validator.valid_json(value)
             self.assertEqual(actual, True)
+
+    def test_json_rule_with_valid_json_expect_decoded_value(self):
+        data = {"test": '{"name": "John", "tags": ["a", "b"]}'}
+
+        errors = self.validator.validate(data, self.rules)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(
+            self.validator.decoded, {"test": {"name": "John", "tags": ["a", "b"]}}
+        )
+
+    def test_json_rule_with_invalid_json_expect_no_decoded_value(self):
+        data = {"test": "{"}
+
+        self.validator.validate(data, self.rules)
+
+        self.assertEqual(self.validator.decoded, {})
+
+    def test_json_rule_with_nested_rules_expect_nested_errors(self):
+        rules = {
+            "test": [
+                "required",
+                ("json", {"name": "required|string", "tags.*": "in:a,b"}),
+            ]
+        }
+        data = {"test": '{"name": 1, "tags": ["a", "c"]}'}
+        expected = {
+            "test.name": [STRING_ERROR.format(field="test.name")],
+            "test.tags.1": [IN_ERROR.format(field="test.tags.1", values="a, b")],
+        }
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, expected)
+        self.assertEqual(
+            self.validator.decoded["test"], {"name": 1, "tags": ["a", "c"]}
+        )
+
+    def test_json_rule_with_nested_json_expect_all_decoded_values(self):
+        rules = {"list.*.test": [("json", {"inner": [("json", {"id": "integer"})]})]}
+        data = {"list": [{"test": json.dumps({"inner": '{"id": "1"}'})}]}
+        expected = {
+            "list.0.test.inner.id": [INTEGER_ERROR.format(field="list.0.test.inner.id")]
+        }
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, expected)
+        self.assertEqual(self.validator.decoded["list.0.test.inner"], {"id": "1"})
+
+    def test_json_rule_with_nested_rules_and_custom_message_expect_custom_error(self):
+        validator = Validator()
+        validator.overwrite_messages = {"list.*.test.name.required": "Name!"}
+        rules = {"list.*.test": [("json", {"name": "required"})]}
+        data = {"list": [{"test": "{}"}]}
+
+        errors = validator.validate(data, rules)
+
+        self.assertEqual(errors, {"list.0.test.name": ["Name!"]})
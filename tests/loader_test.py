@@ -0,0 +1,127 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from src.spotlight import Schema
+from src.spotlight import loader
+from src.spotlight import schema as schema_module
+from src.spotlight.errors import REQUIRED_ERROR, EMAIL_ERROR
+from src.spotlight.exceptions import SchemaFormatError
+from src.spotlight.loader import load_schema, load_schemas
+from .validator_test import ValidatorTest
+
+
+class LoaderTest(ValidatorTest):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, "cache")
+        self.rules = {"email": "required|email", "tags": ["list", "max:2"]}
+        self.path = self.write("rules.json", json.dumps(self.rules))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w") as file:
+            file.write(content)
+
+        return path
+
+    def test_load_schema_expect_schema_with_rules(self):
+        schema = load_schema(self.path)
+        data = {"email": "invalid", "tags": [1, 2, 3]}
+
+        self.assertIsInstance(schema, Schema)
+        self.assertEqual(
+            self.validator.validate(data, schema),
+            self.validator.validate(data, self.rules),
+        )
+
+    def test_load_schemas_expect_schema_per_name(self):
+        path = self.write("schemas.json", json.dumps({"user": self.rules}))
+
+        schemas = load_schemas(path)
+
+        self.assertEqual(list(schemas), ["user"])
+        self.assertEqual(
+            self.validator.validate({}, schemas["user"]),
+            {"email": [REQUIRED_ERROR.format(field="email")]},
+        )
+
+    @unittest.skipIf(sys.version_info < (3, 11), "tomllib requires Python 3.11")
+    def test_load_toml_expect_schema_with_rules(self):
+        path = self.write("rules.toml", 'email = "required|email"\n')
+
+        schema = load_schema(path)
+
+        self.assertEqual(
+            self.validator.validate({"email": "a"}, schema),
+            {"email": [EMAIL_ERROR.format(field="email")]},
+        )
+
+    def test_unsupported_format_expect_schema_format_error(self):
+        path = self.write("rules.yaml", "email: required")
+
+        with self.assertRaises(SchemaFormatError):
+            load_schema(path)
+
+    def test_no_dict_expect_schema_format_error(self):
+        path = self.write("rules.json", "[]")
+
+        with self.assertRaises(SchemaFormatError):
+            load_schema(path)
+
+    def test_cache_expect_rules_parsed_once(self):
+        load_schema(self.path, cache_dir=self.cache_dir)
+
+        with mock.patch.object(schema_module, "parse_rules") as parse_rules:
+            schema = load_schema(self.path, cache_dir=self.cache_dir)
+
+        parse_rules.assert_not_called()
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(
+            self.validator.validate({}, schema),
+            {"email": [REQUIRED_ERROR.format(field="email")]},
+        )
+
+    def test_changed_file_expect_parsed_again(self):
+        load_schema(self.path, cache_dir=self.cache_dir)
+        self.write("rules.json", json.dumps({"name": "required"}))
+
+        schema = load_schema(self.path, cache_dir=self.cache_dir)
+
+        self.assertEqual(
+            self.validator.validate({}, schema),
+            {"name": [REQUIRED_ERROR.format(field="name")]},
+        )
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_other_library_version_expect_parsed_again(self):
+        load_schema(self.path, cache_dir=self.cache_dir)
+
+        with mock.patch.object(loader, "__version__", "0.0.0"):
+            load_schema(self.path, cache_dir=self.cache_dir)
+
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+    def test_corrupt_cache_expect_replaced(self):
+        load_schema(self.path, cache_dir=self.cache_dir)
+        (name,) = os.listdir(self.cache_dir)
+        with open(os.path.join(self.cache_dir, name), "wb") as file:
+            file.write(b"corrupt")
+
+        schema = load_schema(self.path, cache_dir=self.cache_dir)
+
+        self.assertIsInstance(schema, Schema)
+        self.assertIsInstance(load_schema(self.path, cache_dir=self.cache_dir), Schema)
+
+    def test_unwritable_cache_dir_expect_schema_loaded(self):
+        cache_dir = self.write("cache", "")
+
+        schema = load_schema(self.path, cache_dir=cache_dir)
+
+        self.assertEqual(schema, Schema(self.rules))
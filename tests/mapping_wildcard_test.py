@@ -0,0 +1,143 @@
+from src.spotlight import rule
+from src.spotlight.errors import (
+    INTEGER_ERROR,
+    REGEX_ERROR,
+    MIN_STRING_ERROR,
+    REQUIRED_ERROR,
+    FILLED_ERROR,
+    PROHIBITED_ERROR,
+)
+from src.spotlight.validator import Validator
+from .validator_test import ValidatorTest
+
+
+class MappingWildcardTest(ValidatorTest):
+    def test_wildcard_over_dict_values_expect_errors(self):
+        rules = {"prices.*.amount": "required|integer"}
+        data = {"prices": {"SKU1": {"amount": 10}, "SKU2": {"amount": "a"}}}
+        field = "prices.SKU2.amount"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [INTEGER_ERROR.format(field=field)]})
+
+    def test_wildcard_over_nested_dicts_and_lists_expect_errors(self):
+        rules = {"shops.*.prices.*": "integer"}
+        data = {"shops": [{"prices": {"a": 1}}, {"prices": {"b": 2, "c": "x"}}]}
+        field = "shops.1.prices.c"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [INTEGER_ERROR.format(field=field)]})
+
+    def test_key_wildcard_expect_keys_validated(self):
+        rules = {"prices.{key}": ["string", ("regex", ["^SKU[0-9]+$"])]}
+        data = {"prices": {"SKU1": 10, "sku2": 20}}
+        field = "prices.sku2"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(
+            errors, {field: [REGEX_ERROR.format(field=field, regex="^SKU[0-9]+$")]}
+        )
+
+    def test_key_wildcard_over_list_of_dicts_expect_keys_validated(self):
+        rules = {"items.*.{key}": "min:2"}
+        data = {"items": [{"ab": 1}, {"a": 2}]}
+        field = "items.1.a"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [MIN_STRING_ERROR.format(field=field, min=2)]})
+
+    def test_key_wildcard_with_custom_message_expect_new_message(self):
+        validator = Validator()
+        validator.overwrite_messages = {"prices.{key}.regex": "Invalid SKU"}
+        rules = {"prices.{key}": [("regex", ["^SKU[0-9]+$"])]}
+
+        errors = validator.validate({"prices": {"sku": 1}}, rules)
+
+        self.assertEqual(errors, {"prices.sku": ["Invalid SKU"]})
+
+    def test_wildcard_over_dict_values_with_custom_message_expect_new_message(self):
+        validator = Validator()
+        validator.overwrite_messages = {"prices.*.amount.integer": "Invalid amount"}
+        rules = {"prices.*.amount": "integer"}
+
+        errors = validator.validate({"prices": {"SKU1": {"amount": "a"}}}, rules)
+
+        self.assertEqual(errors, {"prices.SKU1.amount": ["Invalid amount"]})
+
+    def test_compiled_key_wildcard_expect_same_errors(self):
+        rules = {"prices.{key}": "min:4", "prices.*": "integer"}
+        data = {"prices": {"SKU1": 10, "SKU": "a"}}
+
+        validate = self.validator.compile(rules)
+
+        self.assertEqual(validate(data), self.validator.validate(data, rules))
+
+    def test_wildcard_over_dict_with_int_keys_expect_values_validated(self):
+        rules = {"prices.*.amount": "required|integer"}
+        data = {"prices": {1: {"amount": 5}, 2: {"amount": "a"}}}
+        field = "prices.2.amount"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [INTEGER_ERROR.format(field=field)]})
+
+    def test_wildcard_over_dict_with_dotted_keys_expect_values_validated(self):
+        rules = {"prices.*.amount": "integer", "prices.*": "dict"}
+        data = {"prices": {"sku.1": {"amount": 5}, "sku.2": {"amount": "a"}}}
+        field = "prices.sku.2.amount"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [INTEGER_ERROR.format(field=field)]})
+
+    def test_required_over_dict_with_dotted_keys_expect_present_values_pass(self):
+        rules = {"prices.*.amount": "required|integer"}
+        data = {"prices": {"a.b": {"amount": 1}, "c.d": {}}}
+        field = "prices.c.d.amount"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [REQUIRED_ERROR.format(field=field)]})
+
+    def test_required_with_over_dict_with_dotted_keys_expect_present_values_pass(
+        self,
+    ):
+        rules = {"prices.*.amount": "required_with:currency"}
+        data = {"currency": "EUR", "prices": {"a.b": {"amount": 1}}}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {})
+
+    def test_filled_over_dict_with_dotted_keys_expect_empty_values_fail(self):
+        rules = {"prices.*.amount": "filled"}
+        data = {"prices": {"a.b": {"amount": ""}, "c.d": {}}}
+        field = "prices.a.b.amount"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [FILLED_ERROR.format(field=field)]})
+
+    def test_prohibited_over_dict_with_dotted_keys_expect_present_values_fail(self):
+        rules = {"prices.*.amount": "prohibited"}
+        data = {"prices": {"a.b": {"amount": 1}, "c.d": {}}}
+        field = "prices.a.b.amount"
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {field: [PROHIBITED_ERROR.format(field=field)]})
+
+    def test_bulk_rule_over_dict_with_int_keys_expect_values_passed(self):
+        values = []
+
+        @rule(bulk=True)
+        def collect(items, **_):
+            values.extend(value for _, value in items)
+
+        self.validator.validate({"m": {1: {"v": "x"}}}, {"m.*.v": [collect]})
+
+        self.assertEqual(values, ["x"])
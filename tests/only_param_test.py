@@ -0,0 +1,58 @@
+from src.spotlight.errors import REQUIRED_ERROR, EMAIL_ERROR, NOT_WITH_ERROR
+from src.spotlight.schema import Schema
+from .validator_test import ValidatorTest
+
+
+class OnlyParamTest(ValidatorTest):
+    def setUp(self):
+        self.rules = {
+            "name": "required",
+            "email": "required|email",
+            "backup_email": "email|not_with:email",
+            "address.*.zip": "required",
+            "address.*.street": "required",
+        }
+        self.data = {
+            "email": "john.doe@",
+            "backup_email": "john@example.com",
+            "address": [{"street": None, "zip": None}],
+        }
+
+    def test_only_param_expect_only_errors_of_selected_fields(self):
+        expected = {
+            "email": [EMAIL_ERROR.format(field="email")],
+            "backup_email": [
+                NOT_WITH_ERROR.format(field="backup_email", other="email")
+            ],
+            "address.0.zip": [REQUIRED_ERROR.format(field="address.0.zip")],
+        }
+
+        errors = self.validator.validate(
+            self.data, self.rules, only=["email", "address.*.zip"]
+        )
+
+        self.assertEqual(errors, expected)
+
+    def test_only_param_with_parent_field_expect_errors_of_child_fields(self):
+        expected = {
+            "address.0.zip": [REQUIRED_ERROR.format(field="address.0.zip")],
+            "address.0.street": [REQUIRED_ERROR.format(field="address.0.street")],
+        }
+
+        errors = self.validator.validate(self.data, self.rules, only=["address"])
+
+        self.assertEqual(errors, expected)
+
+    def test_only_param_with_schema_and_flat_expect_list_of_errors(self):
+        expected = [REQUIRED_ERROR.format(field="name")]
+
+        errors = self.validator.validate(
+            self.data, Schema(self.rules), flat=True, only=["name"]
+        )
+
+        self.assertEqual(errors, expected)
+
+    def test_only_param_empty_expect_no_errors(self):
+        errors = self.validator.validate(self.data, self.rules, only=[])
+
+        self.assertEqual(errors, {})
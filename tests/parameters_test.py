@@ -0,0 +1,50 @@
+from src.spotlight.conditions import Condition
+from src.spotlight.parameters import ConditionParameters, PreparedParameters
+from .validator_test import ValidatorTest
+
+
+class CountingParameters(PreparedParameters):
+    """Parameters that count how often they are prepared"""
+
+    __slots__ = ()
+
+    calls = 0
+
+    @classmethod
+    def prepare(cls, parameters):
+        cls.calls += 1
+
+        return cls.calls
+
+    @classmethod
+    def expired(cls, prepared):
+        return prepared < 0
+
+
+class PreparedParametersTest(ValidatorTest):
+    def setUp(self):
+        CountingParameters.calls = 0
+
+    def test_prepared_parameters_expect_list_with_prepared_value(self):
+        parameters = ConditionParameters(["country", "US"])
+
+        self.assertEqual(parameters, ["country", "US"])
+        self.assertIs(ConditionParameters.of(parameters), Condition.of("country", "US"))
+
+    def test_of_with_list_expect_value_prepared(self):
+        self.assertIs(
+            ConditionParameters.of(["country", "US"]), Condition.of("country", "US")
+        )
+
+    def test_of_expect_value_prepared_once(self):
+        parameters = CountingParameters([])
+
+        self.assertEqual(CountingParameters.of(parameters), 1)
+        self.assertEqual(CountingParameters.of(parameters), 1)
+
+    def test_of_with_expired_value_expect_prepared_again(self):
+        parameters = CountingParameters([])
+        parameters.prepared = -1
+
+        self.assertEqual(CountingParameters.of(parameters), 2)
+        self.assertEqual(parameters.prepared, 2)
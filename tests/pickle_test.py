@@ -0,0 +1,140 @@
+import os
+import pickle
+import sqlite3
+import tempfile
+from typing import Any, List
+from unittest import mock
+
+from src.spotlight import Validator, Schema, Rule, when
+from src.spotlight import config
+from src.spotlight import schema as schema_module
+from src.spotlight.compiler import CompiledRules
+from src.spotlight.conditions import Condition
+from src.spotlight.database import DatabasePlugin, SQLiteBackend
+from src.spotlight.errors import EXISTS_ERROR
+from src.spotlight.exceptions import IncompatiblePickleError
+from .validator_test import ValidatorTest
+
+
+class PickledUppercaseRule(Rule):
+    """Uppercase"""
+
+    name = "pickled_uppercase"
+
+    def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        return value.upper() == value
+
+    @property
+    def message(self) -> str:
+        return "The {field} field must be uppercase."
+
+
+def positive(value, **_):
+    if value <= 0:
+        return "Not positive."
+
+
+class PickleTest(ValidatorTest):
+    def setUp(self):
+        self.rules = {
+            "name": "required|pickled_uppercase",
+            "age": ["integer", positive],
+            "country": "required",
+            "state": "required_if:country,US",
+            "address": when("country", "US", {"zip": "required|integer"}),
+        }
+        self.data = {"name": "john", "age": -1, "country": "US", "address": {}}
+        self.validator.register_rule(PickledUppercaseRule())
+        self.validator.overwrite_messages = {"name.pickled_uppercase": "Shout!"}
+
+    @staticmethod
+    def reload(value: Any) -> Any:
+        return pickle.loads(pickle.dumps(value))
+
+    def test_pickled_validator_expect_same_errors(self):
+        expected = self.validator.validate(self.data, self.rules)
+
+        validator = self.reload(self.validator)
+
+        self.assertEqual(validator.validate(self.data, self.rules), expected)
+        self.assertEqual(expected["name"], ["Shout!"])
+
+    def test_pickled_validator_expect_only_registered_rules_pickled(self):
+        state = self.validator.__getstate__()
+
+        self.assertEqual(state["version"], config.PICKLE_VERSION)
+        self.assertEqual(
+            [rule.name for rule in state["rules"]], [PickledUppercaseRule.name]
+        )
+
+    def test_pickled_validator_expect_cache_size_kept(self):
+        validator = self.reload(Validator(cache_size=10))
+
+        self.assertEqual(validator.cache_info().maxsize, 10)
+
+    def test_pickled_schema_expect_rules_not_parsed_again(self):
+        schema = Schema(self.rules)
+
+        with mock.patch.object(schema_module, "parse_rules") as parse_rules:
+            loaded = self.reload(schema)
+
+        parse_rules.assert_not_called()
+        self.assertIsInstance(loaded, Schema)
+        self.assertEqual(
+            self.validator.validate(self.data, loaded),
+            self.validator.validate(self.data, schema),
+        )
+
+    def test_pickled_conditions_expect_interned(self):
+        condition = Condition.of("country", "US")
+
+        self.assertIs(self.reload(condition), condition)
+
+    def test_pickled_compiled_rules_expect_compiled_again(self):
+        validate = self.validator.compile(self.rules)
+
+        loaded = self.reload(validate)
+
+        self.assertIsInstance(loaded, CompiledRules)
+        self.assertEqual(loaded.source, validate.source)
+        self.assertEqual(loaded(self.data), validate(self.data))
+
+    def test_other_version_expect_incompatible_pickle_error(self):
+        data = pickle.dumps(Schema(self.rules))
+
+        with mock.patch.object(config, "PICKLE_VERSION", config.PICKLE_VERSION + 1):
+            with self.assertRaises(IncompatiblePickleError):
+                pickle.loads(data)
+
+    def test_copy_expect_state_shared(self):
+        from copy import copy
+
+        self.validator.validate(self.data, self.rules)
+        copied = copy(self.validator)
+
+        self.assertIs(copied.data, self.validator.data)
+        self.assertIs(copied._resolved_rules, self.validator._resolved_rules)
+
+
+class PickleDatabaseTest(ValidatorTest):
+    def test_pickled_database_plugin_expect_new_connections(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.db")
+            connection = sqlite3.connect(path)
+            connection.execute("CREATE TABLE products (id INTEGER)")
+            connection.execute("INSERT INTO products VALUES (1)")
+            connection.commit()
+            connection.close()
+
+            backend = SQLiteBackend(path)
+            validator = Validator(plugins=[DatabasePlugin(backend, ttl=60)])
+            loaded = pickle.loads(pickle.dumps(validator))
+
+            errors = loaded.validate({"id": 2}, {"id": "exists:products"})
+            loaded_backend = loaded._available_rules["exists"].plugin.backend
+            loaded_backend.close()
+            backend.close()
+
+        self.assertEqual(errors, {"id": [EXISTS_ERROR.format(field="id")]})
+        self.assertIsNot(loaded_backend, backend)
+        self.assertEqual(loaded_backend.database, path)
@@ -1,3 +1,6 @@
+from unittest import mock
+
+from src.spotlight import validator as validator_module
 from src.spotlight.errors import REQUIRED_IF_ERROR
 from .validator_test import ValidatorTest
 
@@ -141,3 +144,18 @@ class RequiredIfTest(ValidatorTest):
         errs = errors.get(field)
 
         self.assertEqual(errs[0], expected)
+
+    def test_required_if_rule_on_many_fields_expect_other_field_looked_up_once(self):
+        data = {"type": "business"}
+        rules = {f"field{i}": "required_if:type,business" for i in range(30)}
+
+        with mock.patch.object(
+            validator_module,
+            "_get_field_value",
+            wraps=validator_module._get_field_value,
+        ) as get_field_value:
+            errors = self.validator.validate(data, rules)
+
+        lookups = [c for c in get_field_value.call_args_list if c[0][1] == "type"]
+        self.assertEqual(len(errors), 30)
+        self.assertEqual(len(lookups), 1)
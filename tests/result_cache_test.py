@@ -0,0 +1,138 @@
+from typing import Any, List
+
+from src.spotlight import Validator
+from src.spotlight.cache import ResultCache
+from src.spotlight.errors import EMAIL_ERROR, DATE_TIME_ERROR
+from src.spotlight.rules import Rule
+from .validator_test import ValidatorTest
+
+
+class CountingRule(Rule):
+    """Pure rule that counts how often it is called"""
+
+    name = "counting"
+    pure = True
+    calls = 0
+
+    def passes(self, field: str, value: Any, parameters: List[str], validator) -> bool:
+        CountingRule.calls += 1
+
+        return value == "valid"
+
+    @property
+    def message(self) -> str:
+        return "The {field} field is invalid."
+
+
+class ResultCacheTest(ValidatorTest):
+    def setUp(self):
+        CountingRule.calls = 0
+        self.validator = Validator(cache_size=2)
+        self.validator.register_rule(CountingRule())
+
+    def test_cache_disabled_by_default_expect_no_statistics(self):
+        validator = Validator()
+        validator.validate({"email": "test@example.com"}, {"email": "email"})
+
+        self.assertEqual(validator.cache_info(), (0, 0, 0, 0))
+
+    def test_repeated_values_expect_rule_called_once(self):
+        data = {"a": "valid", "b": "valid", "c": "invalid"}
+        rules = {"a": "counting", "b": "counting", "c": "counting"}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(CountingRule.calls, 2)
+        self.assertEqual(errors, {"c": ["The c field is invalid."]})
+
+    def test_cache_info_expect_hits_and_misses(self):
+        rules = {"items.*": "counting"}
+
+        self.validator.validate({"items": ["valid", "valid", "valid"]}, rules)
+        info = self.validator.cache_info()
+
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 1)
+        self.assertAlmostEqual(info.hit_rate, 2 / 3)
+
+    def test_full_cache_expect_least_recently_used_result_discarded(self):
+        rules = {"items.*": "counting"}
+
+        self.validator.validate({"items": ["a", "b", "a", "c", "b"]}, rules)
+
+        self.assertEqual(CountingRule.calls, 4)
+        self.assertEqual(self.validator.cache_info().currsize, 2)
+
+    def test_equal_values_of_other_types_expect_separate_results(self):
+        self.validator.validate({"items": [1, True, 1.0]}, {"items.*": "counting"})
+
+        self.assertEqual(CountingRule.calls, 3)
+
+    def test_unhashable_values_expect_rule_called(self):
+        data = {"items": [["valid"], ["valid"]]}
+
+        errors = self.validator.validate(data, {"items.*": "counting"})
+
+        self.assertEqual(CountingRule.calls, 2)
+        self.assertEqual(len(errors), 2)
+        self.assertEqual(self.validator.cache_info().misses, 0)
+
+    def test_cached_result_expect_error_for_each_field(self):
+        data = {"a": "invalid", "b": "invalid"}
+        rules = {"a": "email", "b": "email"}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(
+            errors,
+            {
+                "a": [EMAIL_ERROR.format(field="a")],
+                "b": [EMAIL_ERROR.format(field="b")],
+            },
+        )
+        self.assertEqual(self.validator.cache_info().hits, 1)
+
+    def test_parameters_expect_part_of_key(self):
+        data = {"a": "2020-01-01", "b": "2020-01-01"}
+        rules = {"a": "date_time:%Y-%m-%d", "b": "date_time"}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(
+            errors,
+            {"b": [DATE_TIME_ERROR.format(field="b", format="%Y-%m-%d %H:%M:%S")]},
+        )
+        self.assertEqual(self.validator.cache_info().misses, 2)
+
+    def test_register_rule_expect_cache_cleared(self):
+        self.validator.validate({"a": "valid"}, {"a": "counting"})
+        self.validator.register_rule(CountingRule())
+
+        self.assertEqual(self.validator.cache_info(), (0, 0, 2, 0))
+
+    def test_compiled_rules_expect_cache_used(self):
+        validate = self.validator.compile({"a": "counting", "b": "counting"})
+
+        errors = validate({"a": "valid", "b": "valid"})
+
+        self.assertEqual(errors, {})
+        self.assertEqual(CountingRule.calls, 1)
+        self.assertEqual(self.validator.cache_info().hits, 1)
+
+    def test_results_cached_between_validations(self):
+        rules = {"a": "counting"}
+
+        self.validator.validate({"a": "valid"}, rules)
+        self.validator.validate({"a": "valid"}, rules)
+
+        self.assertEqual(CountingRule.calls, 1)
+
+    def test_result_cache_expect_false_results_cached(self):
+        cache = ResultCache(1)
+        cache.put("key", False)
+
+        self.assertIs(cache.get("key"), False)
+        self.assertIsNone(cache.get("other"))
+        self.assertEqual(cache.info(), (1, 1, 1, 1))
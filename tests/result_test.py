@@ -0,0 +1,68 @@
+from src.spotlight.errors import REQUIRED_ERROR, INTEGER_ERROR
+from src.spotlight.result import ValidationResult
+from .validator_test import ValidatorTest
+
+
+class ValidationResultTest(ValidatorTest):
+    def setUp(self):
+        self.rules = {"id": "required|integer", "name": "required", "age": "integer"}
+        self.id_error = INTEGER_ERROR.format(field="id")
+        self.name_error = REQUIRED_ERROR.format(field="name")
+        self.age_error = INTEGER_ERROR.format(field="age")
+
+    def test_check_with_valid_data_expect_truthy_result(self):
+        result = self.validator.check({"id": 1, "name": "John"}, self.rules)
+
+        self.assertIsInstance(result, ValidationResult)
+        self.assertTrue(result)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.errors, {})
+        self.assertEqual(result.flat, [])
+        self.assertEqual(list(result), [])
+
+    def test_check_with_invalid_data_expect_falsy_result(self):
+        result = self.validator.check({"id": "a", "age": "b"}, self.rules)
+
+        self.assertFalse(result)
+        self.assertFalse(result.valid)
+        self.assertEqual(
+            result.errors,
+            {"id": [self.id_error], "name": [self.name_error], "age": [self.age_error]},
+        )
+
+    def test_check_expect_same_errors_as_validate(self):
+        data = {"id": "a", "age": "b"}
+        result = self.validator.check(data, self.rules)
+
+        self.assertEqual(result.errors, self.validator.validate(data, self.rules))
+        self.assertEqual(
+            result.flat, self.validator.validate(data, self.rules, flat=True)
+        )
+
+    def test_flat_expect_cached(self):
+        result = self.validator.check({"id": "a"}, self.rules)
+
+        self.assertIs(result.flat, result.flat)
+
+    def test_iterate_expect_field_and_message_tuples(self):
+        result = self.validator.check({"id": "a", "age": "b"}, self.rules)
+
+        self.assertEqual(
+            list(result),
+            [
+                ("id", self.id_error),
+                ("name", self.name_error),
+                ("age", self.age_error),
+            ],
+        )
+
+    def test_check_with_only_expect_only_fields_validated(self):
+        result = self.validator.check({"id": "a"}, self.rules, only=["id"])
+
+        self.assertEqual(result.errors, {"id": [self.id_error]})
+
+    def test_check_with_json_expect_decoded_values(self):
+        result = self.validator.check({"test": '{"a": 1}'}, {"test": "json"})
+
+        self.assertTrue(result)
+        self.assertEqual(result.decoded, {"test": {"a": 1}})
@@ -0,0 +1,95 @@
+from unittest import mock
+
+from src.spotlight.dependencies import DependencyGraph
+from src.spotlight.errors import REQUIRED_ERROR, REQUIRED_IF_ERROR, EMAIL_ERROR
+from src.spotlight.schema import Schema
+from .validator_test import ValidatorTest
+
+
+class RevalidateTest(ValidatorTest):
+    def setUp(self):
+        self.rules = {
+            "type": "required|in:personal,business",
+            "company": "required_if:type,business",
+            "email": "required|email",
+            "backup_email": "email|not_with:email",
+            "address.zip": "required",
+            "items.*.sku": "required",
+        }
+        self.data = {
+            "type": "personal",
+            "email": "john.doe@",
+            "address": {},
+            "items": [{"sku": "1"}, {}],
+        }
+
+    def test_revalidate_with_changed_fields_expect_same_errors_as_validate(self):
+        previous = self.validator.validate(self.data, self.rules)
+        changes = [
+            ("type", "business"),
+            ("email", "john.doe@example.com"),
+            ("address", {"zip": "1234AB"}),
+            ("items", [{"sku": "1"}, {"sku": "2"}]),
+        ]
+
+        for field, value in changes:
+            data = dict(self.data, **{field: value})
+            expected = self.validator.validate(data, self.rules)
+
+            errors = self.validator.revalidate(data, self.rules, previous, [field])
+
+            self.assertEqual(errors, expected)
+
+    def test_revalidate_with_changed_field_expect_dependent_field_error(self):
+        previous = self.validator.validate(self.data, self.rules)
+        data = dict(self.data, type="business")
+        expected = {
+            "company": [
+                REQUIRED_IF_ERROR.format(
+                    field="company", other="type", value="business"
+                )
+            ],
+            "email": [EMAIL_ERROR.format(field="email")],
+            "address.zip": [REQUIRED_ERROR.format(field="address.zip")],
+            "items.1.sku": [REQUIRED_ERROR.format(field="items.1.sku")],
+        }
+
+        errors = self.validator.revalidate(data, self.rules, previous, ["type"])
+
+        self.assertEqual(errors, expected)
+
+    def test_revalidate_with_nested_change_expect_only_affected_rules(self):
+        previous = self.validator.validate(self.data, self.rules)
+        data = dict(self.data, items=[{"sku": "1"}, {"sku": "2"}])
+
+        with mock.patch.object(
+            self.validator, "_validate_field", wraps=self.validator._validate_field
+        ) as m:
+            self.validator.revalidate(data, self.rules, previous, ["items.1.sku"])
+
+        self.assertEqual([c[0][0] for c in m.call_args_list], ["items.*.sku"])
+
+    def test_revalidate_with_function_rule_expect_function_rule_always_affected(self):
+        rules = {"name": "required", "check": [lambda **_: None]}
+        graph = DependencyGraph(rules, self.validator)
+
+        self.assertEqual(graph.affected(["name"]), ["name", "check"])
+
+    def test_revalidate_with_function_rule_references_expect_references_used(self):
+        def check(**_):
+            return None
+
+        check.references = ["other"]
+        rules = {"name": "required", "check": [check]}
+        graph = DependencyGraph(rules, self.validator)
+
+        self.assertEqual(graph.affected(["name"]), ["name"])
+        self.assertEqual(graph.affected(["other"]), ["check"])
+
+    def test_dependency_graph_of_schema_expect_cached_graph(self):
+        schema = Schema(self.rules)
+
+        graph = DependencyGraph.of(schema, self.validator)
+
+        self.assertIs(DependencyGraph.of(schema, self.validator), graph)
+        self.assertEqual(graph.affected(["email"]), ["email", "backup_email"])
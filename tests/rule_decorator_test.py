@@ -0,0 +1,125 @@
+from src.spotlight import Validator, rule
+from src.spotlight.errors import DATE_TIME_ERROR, STRING_ERROR
+from .validator_test import ValidatorTest
+
+
+class RuleDecoratorTest(ValidatorTest):
+    def setUp(self):
+        self.calls = []
+
+    def test_decorator_expect_attributes_set(self):
+        @rule(pure=True, cost=5, implicit=True, stop=True, references=["other"])
+        def validate(**_):
+            pass
+
+        self.assertTrue(validate.pure)
+        self.assertEqual(validate.cost, 5)
+        self.assertTrue(validate.implicit)
+        self.assertTrue(validate.stop)
+        self.assertEqual(validate.references, ["other"])
+
+    def test_implicit_and_stop_expect_honored(self):
+        @rule(implicit=True, stop=True)
+        def required(value, **_):
+            if value is None:
+                return "missing"
+
+        rules = {"test": [required, "required"]}
+
+        errors = self.validator.validate({}, rules)
+
+        self.assertEqual(errors, {"test": ["missing"]})
+
+    def test_pure_function_expect_memoized_per_value(self):
+        @rule(pure=True)
+        def positive(value, **_):
+            self.calls.append(value)
+            if value <= 0:
+                return "not positive"
+
+        validator = Validator(cache_size=100)
+        data = {"items": [1, 1, -1, 1, -1]}
+
+        errors = validator.validate(data, {"items.*": [positive]})
+
+        self.assertEqual(self.calls, [1, -1])
+        self.assertEqual(
+            errors, {"items.2": ["not positive"], "items.4": ["not positive"]}
+        )
+
+    def test_pure_function_expect_message_replayed_for_each_field(self):
+        @rule(pure=True)
+        def positive(value, **_):
+            self.calls.append(value)
+            if value <= 0:
+                return "The {field} field must be positive."
+
+        validator = Validator(cache_size=100)
+
+        errors = validator.validate(
+            {"a": -1, "b": -1}, {"a": [positive], "b": [positive]}
+        )
+
+        self.assertEqual(
+            errors,
+            {
+                "a": ["The a field must be positive."],
+                "b": ["The b field must be positive."],
+            },
+        )
+        self.assertEqual(validator.cache_info().hits, 1)
+        self.assertEqual(self.calls, [-1])
+
+    def test_function_without_pure_expect_not_memoized(self):
+        def positive(value, **_):
+            self.calls.append(value)
+
+        validator = Validator(cache_size=100)
+
+        validator.validate({"items": [1, 1, 1]}, {"items.*": [positive]})
+
+        self.assertEqual(self.calls, [1, 1, 1])
+
+    def test_cost_expect_cheaper_rules_evaluated_first(self):
+        @rule(cost=10)
+        def expensive(value, **_):
+            self.calls.append(value)
+
+        rules = {"test": [expensive, "date_time"]}
+
+        errors = self.validator.validate({"test": "invalid"}, rules)
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(
+            errors,
+            {
+                "test": [
+                    DATE_TIME_ERROR.format(field="test", format="%Y-%m-%d %H:%M:%S")
+                ]
+            },
+        )
+
+    def test_cost_expect_rules_with_same_cost_keep_order(self):
+        @rule(cost=-1)
+        def cheap(**_):
+            return "cheap"
+
+        rules = {"test": ["required", "string", cheap]}
+
+        errors = self.validator.validate({"test": 1}, rules)
+
+        self.assertEqual(errors, {"test": ["cheap", STRING_ERROR.format(field="test")]})
+
+    def test_cost_in_compiled_function_expect_same_order(self):
+        @rule(cost=10)
+        def expensive(value, **_):
+            self.calls.append(value)
+
+        rules = {"test": [expensive, "date_time"]}
+        validate = self.validator.compile(rules)
+
+        self.assertEqual(
+            validate({"test": "invalid"}),
+            self.validator.validate({"test": "invalid"}, rules),
+        )
+        self.assertEqual(self.calls, [])
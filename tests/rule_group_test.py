@@ -0,0 +1,102 @@
+from unittest import mock
+
+from src.spotlight import when
+from src.spotlight.errors import REQUIRED_ERROR, INTEGER_ERROR
+from src.spotlight.schema import Schema
+from src.spotlight.validator import Validator
+from .validator_test import ValidatorTest
+
+
+class RuleGroupTest(ValidatorTest):
+    def setUp(self):
+        self.rules = {
+            "delivery_type": "required|in:ship,pickup",
+            "shipping": when(
+                "delivery_type",
+                "ship",
+                {
+                    "address": "required",
+                    "lines.*.quantity": "required|integer",
+                },
+            ),
+        }
+        self.data = {
+            "delivery_type": "ship",
+            "shipping": {"lines": [{"quantity": 1}, {"quantity": "a"}]},
+        }
+        self.address_error = REQUIRED_ERROR.format(field="shipping.address")
+        self.quantity_error = INTEGER_ERROR.format(field="shipping.lines.1.quantity")
+
+    def test_group_with_condition_that_holds_expect_errors(self):
+        errors = self.validator.validate(self.data, self.rules)
+
+        self.assertEqual(
+            errors,
+            {
+                "shipping.address": [self.address_error],
+                "shipping.lines.1.quantity": [self.quantity_error],
+            },
+        )
+
+    def test_group_with_condition_that_does_not_hold_expect_no_errors(self):
+        self.data["delivery_type"] = "pickup"
+
+        errors = self.validator.validate(self.data, self.rules)
+
+        self.assertEqual(errors, {})
+
+    def test_group_with_condition_that_does_not_hold_expect_no_expansion(self):
+        validator = Validator()
+        self.data["delivery_type"] = "pickup"
+
+        with mock.patch.object(
+            validator, "_sub_items", wraps=validator._sub_items
+        ) as sub_fields:
+            validator.validate(self.data, self.rules)
+
+        self.assertEqual(
+            [c[0][0] for c in sub_fields.call_args_list], ["delivery_type"]
+        )
+
+    def test_nested_groups_expect_errors_when_both_conditions_hold(self):
+        rules = {
+            "invoice": when(
+                "type",
+                "business",
+                {"vat": when("country", "NL", {"number": "required"})},
+            )
+        }
+        field = "invoice.vat.number"
+        error = REQUIRED_ERROR.format(field=field)
+
+        errors = self.validator.validate({"type": "business", "country": "NL"}, rules)
+        no_errors = self.validator.validate(
+            {"type": "business", "country": "US"}, rules
+        )
+
+        self.assertEqual(errors, {field: [error]})
+        self.assertEqual(no_errors, {})
+
+    def test_group_in_schema_expect_errors(self):
+        errors = self.validator.validate(self.data, Schema(self.rules))
+
+        self.assertEqual(len(errors), 2)
+
+    def test_group_in_compiled_rules_expect_same_errors(self):
+        validate = self.validator.compile(self.rules)
+
+        self.assertEqual(
+            validate(self.data), self.validator.validate(self.data, self.rules)
+        )
+
+    def test_revalidate_after_condition_change_expect_group_validated(self):
+        self.data["delivery_type"] = "pickup"
+        previous = self.validator.validate(self.data, self.rules)
+        self.data["delivery_type"] = "ship"
+
+        errors = self.validator.revalidate(
+            self.data, self.rules, previous, changed=["delivery_type"]
+        )
+
+        self.assertEqual(errors, self.validator.validate(self.data, self.rules))
+        self.assertEqual(len(errors), 2)
@@ -0,0 +1,174 @@
+from decimal import Decimal
+from typing import ClassVar, Dict, List, Optional
+
+import pytest
+
+from src.spotlight.errors import (
+    REQUIRED_ERROR,
+    REQUIRED_WITH_ERROR,
+    STRING_ERROR,
+    INTEGER_ERROR,
+    EMAIL_ERROR,
+    LIST_ERROR,
+)
+from src.spotlight.schema import Schema
+from .validator_test import ValidatorTest
+
+try:
+    from dataclasses import dataclass, field
+except ImportError:  # Python 3.6
+    dataclass = None
+
+requires_dataclasses = pytest.mark.skipif(
+    dataclass is None, reason="dataclasses require Python 3.7"
+)
+
+if dataclass is not None:
+
+    @dataclass
+    class Address:
+        street: str
+        number: int
+
+    @dataclass
+    class User:
+        email: str = field(metadata={"rules": "email|max:255"})
+        age: Optional[int]
+        tags: List[str]
+        addresses: List[Address]
+        settings: Dict[str, str]
+        balance: Decimal
+        manager: Optional["User"] = None
+
+    @dataclass
+    class Order:
+        address: Optional[Address] = None
+
+
+class Point:
+    __slots__ = ("x", "y")
+
+    x: int
+    y: int
+    origin: ClassVar[tuple] = (0, 0)
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class SchemaTest(ValidatorTest):
+    def test_schema_with_rules_dict_expect_parsed_rules(self):
+        schema = Schema(
+            {
+                "email": "required|email",
+                "password": ["required", "min:8", ("max", ["255"])],
+                "code": "regex:^[a-z,]+$",
+            }
+        )
+        expected = {
+            "email": [("required", []), ("email", [])],
+            "password": [("required", []), ("min", ["8"]), ("max", ["255"])],
+            "code": [("regex", ["^[a-z,]+$"])],
+        }
+
+        self.assertEqual(schema, expected)
+
+    def test_schema_with_invalid_data_expect_same_errors_as_rules_dict(self):
+        rules = {
+            "email": "required|email",
+            "list.*.name": ["required", "string"],
+            "code": "regex:^[a-z]+$",
+        }
+        data = {"email": "test", "list": [{"name": 1}, {}], "code": "1"}
+
+        expected = self.validator.validate(data, rules)
+        errors = self.validator.validate(data, Schema(rules))
+
+        self.assertEqual(errors, expected)
+
+    @requires_dataclasses
+    def test_schema_from_dataclass_expect_rules_from_type_hints(self):
+        schema = Schema.from_class(User)
+
+        self.assertEqual(
+            schema["email"],
+            [("required", []), ("string", []), ("email", []), ("max", ["255"])],
+        )
+        self.assertEqual(schema["age"], [("integer", [])])
+        self.assertEqual(schema["tags"], [("list", [])])
+        self.assertEqual(schema["tags.*"], [("string", [])])
+        self.assertEqual(
+            schema["addresses.*.street"], [("required", []), ("string", [])]
+        )
+        self.assertEqual(schema["settings"], [("dict", [])])
+        self.assertEqual(schema["balance"], [("required", []), ("decimal", [])])
+        self.assertEqual(schema["manager"], [])
+        self.assertNotIn("manager.email", schema)
+
+    @requires_dataclasses
+    def test_schema_from_dataclass_expect_cached_schema(self):
+        self.assertIs(Schema.from_class(User), Schema.from_class(User))
+
+    @requires_dataclasses
+    def test_schema_from_dataclass_with_invalid_data_expect_errors(self):
+        user = User(
+            email="test",
+            age="1",
+            tags=["a", 1],
+            addresses=[Address(street=None, number=1)],
+            settings={},
+            balance=Decimal("1.00"),
+        )
+        expected = {
+            "email": [EMAIL_ERROR.format(field="email")],
+            "age": [INTEGER_ERROR.format(field="age")],
+            "tags.1": [STRING_ERROR.format(field="tags.1")],
+            "addresses.0.street": [REQUIRED_ERROR.format(field="addresses.0.street")],
+        }
+
+        errors = self.validator.validate(user, Schema.from_class(User))
+
+        self.assertEqual(errors, expected)
+
+    @requires_dataclasses
+    def test_schema_from_dataclass_with_invalid_list_expect_error(self):
+        user = User(
+            email="john.doe@example.com",
+            age=None,
+            tags="a",
+            addresses=[],
+            settings={},
+            balance=Decimal("1.00"),
+        )
+        expected = {"tags": [LIST_ERROR.format(field="tags")]}
+
+        errors = self.validator.validate(user, Schema.from_class(User))
+
+        self.assertEqual(errors, expected)
+
+    @requires_dataclasses
+    def test_schema_from_dataclass_with_optional_class_expect_fields_required_with(
+        self,
+    ):
+        schema = Schema.from_class(Order)
+        field = "address.street"
+        expected = {field: [REQUIRED_WITH_ERROR.format(field=field, other="address")]}
+
+        self.assertEqual(
+            schema[field], [("required_with", ["address"]), ("string", [])]
+        )
+        self.assertEqual(self.validator.validate(Order(), schema), {})
+        self.assertEqual(
+            self.validator.validate(Order(Address(street=None, number=1)), schema),
+            expected,
+        )
+
+    def test_schema_from_slots_class_expect_values_read_by_attribute(self):
+        schema = Schema.from_class(Point)
+        expected = {"y": [INTEGER_ERROR.format(field="y")]}
+
+        errors = self.validator.validate(Point(1, "2"), schema)
+
+        self.assertEqual(errors, expected)
+        self.assertNotIn("origin", schema)
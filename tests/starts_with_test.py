@@ -1,4 +1,8 @@
+from unittest import mock
+
 from src.spotlight.errors import STARTS_WITH_ERROR
+from src.spotlight.parameters import PrefixParameters
+from src.spotlight.rules import StartsWithRule
 from .validator_test import ValidatorTest
 
 
@@ -38,3 +42,44 @@ class StartsWithTest(ValidatorTest):
         errs = errors.get(self.field)
 
         self.assertEqual(errs, expected)
+
+    def test_starts_with_rule_with_many_values_expect_no_error(self):
+        prefixes = [f"/api/v{i}/" for i in range(200)]
+        data = {"test": "/api/v150/users"}
+        rules = {"test": [("starts_with", prefixes)]}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(errors, {})
+
+    def test_starts_with_rule_with_many_values_expect_error(self):
+        prefixes = [f"/api/v{i}/" for i in range(200)]
+        data = {"test": "/api/v200/users"}
+        rules = {"test": [("starts_with", prefixes)]}
+
+        errors = self.validator.validate(data, rules)
+
+        self.assertEqual(len(errors.get(self.field)), 1)
+
+    def test_matched_prefix_expect_longest_matching_prefix(self):
+        few = ["/api/", "/api/v1/", "/static/"]
+        many = few + [f"/other/{i}/" for i in range(100)]
+
+        for prefixes in [few, many]:
+            self.assertEqual(
+                StartsWithRule.matched_prefix("/api/v1/users", prefixes), "/api/v1/"
+            )
+            self.assertEqual(
+                StartsWithRule.matched_prefix("/api/v2/users", prefixes), "/api/"
+            )
+            self.assertIsNone(StartsWithRule.matched_prefix("/admin", prefixes))
+
+    def test_starts_with_rule_expect_matcher_built_when_rules_resolved(self):
+        rules = {"test": "starts_with:val0,val1,val2"}
+        self.validator.validate({"test": "val1"}, rules)
+
+        with mock.patch.object(PrefixParameters, "prepare") as matcher:
+            errors = self.validator.validate({"test": "val3"}, rules)
+
+        matcher.assert_not_called()
+        self.assertEqual(errors, {self.field: [self.in_error]})
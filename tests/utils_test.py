@@ -1,6 +1,13 @@
 from datetime import date, datetime
 
-from src.spotlight.utils import get_comparable_dates
+from decimal import Decimal
+
+from src.spotlight.utils import (
+    get_comparable_dates,
+    LazyPattern,
+    is_decimal,
+    is_date,
+)
 
 
 def test_get_comparable_dates():
@@ -13,3 +20,24 @@ def test_get_comparable_dates():
     assert isinstance(date3, date) and isinstance(date4, date)
     assert isinstance(date5, date) and isinstance(date6, date)
     assert isinstance(date7, date) and isinstance(date8, date)
+
+
+def test_lazy_pattern():
+    pattern = LazyPattern(r"^[a-z]+$")
+
+    assert pattern._compiled is None
+    assert pattern.fullmatch("abc") is not None
+    assert pattern.fullmatch("ABC") is None
+    assert pattern.compiled is pattern._compiled
+
+
+def test_is_decimal():
+    assert is_decimal(Decimal("1.5"))
+    assert not is_decimal(1.5)
+    assert not is_decimal("1.5")
+
+
+def test_is_date():
+    assert is_date(date.today())
+    assert is_date(datetime.utcnow())
+    assert not is_date("2020-01-01")
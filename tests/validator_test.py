@@ -1,6 +1,9 @@
 import unittest
 from unittest import mock
 
+from src.spotlight import rules as rls
+from src.spotlight.rules import Rule
+from src.spotlight.schema import Schema
 from src.spotlight.validator import Validator
 
 
@@ -18,6 +21,91 @@ class ValidatorPluginTest(unittest.TestCase):
         m.assert_called()
 
 
+class ValidatorRuleRegistryTest(unittest.TestCase):
+    def test_validators_expect_shared_default_rules(self):
+        validator1 = Validator()
+        validator2 = Validator()
+
+        self.assertIs(validator1._available_rules, validator2._available_rules)
+        self.assertIs(
+            validator1._available_rules["required"],
+            validator2._available_rules["required"],
+        )
+
+    def test_register_rule_expect_rule_only_registered_for_validator(self):
+        class PluginRule(Rule):
+            name = "registry_test_rule"
+
+            def passes(self, field, value, parameters, validator) -> bool:
+                return True
+
+            @property
+            def message(self) -> str:
+                return "Hello World!"
+
+        validator1 = Validator()
+        validator2 = Validator()
+        validator1.register_rule(PluginRule())
+
+        self.assertIn("registry_test_rule", validator1._available_rules)
+        self.assertNotIn("registry_test_rule", validator2._available_rules)
+        self.assertNotIn("registry_test_rule", Validator()._available_rules)
+        self.assertIs(
+            validator1._available_rules["required"],
+            validator2._available_rules["required"],
+        )
+
+    def test_shared_default_rules_expect_read_only(self):
+        with self.assertRaises(TypeError):
+            Validator()._available_rules["required"] = None
+
+
+class ValidatorRuleResolutionTest(unittest.TestCase):
+    def test_default_rules_expect_no_instance_dict(self):
+        for rule in Validator()._available_rules.values():
+            self.assertFalse(hasattr(rule, "__dict__"), rule.name)
+
+    def test_schema_with_function_rule_expect_function_wrapped_once(self):
+        validator = Validator()
+        schema = Schema({"test": ["required", lambda field, value, validator: None]})
+
+        with mock.patch.object(
+            rls, "_FunctionRule", wraps=rls._FunctionRule
+        ) as function_rule:
+            validator.validate({"test": 1}, schema)
+            validator.validate({"test": 2}, schema)
+
+        self.assertEqual(function_rule.call_count, 1)
+
+    def test_string_rules_expect_resolved_once(self):
+        validator = Validator()
+
+        with mock.patch.object(
+            validator, "rule_iterator", wraps=validator.rule_iterator
+        ) as rule_iterator:
+            validator.validate({"test": 1}, {"test": "required|integer"})
+            validator.validate({"test": "a"}, {"test": "required|integer"})
+
+        self.assertEqual(rule_iterator.call_count, 1)
+
+    def test_register_rule_expect_resolved_rules_cleared(self):
+        class ResolutionTestRule(Rule):
+            name = "resolution_test_rule"
+
+            def passes(self, field, value, parameters, validator) -> bool:
+                return True
+
+            @property
+            def message(self) -> str:
+                return "Hello World!"
+
+        validator = Validator()
+        validator.validate({"test": 1}, {"test": "required"})
+        validator.register_rule(ResolutionTestRule())
+
+        self.assertEqual(validator._resolved_rules, {})
+
+
 class DirectValidationMethodsTest(ValidatorTest):
     def test_direct_validation_methods_are_present(self):
         methods = [attr for attr in dir(Validator) if attr.startswith("valid_")]